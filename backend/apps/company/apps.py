@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CompanyConfig(AppConfig):
     name = 'apps.company'
     verbose_name = 'Gestión de la Compañía'
+
+    def ready(self):
+        import apps.company.signals # noqa
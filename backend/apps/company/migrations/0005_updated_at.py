@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0004_clientlogo_created_at_service_created_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aboutus',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización'),
+        ),
+        migrations.AddField(
+            model_name='clientlogo',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización'),
+        ),
+        migrations.AddField(
+            model_name='companyinfo',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+# Mismos valores por defecto que apps/company/singletons.py: con las filas ya
+# creadas, la primera petición no paga el INSERT de get_or_create().
+SINGLETONS = {
+    'CompanyInfo': {'email': ''},
+    'AboutUs': {'description': ''},
+}
+
+
+def create_singletons(apps, schema_editor):
+    for model_name, defaults in SINGLETONS.items():
+        model = apps.get_model('company', model_name)
+        if not model.objects.using(schema_editor.connection.alias).exists():
+            model.objects.using(schema_editor.connection.alias).create(**defaults)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0005_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_singletons, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0006_create_singletons'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aboutus',
+            name='renditions_ready',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Renditions Generadas'),
+        ),
+        migrations.AddField(
+            model_name='clientlogo',
+            name='renditions_ready',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Renditions Generadas'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='renditions_ready',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Renditions Generadas'),
+        ),
+    ]
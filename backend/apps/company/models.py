@@ -9,7 +9,9 @@ class ClientLogo(models.Model):
         verbose_name='Logo',
         validators=[validate_image_size, FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'webp'])],
     )
+    renditions_ready = models.BooleanField(default=False, editable=False, verbose_name='Renditions Generadas')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')
 
     class Meta:
         db_table = 'client_logos'
@@ -29,7 +31,9 @@ class Service(models.Model):
         null=True,
         validators=[validate_image_size, FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'webp'])],
     )
+    renditions_ready = models.BooleanField(default=False, editable=False, verbose_name='Renditions Generadas')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')
 
     class Meta:
         db_table = 'services'
@@ -66,6 +70,7 @@ class CompanyInfo(models.Model):
     linkedin = models.URLField(blank=True, default='', verbose_name='LinkedIn')
     tiktok = models.URLField(blank=True, default='', verbose_name='TikTok')
     whatsapp = models.URLField(blank=True, default='', help_text='Número para link de WA', verbose_name='WhatsApp')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')
     class Meta:
         db_table = 'company_info'
         verbose_name = 'Información de Empresa'
@@ -85,6 +90,8 @@ class AboutUs(models.Model):
         verbose_name='Imagen Principal',
         validators=[validate_image_size, FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'webp'])],
     )
+    renditions_ready = models.BooleanField(default=False, editable=False, verbose_name='Renditions Generadas')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')
 
     class Meta:
         db_table = 'about_us'
@@ -1,15 +1,24 @@
 from rest_framework import serializers
+
+from core.renditions import RenditionsField
+from core.sparse import SparseFieldsSerializerMixin
 from .models import ClientLogo, Service, CompanyInfo, AboutUs
 
-class ClientLogoSerializer(serializers.ModelSerializer):
+class ClientLogoSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    image_renditions = RenditionsField(source='image')
+
     class Meta:
         model = ClientLogo
         fields = '__all__'
+        sparse_sources = {'image_renditions': ['image', 'renditions_ready']}
+
+class ServiceSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    image_renditions = RenditionsField(source='image')
 
-class ServiceSerializer(serializers.ModelSerializer):
     class Meta:
         model = Service
         fields = '__all__'
+        sparse_sources = {'image_renditions': ['image', 'renditions_ready']}
 
 class CompanyInfoSerializer(serializers.ModelSerializer):
     class Meta:
@@ -17,6 +26,8 @@ class CompanyInfoSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class AboutUsSerializer(serializers.ModelSerializer):
+    image_renditions = RenditionsField(source='image')
+
     class Meta:
         model = AboutUs
         fields = '__all__'
\ No newline at end of file
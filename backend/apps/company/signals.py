@@ -0,0 +1,65 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.jobs.queue import enqueue
+from apps.projects.tasks import create_renditions, remove_renditions
+from core.renditions import renditions_created
+from core.response_cache import invalidate_responses
+from .models import AboutUs, ClientLogo, CompanyInfo, Service
+
+IMAGE_MODELS = (ClientLogo, Service, AboutUs)
+
+RESPONSE_CACHE_GROUPS = {
+    ClientLogo: 'clients',
+    Service: 'services',
+    CompanyInfo: 'company-info',
+    AboutUs: 'about-us',
+}
+
+
+def create_image_renditions(sender, instance, **kwargs):
+    if instance.image:
+        enqueue(create_renditions, instance.image.name)
+
+
+def delete_image_renditions(sender, instance, **kwargs):
+    if instance.image:
+        enqueue(remove_renditions, instance.image.name)
+
+
+def delete_old_renditions_on_update(sender, instance, **kwargs):
+    if not instance.pk:
+        return False
+    try:
+        old_image = sender.objects.get(pk=instance.pk).image
+    except sender.DoesNotExist:
+        return False
+
+    if old_image and not old_image == instance.image:
+        instance.renditions_ready = False
+        enqueue(remove_renditions, old_image.name)
+
+
+def invalidate_cached_responses(sender, **kwargs):
+    invalidate_responses(RESPONSE_CACHE_GROUPS[sender])
+
+
+@receiver(renditions_created)
+def mark_renditions_ready(sender, name, **kwargs):
+    for model in IMAGE_MODELS:
+        marked = model.objects.filter(image=name, renditions_ready=False).update(
+            renditions_ready=True, updated_at=timezone.now()
+        )
+        if marked:
+            invalidate_responses(RESPONSE_CACHE_GROUPS[model])
+
+
+for model in IMAGE_MODELS:
+    receiver(post_save, sender=model)(create_image_renditions)
+    receiver(post_delete, sender=model)(delete_image_renditions)
+    receiver(pre_save, sender=model)(delete_old_renditions_on_update)
+
+for model in RESPONSE_CACHE_GROUPS:
+    receiver(post_save, sender=model)(invalidate_cached_responses)
+    receiver(post_delete, sender=model)(invalidate_cached_responses)
@@ -0,0 +1,44 @@
+import copy
+import threading
+
+from core.response_cache import get_versions, is_shared_cache
+
+from .models import AboutUs, CompanyInfo
+
+# Las señales de company ya cambian la versión de estos grupos en la caché
+# compartida al guardar o borrar, tanto desde la API como desde el admin.
+SINGLETONS = {
+    CompanyInfo: ('company-info', {'email': ''}),
+    AboutUs: ('about-us', {'description': ''}),
+}
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def get_singleton(model):
+    """
+    Devuelve la fila única de ``model`` memorizada en el proceso. Solo se
+    consulta la base de datos cuando cambió la versión del grupo, así que en
+    el camino habitual no hay consultas SQL. Si la caché no es compartida
+    entre procesos se lee siempre de la base de datos: un worker no vería la
+    versión nueva que guardó otro.
+    """
+    group, defaults = SINGLETONS[model]
+    if not is_shared_cache():
+        return model.objects.get_or_create(defaults=defaults)[0]
+
+    # La versión se lee antes de cargar la fila: si alguien guarda en medio,
+    # la siguiente petición verá una versión nueva y recargará.
+    version = get_versions([group])[0]
+
+    cached = _loaded.get(model)
+    if cached is None or cached[0] != version:
+        with _lock:
+            cached = _loaded.get(model)
+            if cached is None or cached[0] != version:
+                obj, created = model.objects.get_or_create(defaults=defaults)
+                cached = _loaded[model] = (version, obj)
+
+    # Copia para que un update fallido no deje la instancia compartida modificada.
+    return copy.copy(cached[1])
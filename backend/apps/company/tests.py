@@ -0,0 +1,122 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from apps.projects.models import Category, Project, ProjectImage
+from core.response_cache import get_cache
+from core.testing import TemporaryMediaMixin, api_client, create_admin, png_file
+
+from .models import ClientLogo, CompanyInfo, Service
+from .singletons import _loaded, get_singleton
+
+
+# Sin caché de respuestas: se mide siempre el camino que llega a la base de datos.
+@override_settings(QUERY_BUDGET_ENFORCE=True, CACHE_SINGLE_PROCESS=False)
+class CompanyApiTests(TemporaryMediaMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.clients = [
+            ClientLogo.objects.create(name=f'Cliente {index}', image=png_file('logo.png'))
+            for index in range(4)
+        ]
+        cls.services = [
+            Service.objects.create(
+                name=f'Servicio {index}', description='Diseño y construcción.', image=png_file('servicio.png'),
+            )
+            for index in range(4)
+        ]
+        category = Category.objects.create(name='Vivienda')
+        cls.projects = []
+        for index in range(3):
+            project = Project.objects.create(
+                name=f'Edificio {index}', category=category, location='Arequipa',
+                description='Concreto armado.', year=2022, is_featured=index < 2,
+            )
+            ProjectImage.objects.create(project=project, image=png_file('foto.png'))
+            cls.projects.append(project)
+
+    def setUp(self):
+        self.client = api_client()
+
+    def test_clients_list(self):
+        response = self.client.get('/api/company/clients/', {'search': 'cliente 2'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([client['name'] for client in response.data['results']], ['Cliente 2'])
+
+    def test_clients_retrieve(self):
+        client = self.clients[0]
+        response = self.client.get(f'/api/company/clients/{client.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], client.name)
+        self.assertTrue(response.data['image'].endswith(client.image.name))
+
+    def test_services_list(self):
+        response = self.client.get('/api/company/services/', {'search': 'construcción'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [service['name'] for service in response.data['results']],
+            [service.name for service in reversed(self.services)],
+        )
+
+    def test_services_retrieve(self):
+        service = self.services[0]
+        response = self.client.get(f'/api/company/services/{service.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], service.name)
+        self.assertEqual(response.data['description'], service.description)
+
+    def test_bootstrap(self):
+        response = self.client.get('/api/bootstrap/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [project['slug'] for project in response.data['featured_projects']],
+            [project.slug for project in reversed(self.projects[:2])],
+        )
+        self.assertEqual(len(response.data['services']), 4)
+        self.assertEqual([category['name'] for category in response.data['categories']], ['Vivienda'])
+        self.assertEqual(response.data['stats'], {'projects': 3, 'clients': 4})
+        self.assertEqual(response.data['company_info']['email'], '')
+
+
+class CompanySingletonTests(TestCase):
+
+    def setUp(self):
+        get_cache().clear()
+        _loaded.clear()
+        self.addCleanup(_loaded.clear)
+
+    @override_settings(CACHE_SINGLE_PROCESS=False)
+    def test_retrieve_resolves_the_singleton_once(self):
+        CompanyInfo.objects.filter(pk=get_singleton(CompanyInfo).pk).update(email='obras@briorsal.pe')
+
+        with mock.patch('apps.company.views.get_singleton', wraps=get_singleton) as resolve:
+            with self.assertNumQueries(1):
+                response = api_client().get('/api/company/info/')
+
+        self.assertEqual(response.data['email'], 'obras@briorsal.pe')
+        self.assertIn('ETag', response)
+        self.assertEqual(resolve.call_count, 1)
+
+    @override_settings(CACHE_SINGLE_PROCESS=True)
+    def test_admin_save_invalidates_the_process_memo(self):
+        info = get_singleton(CompanyInfo)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_singleton(CompanyInfo).email, '')
+
+        self.client.force_login(create_admin())
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/admin/company/companyinfo/{info.pk}/change/', {
+                'phone': '054 123456', 'email': 'obras@briorsal.pe', 'address': 'Arequipa',
+                'google_maps_url': '', 'opening_hours': '',
+                'facebook': '', 'instagram': '', 'linkedin': '', 'tiktok': '', 'whatsapp': '',
+            })
+        self.assertEqual(response.status_code, 302)
+
+        self.assertEqual(get_singleton(CompanyInfo).email, 'obras@briorsal.pe')
+        self.assertEqual(api_client().get('/api/company/info/').data['email'], 'obras@briorsal.pe')
@@ -1,5 +1,16 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, permissions, viewsets
+from rest_framework.response import Response
+
+from apps.projects.models import Category, Project
+from apps.projects.serializers import CategorySerializer, ProjectListSerializer
+
+from core.conditional import ConditionalGetMixin
+from core.query_budget import QueryBudgetMixin
+from core.response_cache import ResponseCacheMixin
+from core.sparse import SparseQuerysetMixin
+from core.streaming import StreamingListMixin
+
 from .models import AboutUs, ClientLogo, CompanyInfo, Service
 from .serializers import (
     AboutUsSerializer,
@@ -7,11 +18,15 @@ from .serializers import (
     CompanyInfoSerializer,
     ServiceSerializer,
 )
+from .singletons import get_singleton
 
-class ClientLogoViewSet(viewsets.ModelViewSet):
+class ClientLogoViewSet(QueryBudgetMixin, ResponseCacheMixin, ConditionalGetMixin, SparseQuerysetMixin, StreamingListMixin, viewsets.ModelViewSet):
     queryset = ClientLogo.objects.all().order_by('-created_at')
     serializer_class = ClientLogoSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_groups = ('clients',)
+    query_budget = {'list': 4, 'retrieve': 3}
+    cursor_ordering = ('-created_at', 'id')
 
     filter_backends = [
         DjangoFilterBackend,
@@ -21,10 +36,13 @@ class ClientLogoViewSet(viewsets.ModelViewSet):
     filterset_fields = ['name']
     search_fields = ['name']
 
-class ServiceViewSet(viewsets.ModelViewSet):
+class ServiceViewSet(QueryBudgetMixin, ResponseCacheMixin, ConditionalGetMixin, SparseQuerysetMixin, StreamingListMixin, viewsets.ModelViewSet):
     queryset = Service.objects.all().order_by('-created_at')
     serializer_class = ServiceSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_groups = ('services',)
+    query_budget = {'list': 4, 'retrieve': 3}
+    cursor_ordering = ('-created_at', 'id')
 
     filter_backends = [
         DjangoFilterBackend,
@@ -34,21 +52,30 @@ class ServiceViewSet(viewsets.ModelViewSet):
     filterset_fields = ['name']
     search_fields = ['name', 'description']
 
-class CompanyInfoView(generics.RetrieveUpdateAPIView):
-    serializer_class = CompanyInfoSerializer
-    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+class SingletonViewMixin:
+    singleton_model = None
 
     def get_object(self):
-        obj, created = CompanyInfo.objects.get_or_create(defaults={'email': ''})
-        return obj
+        # get_conditional_state y retrieve lo piden en la misma petición: la
+        # fila se resuelve una vez por vista.
+        if getattr(self, '_singleton', None) is None:
+            self._singleton = get_singleton(self.singleton_model)
+        return self._singleton
 
-class AboutUsView(generics.RetrieveUpdateAPIView):
-    serializer_class = AboutUsSerializer
+    def get_conditional_state(self):
+        return self.get_object().updated_at, 1
+
+class CompanyInfoView(SingletonViewMixin, ResponseCacheMixin, ConditionalGetMixin, generics.RetrieveUpdateAPIView):
+    serializer_class = CompanyInfoSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_groups = ('company-info',)
+    singleton_model = CompanyInfo
 
-    def get_object(self):
-        obj, created = AboutUs.objects.get_or_create(defaults={'description': ''})
-        return obj
+class AboutUsView(SingletonViewMixin, ResponseCacheMixin, ConditionalGetMixin, generics.RetrieveUpdateAPIView):
+    serializer_class = AboutUsSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_groups = ('about-us',)
+    singleton_model = AboutUs
 
     def perform_update(self, serializer):
         delete_image = self.request.data.get('delete_image')
@@ -59,4 +86,35 @@ class AboutUsView(generics.RetrieveUpdateAPIView):
 
             serializer.save(image=None)
         else:
-            serializer.save()
\ No newline at end of file
+            serializer.save()
+
+class BootstrapView(QueryBudgetMixin, ResponseCacheMixin, generics.GenericAPIView):
+    """
+    Todo lo que necesita la página de inicio en una sola respuesta, cacheada
+    como una unidad e invalidada por cualquiera de sus modelos.
+    """
+    permission_classes = [permissions.AllowAny]
+    cache_groups = ('company-info', 'about-us', 'projects', 'services', 'clients')
+    query_budget = {'get': 7}
+    featured_limit = 7
+
+    def get(self, request, *args, **kwargs):
+        return self.cached_response(request, lambda: Response(self.get_payload()))
+
+    def get_payload(self):
+        context = self.get_serializer_context()
+        featured = Project.objects.for_list().filter(is_featured=True).order_by('-created_at')
+        clients = ClientLogoSerializer(ClientLogo.objects.order_by('-created_at'), many=True, context=context).data
+
+        return {
+            'company_info': CompanyInfoSerializer(get_singleton(CompanyInfo), context=context).data,
+            'about_us': AboutUsSerializer(get_singleton(AboutUs), context=context).data,
+            'featured_projects': ProjectListSerializer(featured[:self.featured_limit], many=True, context=context).data,
+            'services': ServiceSerializer(Service.objects.order_by('-created_at'), many=True, context=context).data,
+            'clients': clients,
+            'categories': CategorySerializer(Category.objects.order_by('name'), many=True, context=context).data,
+            'stats': {
+                'projects': Project.objects.count(),
+                'clients': len(clients),
+            },
+        }
@@ -1,5 +1,10 @@
 from django.contrib import admin
-from .models import ContactMessage
+from django.utils import timezone
+
+from core.pagination import EstimatedCountPaginator
+from .models import ArchivedContactMessage, ContactMessage, ContactNotification
+from .search import search_messages
+from .tasks import schedule_flush
 
 @admin.register(ContactMessage)
 class ContactMessageAdmin(admin.ModelAdmin):
@@ -10,6 +15,8 @@ class ContactMessageAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'first_name', 'last_name', 'email', 'phone', 'subject', 'message')
     list_per_page = 20
     ordering = ('-created_at',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     fieldsets = (
         ('Información del Remitente', {
@@ -25,6 +32,13 @@ class ContactMessageAdmin(admin.ModelAdmin):
 
     actions = ['mark_as_read', 'mark_as_unread']
 
+    def get_search_results(self, request, queryset, search_term):
+        # Mismo índice que la búsqueda de la bandeja en la API.
+        results = search_messages(queryset, [search_term]) if search_term else None
+        if results is None:
+            return super().get_search_results(request, queryset, search_term)
+        return results, False
+
     @admin.display(description='Nombre Completo', ordering='first_name')
     def full_name(self, obj):
         return f"{obj.first_name} {obj.last_name}"
@@ -37,4 +51,44 @@ class ContactMessageAdmin(admin.ModelAdmin):
     @admin.action(description='Marcar seleccionados como NO LEÍDOS')
     def mark_as_unread(self, request, queryset):
         updated = queryset.update(is_read=False)
-        self.message_user(request, f'{updated} mensajes marcados como no leídos.')
\ No newline at end of file
+        self.message_user(request, f'{updated} mensajes marcados como no leídos.')
+
+@admin.register(ArchivedContactMessage)
+class ArchivedContactMessageAdmin(admin.ModelAdmin):
+    list_display = ('full_name', 'email', 'subject', 'created_at', 'archived_at')
+    list_display_links = ('full_name', 'subject')
+    search_fields = ('first_name', 'last_name', 'email', 'subject', 'message')
+    readonly_fields = ('id', 'first_name', 'last_name', 'email', 'phone', 'subject', 'message', 'created_at', 'archived_at')
+    list_per_page = 20
+    ordering = ('-created_at',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.display(description='Nombre Completo', ordering='first_name')
+    def full_name(self, obj):
+        return f"{obj.first_name} {obj.last_name}"
+
+
+@admin.register(ContactNotification)
+class ContactNotificationAdmin(admin.ModelAdmin):
+    list_display = ('message', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    list_filter = ('status',)
+    list_select_related = ('message',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    readonly_fields = ('message', 'attempts', 'claimed_by', 'claimed_at', 'sent_at', 'last_error', 'created_at')
+    ordering = ('-created_at',)
+
+    actions = ['retry_notifications']
+
+    @admin.action(description='Reintentar avisos seleccionados')
+    def retry_notifications(self, request, queryset):
+        updated = queryset.exclude(status=ContactNotification.STATUS_SENDING).exclude(
+            status=ContactNotification.STATUS_SENT
+        ).update(status=ContactNotification.STATUS_PENDING, attempts=0, next_attempt_at=timezone.now(), last_error='')
+        if updated:
+            schedule_flush()
+        self.message_user(request, f'{updated} avisos devueltos a la cola.')
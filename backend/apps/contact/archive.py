@@ -0,0 +1,27 @@
+from django.db import transaction
+
+from .models import ArchivedContactMessage, ContactMessage, ContactNotification
+
+ARCHIVED_FIELDS = ['id', 'first_name', 'last_name', 'email', 'phone', 'subject', 'message', 'created_at']
+
+
+def archivable_messages(cutoff):
+    """Mensajes leídos anteriores a ``cutoff`` sin avisos por correo en curso."""
+    return ContactMessage.objects.filter(is_read=True, created_at__lt=cutoff).exclude(
+        notifications__status__in=[ContactNotification.STATUS_PENDING, ContactNotification.STATUS_SENDING]
+    )
+
+
+def archive_batch(cutoff, batch_size):
+    """
+    Copia hasta ``batch_size`` mensajes a la tabla de archivo y los borra de
+    la principal en una sola transacción. Devuelve cuántos movió.
+    """
+    with transaction.atomic():
+        rows = list(archivable_messages(cutoff).order_by('id').values(*ARCHIVED_FIELDS)[:batch_size])
+        if not rows:
+            return 0
+
+        ArchivedContactMessage.objects.bulk_create([ArchivedContactMessage(**row) for row in rows])
+        ContactMessage.objects.filter(pk__in=[row['id'] for row in rows]).delete()
+        return len(rows)
@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.contact.archive import archivable_messages, archive_batch
+
+
+class Command(BaseCommand):
+    help = (
+        'Mueve los mensajes de contacto leídos más antiguos que --older-than días a la '
+        'tabla de archivo, por lotes, para que la bandeja principal siga siendo pequeña.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than', type=int, required=True, help='Antigüedad mínima en días.')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help='Solo cuenta los mensajes que se moverían.')
+
+    def handle(self, *args, **options):
+        if options['older_than'] < 1 or options['batch_size'] < 1:
+            raise CommandError('--older-than y --batch-size deben ser mayores que cero.')
+
+        cutoff = timezone.now() - timedelta(days=options['older_than'])
+
+        if options['dry_run']:
+            total = archivable_messages(cutoff).count()
+            self.stdout.write(f'Se archivarían {total} mensajes anteriores a {cutoff:%Y-%m-%d}.')
+            return
+
+        # Un lote por transacción: cada uno bloquea poco y un corte a la
+        # mitad deja archivados los lotes ya confirmados.
+        total = 0
+        while moved := archive_batch(cutoff, options['batch_size']):
+            total += moved
+            self.stdout.write(f'  {total} mensajes archivados...')
+
+        self.stdout.write(self.style.SUCCESS(f'{total} mensajes anteriores a {cutoff:%Y-%m-%d} archivados.'))
@@ -0,0 +1,101 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework import filters
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.contact.models import ContactMessage
+from apps.contact.search import ContactSearchFilter, search_backend
+from apps.contact.views import ContactMessageViewSet
+
+FIRST_NAMES = ['Juan', 'María', 'José', 'Rosa', 'Luis', 'Carmen', 'Jorge', 'Ana', 'Carlos', 'Lucía', 'Miguel', 'Sofía']
+LAST_NAMES = ['Pérez', 'García', 'Quispe', 'Rodríguez', 'Flores', 'Mamani', 'Torres', 'Chávez', 'Ramos', 'Díaz']
+DOMAINS = ['gmail.com', 'hotmail.com', 'outlook.com', 'empresa.pe', 'yahoo.es']
+SUBJECTS = ['Cotización', 'Remodelación de casa', 'Consulta Web', 'Construcción de edificio', 'Ampliación', '']
+WORDS = [
+    'hola', 'quisiera', 'cotizar', 'una', 'obra', 'vivienda', 'segundo', 'piso', 'terreno', 'metros',
+    'presupuesto', 'plazo', 'acabados', 'cocina', 'baño', 'fachada', 'techo', 'estructura', 'Lima', 'Arequipa',
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Compara la búsqueda de la bandeja de contacto con índice frente al SearchFilter con icontains.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[100000, 1000000])
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument(
+            '--terms', nargs='+',
+            default=['quispe', 'juan pérez', 'rosa.flores', 'empresa.pe', 'fachada techo', 'inexistente'],
+        )
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        if search_backend() is None:
+            self.stdout.write(self.style.WARNING(
+                'El motor actual no tiene índice de búsqueda; solo se medirá el SearchFilter.'
+            ))
+
+        random.seed(options['seed'])
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write('Datos de prueba descartados.')
+
+    def _run(self, options):
+        view = ContactMessageViewSet(action='list')
+        created = ContactMessage.objects.count()
+
+        for size in sorted(options['sizes']):
+            self._populate(created, size)
+            created = max(created, size)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{size} mensajes (primera página / conteo)'))
+            for term in options['terms']:
+                request = Request(APIRequestFactory().get('/api/contact/messages/', {'search': term}))
+                legacy = self._measure(filters.SearchFilter(), request, view, options['repeat'])
+                indexed = self._measure(ContactSearchFilter(), request, view, options['repeat'])
+                self.stdout.write(
+                    f'  {term!r:<16} icontains {legacy[0] * 1000:8.2f} / {legacy[1] * 1000:8.2f} ms   '
+                    f'índice {indexed[0] * 1000:8.2f} / {indexed[1] * 1000:8.2f} ms   '
+                    f'{indexed[2]} resultados'
+                )
+
+    def _populate(self, start, end, batch_size=10000):
+        for offset in range(start, end, batch_size):
+            messages = []
+            for _ in range(offset, min(offset + batch_size, end)):
+                first, last = random.choice(FIRST_NAMES), random.choice(LAST_NAMES)
+                messages.append(ContactMessage(
+                    first_name=first,
+                    last_name=last,
+                    email=f'{first}.{last}{random.randint(1, 999)}@{random.choice(DOMAINS)}'.lower(),
+                    subject=random.choice(SUBJECTS),
+                    message=' '.join(random.choices(WORDS, k=25)),
+                    is_read=random.random() < 0.7,
+                ))
+            ContactMessage.objects.bulk_create(messages)
+
+    def _measure(self, backend, request, view, repeat):
+        page, count = [], []
+        for _ in range(repeat):
+            queryset = backend.filter_queryset(request, ContactMessage.objects.order_by('-created_at'), view)
+
+            started = time.perf_counter()
+            list(queryset[:10])
+            page.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            total = queryset.count()
+            count.append(time.perf_counter() - started)
+        return statistics.median(page), statistics.median(count), total
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from apps.contact.outbox import flush_outbox
+
+
+class Command(BaseCommand):
+    help = 'Envía los avisos de contacto pendientes sin esperar al worker.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument(
+            '--digest-size', type=int, default=None,
+            help='Leads por correo; con 1 se envía uno por mensaje aunque el digest esté activo.',
+        )
+
+    def handle(self, *args, **options):
+        sent, failed, next_flush = flush_outbox(options['batch_size'], options['digest_size'])
+
+        self.stdout.write(f'{sent} avisos enviados, {failed} fallidos.')
+        if next_flush:
+            self.stdout.write(f'Quedan avisos pendientes para {next_flush:%Y-%m-%d %H:%M:%S}.')
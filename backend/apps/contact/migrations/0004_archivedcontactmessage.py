@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-18 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0003_contactnotification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedContactMessage',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('first_name', models.CharField(max_length=100)),
+                ('last_name', models.CharField(max_length=100)),
+                ('email', models.EmailField(max_length=254)),
+                ('phone', models.CharField(blank=True, max_length=20)),
+                ('subject', models.CharField(blank=True, max_length=200)),
+                ('message', models.TextField()),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Mensaje Archivado',
+                'verbose_name_plural': 'Mensajes Archivados',
+                'db_table': 'contact_messages_archive',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['-created_at'], name='contact_archive_created_idx'), models.Index(fields=['email', '-created_at'], name='contact_archive_email_idx')],
+            },
+        ),
+    ]
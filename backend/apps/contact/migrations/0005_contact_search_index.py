@@ -0,0 +1,60 @@
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS contact_search USING fts5(
+        name, email, subject, message,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3 4 5 6'
+    )
+    """,
+    """
+    INSERT INTO contact_search (rowid, name, email, subject, message)
+    SELECT id, TRIM(first_name || ' ' || last_name), email, COALESCE(subject, ''), message
+    FROM contact_messages
+    """,
+]
+
+SQLITE_BACKWARD = [
+    'DROP TABLE IF EXISTS contact_search',
+]
+
+# Nombre y correo con 'simple' (sin raíces); el correo se parte en @ y . para
+# que se pueda buscar por prefijo de cada parte, igual que en SQLite.
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE contact_messages ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('simple', first_name || ' ' || last_name) ||
+        to_tsvector('simple', translate(email, '@.', '  ')) ||
+        to_tsvector('spanish', COALESCE(subject, '') || ' ' || message)
+    ) STORED
+    """,
+    'CREATE INDEX contact_search_vector_gin ON contact_messages USING GIN (search_vector)',
+]
+
+POSTGRESQL_BACKWARD = [
+    'DROP INDEX IF EXISTS contact_search_vector_gin',
+    'ALTER TABLE contact_messages DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        statements = statements_by_vendor.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0004_archivedcontactmessage'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRESQL_FORWARD}),
+            _run({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRESQL_BACKWARD}),
+        ),
+    ]
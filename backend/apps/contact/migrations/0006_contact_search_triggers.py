@@ -0,0 +1,68 @@
+from django.db import migrations
+
+# El índice se mantiene dentro del mismo INSERT/UPDATE/DELETE sobre
+# contact_messages: sin consultas extra por mensaje y también con
+# bulk_create() o update(). Marcar como leído no toca el índice.
+SQLITE_FORWARD = [
+    """
+    CREATE TRIGGER IF NOT EXISTS contact_search_insert AFTER INSERT ON contact_messages BEGIN
+        INSERT INTO contact_search (rowid, name, email, subject, message)
+        VALUES (new.id, TRIM(new.first_name || ' ' || new.last_name), new.email,
+                COALESCE(new.subject, ''), new.message);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contact_search_update AFTER UPDATE ON contact_messages
+    WHEN old.id IS NOT new.id
+      OR old.first_name IS NOT new.first_name
+      OR old.last_name IS NOT new.last_name
+      OR old.email IS NOT new.email
+      OR old.subject IS NOT new.subject
+      OR old.message IS NOT new.message
+    BEGIN
+        DELETE FROM contact_search WHERE rowid = old.id;
+        INSERT INTO contact_search (rowid, name, email, subject, message)
+        VALUES (new.id, TRIM(new.first_name || ' ' || new.last_name), new.email,
+                COALESCE(new.subject, ''), new.message);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contact_search_delete AFTER DELETE ON contact_messages BEGIN
+        DELETE FROM contact_search WHERE rowid = old.id;
+    END
+    """,
+    'DELETE FROM contact_search',
+    """
+    INSERT INTO contact_search (rowid, name, email, subject, message)
+    SELECT id, TRIM(first_name || ' ' || last_name), email, COALESCE(subject, ''), message
+    FROM contact_messages
+    """,
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS contact_search_insert',
+    'DROP TRIGGER IF EXISTS contact_search_update',
+    'DROP TRIGGER IF EXISTS contact_search_delete',
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        statements = statements_by_vendor.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0005_contact_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD}),
+            _run({'sqlite': SQLITE_BACKWARD}),
+        ),
+    ]
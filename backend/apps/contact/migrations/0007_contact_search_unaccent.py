@@ -0,0 +1,72 @@
+from django.db import migrations
+
+# 'simple' y 'spanish' no quitan tildes: "perez" no encontraba "Pérez",
+# mientras que SQLite sí (remove_diacritics). Se crean copias de ambas
+# configuraciones que pasan cada palabra por unaccent antes de su diccionario.
+# Una configuración fija es IMMUTABLE, así que sirve en la columna generada.
+POSTGRESQL_FORWARD = [
+    'CREATE EXTENSION IF NOT EXISTS unaccent',
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'simple_unaccent') THEN
+            CREATE TEXT SEARCH CONFIGURATION simple_unaccent (COPY = simple);
+            ALTER TEXT SEARCH CONFIGURATION simple_unaccent
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, simple;
+        END IF;
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'spanish_unaccent') THEN
+            CREATE TEXT SEARCH CONFIGURATION spanish_unaccent (COPY = spanish);
+            ALTER TEXT SEARCH CONFIGURATION spanish_unaccent
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+        END IF;
+    END
+    $$
+    """,
+    'DROP INDEX IF EXISTS contact_search_vector_gin',
+    'ALTER TABLE contact_messages DROP COLUMN IF EXISTS search_vector',
+    """
+    ALTER TABLE contact_messages ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('simple_unaccent', first_name || ' ' || last_name) ||
+        to_tsvector('simple_unaccent', translate(email, '@.', '  ')) ||
+        to_tsvector('spanish_unaccent', COALESCE(subject, '') || ' ' || message)
+    ) STORED
+    """,
+    'CREATE INDEX contact_search_vector_gin ON contact_messages USING GIN (search_vector)',
+]
+
+POSTGRESQL_BACKWARD = [
+    'DROP INDEX IF EXISTS contact_search_vector_gin',
+    'ALTER TABLE contact_messages DROP COLUMN IF EXISTS search_vector',
+    """
+    ALTER TABLE contact_messages ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('simple', first_name || ' ' || last_name) ||
+        to_tsvector('simple', translate(email, '@.', '  ')) ||
+        to_tsvector('spanish', COALESCE(subject, '') || ' ' || message)
+    ) STORED
+    """,
+    'CREATE INDEX contact_search_vector_gin ON contact_messages USING GIN (search_vector)',
+    'DROP TEXT SEARCH CONFIGURATION IF EXISTS simple_unaccent',
+    'DROP TEXT SEARCH CONFIGURATION IF EXISTS spanish_unaccent',
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        statements = statements_by_vendor.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0006_contact_search_triggers'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'postgresql': POSTGRESQL_FORWARD}),
+            _run({'postgresql': POSTGRESQL_BACKWARD}),
+        ),
+    ]
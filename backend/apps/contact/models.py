@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 class ContactMessage(models.Model):
@@ -14,8 +15,86 @@ class ContactMessage(models.Model):
     class Meta:
         db_table = "contact_messages"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="contact_created_idx"),
+            models.Index(fields=["is_read", "-created_at"], name="contact_is_read_idx"),
+            models.Index(fields=["email", "-created_at"], name="contact_email_idx"),
+        ]
         verbose_name = "Mensaje"
         verbose_name_plural = "Mensajes"
 
     def __str__(self):
         return f"Mensaje de {self.first_name} {self.last_name}"
+
+
+class ArchivedContactMessage(models.Model):
+    """
+    Mensaje leído que ``manage.py archive_messages`` sacó de
+    ``contact_messages``. Conserva el id original.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    first_name = models.CharField(max_length=100)
+    last_name = models.CharField(max_length=100)
+    email = models.EmailField()
+    phone = models.CharField(max_length=20, blank=True)
+    subject = models.CharField(max_length=200, blank=True)
+    message = models.TextField()
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "contact_messages_archive"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="contact_archive_created_idx"),
+            models.Index(fields=["email", "-created_at"], name="contact_archive_email_idx"),
+        ]
+        verbose_name = "Mensaje Archivado"
+        verbose_name_plural = "Mensajes Archivados"
+
+    def __str__(self):
+        return f"Mensaje archivado de {self.first_name} {self.last_name}"
+
+
+class ContactNotification(models.Model):
+    """
+    Aviso pendiente de enviar por correo. Se crea en la misma transacción que
+    el mensaje y lo vacía ``outbox.flush_outbox`` por lotes.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_SENDING = "sending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pendiente"),
+        (STATUS_SENDING, "Enviando"),
+        (STATUS_SENT, "Enviado"),
+        (STATUS_FAILED, "Fallido"),
+    ]
+
+    message = models.ForeignKey(
+        ContactMessage, on_delete=models.CASCADE, related_name="notifications", verbose_name="Mensaje"
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name="Estado")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Intentos")
+    next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name="Próximo Intento")
+    claimed_by = models.CharField(max_length=64, blank=True, verbose_name="Envío")
+    claimed_at = models.DateTimeField(blank=True, null=True, verbose_name="Tomado En")
+    sent_at = models.DateTimeField(blank=True, null=True, verbose_name="Enviado En")
+    last_error = models.TextField(blank=True, verbose_name="Último Error")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de Creación")
+
+    class Meta:
+        db_table = "contact_notifications"
+        ordering = ["next_attempt_at", "id"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="contact_outbox_due_idx"),
+        ]
+        verbose_name = "Aviso por Correo"
+        verbose_name_plural = "Avisos por Correo"
+
+    def __str__(self):
+        return f"Aviso del mensaje #{self.message_id} ({self.get_status_display()})"
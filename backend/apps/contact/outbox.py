@@ -0,0 +1,172 @@
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import Count, F, Min
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from apps.jobs.queue import retry_delay
+from .models import ContactNotification
+
+logger = logging.getLogger(__name__)
+
+
+def due_notifications():
+    return ContactNotification.objects.filter(
+        status=ContactNotification.STATUS_PENDING, next_attempt_at__lte=timezone.now()
+    )
+
+
+def flush_outbox(batch_size=None, digest_size=None):
+    """
+    Envía los avisos pendientes por lotes de ``batch_size`` con una sola
+    conexión al servidor de correo. Con ``digest_size`` mayor que 1 agrupa
+    hasta ese número de leads por correo y espera a juntarlos, como mucho
+    ``CONTACT_EMAIL_DIGEST_WAIT`` segundos desde el más antiguo.
+
+    Devuelve ``(enviados, fallidos, próximo_vaciado)``; el último es None si
+    no queda nada pendiente.
+    """
+    batch_size = batch_size or settings.CONTACT_EMAIL_BATCH_SIZE
+    digest_size = settings.CONTACT_EMAIL_DIGEST_SIZE if digest_size is None else digest_size
+    release_stale_notifications()
+
+    if digest_size > 1:
+        due = due_notifications().aggregate(count=Count('pk'), oldest=Min('created_at'))
+        if due['count']:
+            deadline = due['oldest'] + timedelta(seconds=settings.CONTACT_EMAIL_DIGEST_WAIT)
+            if due['count'] < digest_size and deadline > timezone.now():
+                return 0, 0, deadline
+
+    sent = failed = 0
+    group_size = max(digest_size, 1)
+    connection = get_connection(settings.CONTACT_EMAIL_BACKEND)
+
+    try:
+        while batch := claim_notifications(batch_size):
+            for start in range(0, len(batch), group_size):
+                group = batch[start:start + group_size]
+                try:
+                    # open() no hace nada si la conexión sigue abierta.
+                    connection.open()
+                    connection.send_messages([build_email([notification.message for notification in group])])
+                except Exception as e:
+                    logger.exception(f"No se pudo enviar el aviso de {len(group)} mensajes de contacto: {e}")
+                    mark_failed(group, e)
+                    failed += len(group)
+                    close_quietly(connection)
+                else:
+                    mark_sent(group)
+                    sent += len(group)
+    finally:
+        close_quietly(connection)
+
+    retry = ContactNotification.objects.filter(
+        status=ContactNotification.STATUS_PENDING
+    ).aggregate(next=Min('next_attempt_at'))['next']
+
+    if sent or failed:
+        logger.info(f"Outbox de contacto: {sent} avisos enviados, {failed} fallidos.")
+    return sent, failed, retry
+
+
+def claim_notifications(limit):
+    # Igual que los jobs: el UPDATE condicional reparte los avisos entre
+    # envíos concurrentes sin que dos tomen el mismo.
+    token = uuid.uuid4().hex
+    ids = list(due_notifications().values_list('pk', flat=True)[:limit])
+    if not ids:
+        return []
+
+    ContactNotification.objects.filter(pk__in=ids, status=ContactNotification.STATUS_PENDING).update(
+        status=ContactNotification.STATUS_SENDING,
+        claimed_by=token,
+        claimed_at=timezone.now(),
+        attempts=F('attempts') + 1,
+    )
+    return list(
+        ContactNotification.objects.filter(claimed_by=token).select_related('message').order_by('created_at', 'id')
+    )
+
+
+def mark_sent(group):
+    ContactNotification.objects.filter(pk__in=[notification.pk for notification in group]).update(
+        status=ContactNotification.STATUS_SENT,
+        sent_at=timezone.now(),
+        last_error='',
+        claimed_by='',
+        claimed_at=None,
+    )
+
+
+def mark_failed(group, error):
+    for notification in group:
+        notification.last_error = f'{type(error).__name__}: {error}'
+        notification.claimed_by = ''
+        notification.claimed_at = None
+
+        if notification.attempts >= settings.CONTACT_EMAIL_MAX_ATTEMPTS:
+            notification.status = ContactNotification.STATUS_FAILED
+        else:
+            notification.status = ContactNotification.STATUS_PENDING
+            notification.next_attempt_at = timezone.now() + retry_delay(notification.attempts)
+
+        notification.save(update_fields=['status', 'next_attempt_at', 'last_error', 'claimed_by', 'claimed_at'])
+
+
+def release_stale_notifications():
+    """Devuelve a pendientes los avisos de un envío que murió a medias."""
+    limit = timezone.now() - timedelta(seconds=settings.CONTACT_EMAIL_SENDING_TIMEOUT)
+    return ContactNotification.objects.filter(
+        status=ContactNotification.STATUS_SENDING, claimed_at__lt=limit
+    ).update(status=ContactNotification.STATUS_PENDING, claimed_by='', claimed_at=None)
+
+
+def close_quietly(connection):
+    try:
+        connection.close()
+    except Exception:
+        logger.warning("No se pudo cerrar la conexión de correo.", exc_info=True)
+
+
+def build_email(messages):
+    if len(messages) == 1:
+        return build_lead_email(messages[0])
+    return build_digest_email(messages)
+
+
+def lead_context(instance):
+    return {
+        'name': f"{instance.first_name} {instance.last_name}".strip(),
+        'email': instance.email,
+        'phone': instance.phone or "No especificado",
+        'subject': instance.subject or "Consulta Web",
+        'message_body': instance.message,
+        'created_at': instance.created_at,
+    }
+
+
+def build_lead_email(instance):
+    context = lead_context(instance)
+    html_content = render_to_string('new_lead_email.html', context)
+    email_subject = f"Nuevo Lead: {context['subject']} - {context['name']}"
+    return _email(email_subject, html_content)
+
+
+def build_digest_email(messages):
+    html_content = render_to_string('new_leads_digest_email.html', {
+        'leads': [lead_context(instance) for instance in messages],
+    })
+    return _email(f"{len(messages)} nuevos leads desde la web", html_content)
+
+
+def _email(subject, html_content):
+    msg = EmailMultiAlternatives(
+        subject, strip_tags(html_content), settings.DEFAULT_FROM_EMAIL, [settings.DEFAULT_FROM_EMAIL]
+    )
+    msg.attach_alternative(html_content, "text/html")
+    return msg
@@ -0,0 +1,171 @@
+import re
+
+from django.db import connections, transaction
+from rest_framework import filters
+
+from .models import ContactMessage
+
+SEARCH_TABLE = "contact_search"
+SEARCH_COLUMNS = ("name", "email", "subject", "message")
+# Copias de 'simple' y 'spanish' que quitan tildes con unaccent (migración
+# 0007), igual que remove_diacritics en el índice FTS5 de SQLite.
+NAME_CONFIG = "simple_unaccent"
+SEARCH_CONFIG = "spanish_unaccent"
+
+TOKEN_RE = re.compile(r"\w+")
+
+_NEW_VALUES = "new.id, TRIM(new.first_name || ' ' || new.last_name), new.email, COALESCE(new.subject, ''), new.message"
+
+# Mantienen contact_search dentro del mismo INSERT/UPDATE/DELETE. En SQLite un
+# AlterField recrea contact_messages y se lleva sus triggers: por eso se
+# comprueban al arrancar y después de cada migrate (ver ensure_search_triggers).
+SEARCH_TRIGGERS = {
+    "contact_search_insert": f"""
+    CREATE TRIGGER IF NOT EXISTS contact_search_insert AFTER INSERT ON contact_messages BEGIN
+        INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_COLUMNS)}) VALUES ({_NEW_VALUES});
+    END
+    """,
+    "contact_search_update": f"""
+    CREATE TRIGGER IF NOT EXISTS contact_search_update AFTER UPDATE ON contact_messages
+    WHEN old.id IS NOT new.id
+      OR old.first_name IS NOT new.first_name
+      OR old.last_name IS NOT new.last_name
+      OR old.email IS NOT new.email
+      OR old.subject IS NOT new.subject
+      OR old.message IS NOT new.message
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+        INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_COLUMNS)}) VALUES ({_NEW_VALUES});
+    END
+    """,
+    "contact_search_delete": f"""
+    CREATE TRIGGER IF NOT EXISTS contact_search_delete AFTER DELETE ON contact_messages BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+    END
+    """,
+}
+
+_fts_tables = set()
+
+
+def search_backend(using="default"):
+    connection = connections[using]
+
+    if connection.vendor == "postgresql":
+        return "postgresql"
+    if connection.vendor != "sqlite":
+        return None
+
+    if using not in _fts_tables:
+        if not ensure_search_triggers(using):
+            return None
+        _fts_tables.add(using)
+    return "sqlite"
+
+
+def reset_search_backend(using="default"):
+    """Repite la comprobación de ``search_backend`` (p. ej. después de migrar)."""
+    _fts_tables.discard(using)
+    return search_backend(using)
+
+
+def ensure_search_triggers(using="default"):
+    """
+    Comprueba en una sola consulta que existan la tabla FTS5 y sus triggers.
+    Los que falten se recrean y el índice se reconstruye, porque lo escrito
+    mientras no estaban no quedó indexado. False si no hay tabla FTS5.
+    """
+    connection = connections[using]
+    names = [SEARCH_TABLE, *SEARCH_TRIGGERS]
+    placeholders = ", ".join(["%s"] * len(names))
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT name FROM sqlite_master WHERE name IN ({placeholders})", names)
+        existing = {row[0] for row in cursor.fetchall()}
+    if SEARCH_TABLE not in existing:
+        return False
+
+    missing = [name for name in SEARCH_TRIGGERS if name not in existing]
+    if missing:
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            for name in missing:
+                cursor.execute(SEARCH_TRIGGERS[name])
+            _rebuild(cursor)
+    return True
+
+
+def rebuild_index(using="default"):
+    if search_backend(using) != "sqlite":
+        return
+
+    with connections[using].cursor() as cursor:
+        _rebuild(cursor)
+
+
+def _rebuild(cursor):
+    cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+    cursor.execute(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_COLUMNS)}) "
+        f"SELECT id, TRIM(first_name || ' ' || last_name), email, COALESCE(subject, ''), message "
+        f"FROM {ContactMessage._meta.db_table}"
+    )
+
+
+def search_messages(queryset, terms):
+    """
+    Filtra por todas las palabras en nombre, correo, asunto y mensaje. La
+    última se busca como prefijo (búsqueda mientras se escribe) y las demás
+    completas. El correo se indexa partido en ``@`` y ``.``, así que
+    ``juan.pe`` encuentra ``juan.perez@gmail.com``.
+    """
+    backend = search_backend(queryset.db)
+    tokens = [token for term in terms for token in TOKEN_RE.findall(term)]
+
+    if backend is None or not tokens:
+        return None
+
+    table = queryset.model._meta.db_table
+    *words, prefix = tokens
+
+    if backend == "sqlite":
+        # Solo la última palabra va como prefijo: hasta 6 caracteres la
+        # resuelve el índice de prefijos de la tabla; más largo, FTS5 debe
+        # unir antes las listas de todos los términos que lo comparten.
+        match = " ".join([f'"{word}"' for word in words] + [f'"{prefix}"*'])
+        # Los ids son AUTOINCREMENT, así que rowid descendente es el orden de
+        # llegada; FTS5 lo recorre en ese orden y corta en la primera página
+        # en vez de ordenar todas las coincidencias por created_at.
+        return queryset.extra(
+            tables=[SEARCH_TABLE],
+            where=[f"{SEARCH_TABLE}.rowid = {table}.id", f"{SEARCH_TABLE} MATCH %s"],
+            params=[match],
+            order_by=[f"-{SEARCH_TABLE}.rowid"],
+        )
+
+    # Nombre y correo se indexan con NAME_CONFIG y asunto y mensaje con
+    # SEARCH_CONFIG: cada palabra debe coincidir en cualquiera de los dos, si
+    # no 'quispe' se buscaría como la raíz 'quisp' y no encontraría el nombre.
+    queries = words + [f"{prefix}:*"]
+    word_query = f"(to_tsquery('{NAME_CONFIG}', %s) || to_tsquery('{SEARCH_CONFIG}', %s))"
+    return queryset.extra(
+        where=[f"{table}.search_vector @@ ({' && '.join([word_query] * len(queries))})"],
+        params=[query for query in queries for _ in range(2)],
+    )
+
+
+class ContactSearchFilter(filters.SearchFilter):
+    """
+    ``?search=`` de la bandeja sobre el índice FTS5 (SQLite) o el tsvector
+    con índice GIN (PostgreSQL). Conserva el orden de la bandeja (los más
+    recientes primero). En otros motores vuelve al SearchFilter de DRF con
+    ``search_fields``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        results = search_messages(queryset, terms)
+        if results is None:
+            return super().filter_queryset(request, queryset, view)
+        return results
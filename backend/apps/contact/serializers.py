@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import ContactMessage
+from .models import ArchivedContactMessage, ContactMessage
 
 class ContactMessageSerializer(serializers.ModelSerializer):
     class Meta:
@@ -10,4 +10,15 @@ class ContactMessageSerializer(serializers.ModelSerializer):
 class ContactStatusSerializer(serializers.ModelSerializer):
     class Meta:
         model = ContactMessage
-        fields = ['is_read'] # <--- Aquí está la magia: solo permite este campo
\ No newline at end of file
+        fields = ['is_read'] # <--- Aquí está la magia: solo permite este campo
+
+    def update(self, instance, validated_data):
+        # Solo se escribe is_read: el índice de búsqueda no se toca.
+        instance.is_read = validated_data.get('is_read', instance.is_read)
+        instance.save(update_fields=['is_read'])
+        return instance
+
+class ArchivedContactMessageSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ArchivedContactMessage
+        fields = '__all__'
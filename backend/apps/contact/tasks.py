@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.jobs.models import Job
+from apps.jobs.queue import enqueue_at, task
+from .models import ContactMessage, ContactNotification
+from .outbox import flush_outbox
+
+
+@task(max_attempts=3, every=settings.CONTACT_EMAIL_SWEEP_INTERVAL)
+def flush_contact_outbox():
+    # Los reintentos son por aviso (ver outbox.mark_failed); el job solo
+    # vuelve a programarse para cuando toque el siguiente. El worker además
+    # lo encola cada CONTACT_EMAIL_SWEEP_INTERVAL segundos: si el proceso
+    # murió entre el commit del mensaje y el encolado, el aviso no se pierde.
+    next_flush = flush_outbox()[2]
+    if next_flush:
+        schedule_flush(next_flush)
+
+
+@task(max_attempts=8)
+def send_contact_notification(message_id):
+    """Jobs encolados antes del outbox: pasan el aviso a la tabla y la vacían."""
+    if ContactMessage.objects.filter(pk=message_id).exists():
+        ContactNotification.objects.get_or_create(message_id=message_id)
+    schedule_flush()
+
+
+def schedule_flush(run_at=None):
+    """
+    Encola un vaciado del outbox, salvo que ya haya uno pendiente que se
+    ejecute antes. Así una ráfaga de mensajes deja un solo job en cola.
+
+    La comprobación espera al commit de la transacción actual: un job que
+    sigue pendiente en ese momento todavía no tomó los avisos, así que verá
+    el recién guardado. Comprobarlo antes dejaría el aviso sin job si ese
+    vaciado termina mientras la transacción sigue abierta.
+    """
+    run_at = run_at or timezone.now()
+    transaction.on_commit(lambda: _enqueue_flush(run_at))
+
+
+def _enqueue_flush(run_at):
+    already_queued = Job.objects.filter(
+        task=flush_contact_outbox.name, status=Job.STATUS_PENDING, run_at__lte=run_at
+    ).exists()
+    if not already_queued:
+        enqueue_at(run_at, flush_contact_outbox)
@@ -0,0 +1,443 @@
+import copy
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPException
+from unittest import mock, skipUnless
+
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection
+from django.utils import timezone
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.jobs.models import Job
+from apps.jobs.queue import run_job
+from apps.jobs.worker import Worker
+from core.testing import api_client, create_admin
+from core.throttling import admission_counters, record_admission
+
+from .archive import archive_batch
+from .models import ArchivedContactMessage, ContactMessage, ContactNotification
+from .outbox import flush_outbox
+from .search import SEARCH_TRIGGERS, reset_search_backend, search_backend, search_messages
+from .serializers import ContactMessageSerializer
+from .tasks import flush_contact_outbox
+from .throttles import DuplicateContactThrottle
+
+CONTACT_URL = '/api/contact/messages/'
+
+
+def contact_payload(**overrides):
+    return {
+        'first_name': 'Rosa',
+        'last_name': 'Quispe Huamán',
+        'email': 'rosa.flores@empresa.pe',
+        'phone': '999888777',
+        'subject': 'Cotización',
+        'message': 'Quisiera una cotización para un edificio de cinco pisos.',
+        **overrides,
+    }
+
+
+@override_settings(QUERY_BUDGET_ENFORCE=True)
+class ContactCreateTests(TransactionTestCase):
+    # TransactionTestCase para que los on_commit (job de vaciado) corran
+    # dentro de la petición y entren en el presupuesto, como en producción.
+
+    def setUp(self):
+        cache.clear()
+        self.client = api_client()
+
+    def test_create_within_query_budget(self):
+        response = self.client.post(CONTACT_URL, contact_payload(), format='json')
+
+        self.assertEqual(response.status_code, 201)
+        message = ContactMessage.objects.get()
+        self.assertTrue(ContactNotification.objects.filter(message=message).exists())
+        self.assertTrue(Job.objects.filter(task=flush_contact_outbox.name, status=Job.STATUS_PENDING).exists())
+
+    def test_created_message_is_searchable(self):
+        self.client.post(CONTACT_URL, contact_payload(), format='json')
+
+        queryset = ContactMessage.objects.all()
+        for term in ('quispe huam', 'rosa.flo', 'cotizacion edif'):
+            with self.subTest(term=term):
+                self.assertEqual(search_messages(queryset, [term]).count(), 1)
+
+
+@override_settings(CONTACT_DUPLICATE_WINDOW=600)
+class ContactDuplicateTests(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = api_client()
+
+    def post(self, **overrides):
+        return self.client.post(CONTACT_URL, contact_payload(**overrides), format='json')
+
+    def test_duplicate_is_rejected_without_saving(self):
+        self.assertEqual(self.post().status_code, 201)
+
+        # Solo cambian mayúsculas y espacios: es el mismo mensaje.
+        response = self.post(email=' Rosa.Flores@empresa.pe ', subject='cotización')
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(ContactMessage.objects.count(), 1)
+        self.assertEqual(ContactNotification.objects.count(), 1)
+        self.assertEqual(admission_counters(['contact_duplicate']), {'contact_duplicate': {'rejected': 1}})
+        self.assertEqual(self.post(message='Otro mensaje distinto.').status_code, 201)
+
+    def test_concurrent_duplicate_is_rejected_before_the_insert(self):
+        self.post()
+
+        # Dos envíos simultáneos pasan ambos la comprobación de admisión.
+        with mock.patch.object(DuplicateContactThrottle, 'allow_request', return_value=True):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.post()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertFalse([query for query in queries if 'INSERT' in query['sql']])
+        self.assertEqual(ContactMessage.objects.count(), 1)
+
+    def test_failed_save_releases_the_content(self):
+        with mock.patch.object(ContactMessageSerializer, 'save', side_effect=DatabaseError('sin conexión')):
+            self.assertEqual(self.post().status_code, 500)
+
+        self.assertEqual(self.post().status_code, 201)
+
+    def test_rejected_by_validation_can_be_corrected(self):
+        self.assertEqual(self.post(email='no-es-un-correo').status_code, 400)
+
+        self.assertEqual(self.post(email='no-es-un-correo').status_code, 400)
+        self.assertEqual(ContactMessage.objects.count(), 0)
+
+
+@override_settings(
+    JOBS_EAGER=False, CONTACT_EMAIL_BACKEND=None, CONTACT_EMAIL_DIGEST_SIZE=0,
+    CONTACT_EMAIL_DIGEST_WAIT=900, CONTACT_EMAIL_MAX_ATTEMPTS=2, JOBS_RETRY_BASE_SECONDS=10,
+)
+class ContactOutboxTests(TestCase):
+    # En TestCase los on_commit no se ejecutan: cada mensaje deja su aviso en
+    # el outbox sin job de vaciado, como si el proceso muriera tras el commit.
+
+    def create_messages(self, count):
+        return [
+            ContactMessage.objects.create(**contact_payload(first_name=f'Rosa {index}'))
+            for index in range(count)
+        ]
+
+    def statuses(self):
+        return list(ContactNotification.objects.order_by('id').values_list('status', flat=True))
+
+    def test_flush_sends_one_email_per_message(self):
+        self.create_messages(2)
+
+        self.assertEqual(flush_outbox(), (2, 0, None))
+
+        self.assertEqual(
+            [email.subject for email in mail.outbox],
+            ['Nuevo Lead: Cotización - Rosa 0 Quispe Huamán', 'Nuevo Lead: Cotización - Rosa 1 Quispe Huamán'],
+        )
+        self.assertEqual(self.statuses(), [ContactNotification.STATUS_SENT] * 2)
+        self.assertEqual(flush_outbox(), (0, 0, None))
+
+    @override_settings(CONTACT_EMAIL_DIGEST_SIZE=3)
+    def test_digest_waits_for_a_full_group(self):
+        self.create_messages(2)
+
+        sent, failed, next_flush = flush_outbox()
+
+        self.assertEqual((sent, failed, mail.outbox), (0, 0, []))
+        oldest = ContactNotification.objects.earliest('created_at').created_at
+        self.assertEqual(next_flush, oldest + timedelta(seconds=900))
+
+        self.create_messages(1)
+        self.assertEqual(flush_outbox()[:2], (3, 0))
+        self.assertEqual([email.subject for email in mail.outbox], ['3 nuevos leads desde la web'])
+
+    @override_settings(CONTACT_EMAIL_DIGEST_SIZE=3)
+    def test_digest_is_sent_incomplete_after_the_wait(self):
+        self.create_messages(2)
+        ContactNotification.objects.update(created_at=timezone.now() - timedelta(seconds=901))
+
+        self.assertEqual(flush_outbox(), (2, 0, None))
+        self.assertEqual([email.subject for email in mail.outbox], ['2 nuevos leads desde la web'])
+
+    def test_failed_sends_are_retried_with_backoff(self):
+        self.create_messages(1)
+
+        with mock.patch.object(EmailBackend, 'send_messages', side_effect=SMTPException('sin conexión')):
+            with self.assertLogs('apps.contact.outbox', 'ERROR'):
+                sent, failed, next_flush = flush_outbox()
+
+            notification = ContactNotification.objects.get()
+            self.assertEqual((sent, failed), (0, 1))
+            self.assertEqual((notification.status, notification.attempts), (ContactNotification.STATUS_PENDING, 1))
+            self.assertEqual(notification.last_error, 'SMTPException: sin conexión')
+            self.assertEqual(next_flush, notification.next_attempt_at)
+            self.assertGreater(notification.next_attempt_at, timezone.now() + timedelta(seconds=9))
+
+            # Antes de tiempo no se reintenta.
+            self.assertEqual(flush_outbox()[:2], (0, 0))
+
+            ContactNotification.objects.update(next_attempt_at=timezone.now())
+            with self.assertLogs('apps.contact.outbox', 'ERROR'):
+                self.assertEqual(flush_outbox(), (0, 1, None))
+
+        self.assertEqual(self.statuses(), [ContactNotification.STATUS_FAILED])
+
+    @override_settings(CONTACT_EMAIL_SENDING_TIMEOUT=600)
+    def test_abandoned_sends_are_released(self):
+        self.create_messages(1)
+        ContactNotification.objects.update(
+            status=ContactNotification.STATUS_SENDING, claimed_by='muerto', claimed_at=timezone.now() - timedelta(seconds=601),
+        )
+
+        self.assertEqual(flush_outbox(), (1, 0, None))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_worker_sweep_flushes_notifications_left_without_a_job(self):
+        self.create_messages(1)
+        self.assertFalse(Job.objects.exists())
+
+        worker = Worker()
+        worker.schedule_periodic()
+        # Ni el mismo worker antes del intervalo ni otro recién arrancado duplican el barrido.
+        worker.schedule_periodic()
+        Worker().schedule_periodic()
+
+        job = Job.objects.get(task=flush_contact_outbox.name)
+        run_job(job.pk)
+
+        self.assertEqual(Job.objects.get(pk=job.pk).status, Job.STATUS_DONE)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(self.statuses(), [ContactNotification.STATUS_SENT])
+
+
+class ContactArchiveTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        old = timezone.now() - timedelta(days=200)
+
+        def create(name, is_read=True, created_at=old, notification=ContactNotification.STATUS_SENT):
+            message = ContactMessage.objects.create(**contact_payload(first_name=name))
+            ContactMessage.objects.filter(pk=message.pk).update(is_read=is_read, created_at=created_at)
+            ContactNotification.objects.filter(message=message).update(status=notification)
+            return message
+
+        cls.archivable = [create(f'Leído {index}') for index in range(3)]
+        cls.kept = [
+            create('Sin leer', is_read=False),
+            create('Reciente', created_at=timezone.now()),
+            create('Aviso pendiente', notification=ContactNotification.STATUS_PENDING),
+        ]
+        cls.cutoff = timezone.now() - timedelta(days=180)
+
+    def archive(self, *args):
+        stdout = StringIO()
+        call_command('archive_messages', '--older-than', '180', *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_batch_copies_then_deletes(self):
+        moved = [message.pk for message in self.archivable[:2]]
+        fields = ['id', 'first_name', 'email', 'phone', 'subject', 'message', 'created_at']
+        expected = list(ContactMessage.objects.filter(pk__in=moved).order_by('id').values_list(*fields))
+
+        self.assertEqual(archive_batch(self.cutoff, 2), 2)
+
+        self.assertEqual(list(ArchivedContactMessage.objects.order_by('id').values_list(*fields)), expected)
+        self.assertFalse(ContactMessage.objects.filter(pk__in=moved).exists())
+        # Los avisos ya enviados se borran en cascada con el mensaje.
+        self.assertFalse(ContactNotification.objects.filter(message_id__in=moved).exists())
+        self.assertEqual(ContactNotification.objects.count(), 4)
+
+    def test_failed_delete_rolls_back_the_copy(self):
+        with mock.patch('django.db.models.query.QuerySet.delete', side_effect=DatabaseError('bloqueo')):
+            with self.assertRaises(DatabaseError):
+                archive_batch(self.cutoff, 10)
+
+        self.assertFalse(ArchivedContactMessage.objects.exists())
+        self.assertEqual(ContactMessage.objects.count(), 6)
+
+    def test_command_archives_in_batches(self):
+        output = self.archive('--batch-size', '2')
+
+        self.assertIn('  2 mensajes archivados...', output)
+        self.assertIn('  3 mensajes archivados...', output)
+        self.assertEqual(
+            sorted(ArchivedContactMessage.objects.values_list('id', flat=True)),
+            [message.pk for message in self.archivable],
+        )
+        self.assertEqual(
+            sorted(ContactMessage.objects.values_list('id', flat=True)), [message.pk for message in self.kept]
+        )
+        self.assertEqual(ContactNotification.objects.count(), 3)
+
+    def test_rerun_is_idempotent(self):
+        self.archive()
+
+        output = self.archive()
+
+        self.assertIn('0 mensajes anteriores', output)
+        self.assertEqual(ArchivedContactMessage.objects.count(), 3)
+        self.assertEqual(ContactMessage.objects.count(), 3)
+
+    def test_dry_run_only_counts(self):
+        output = self.archive('--dry-run')
+
+        self.assertIn('Se archivarían 3 mensajes', output)
+        self.assertFalse(ArchivedContactMessage.objects.exists())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(CommandError):
+            self.archive('--batch-size', '0')
+
+
+class ContactSearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        ContactMessage.objects.create(**contact_payload(
+            first_name='José', last_name='Pérez Ñahui', email='jperez@obra.pe', subject='Ampliación',
+        ))
+        ContactMessage.objects.create(**contact_payload())
+
+    def search(self, term):
+        return list(search_messages(ContactMessage.objects.all(), [term]).values_list('email', flat=True))
+
+    def test_search_ignores_accents_and_case(self):
+        for term in ('jose perez', 'PÉREZ', 'nahui', 'ampliacion', 'jperez@obra'):
+            with self.subTest(term=term):
+                self.assertEqual(self.search(term), ['jperez@obra.pe'])
+
+    @skipUnless(connection.vendor == 'postgresql', 'Configuraciones de búsqueda de PostgreSQL.')
+    def test_postgresql_vector_is_unaccented(self):
+        vector = (
+            ContactMessage.objects.filter(email='jperez@obra.pe')
+            .extra(select={'vector': 'search_vector::text'})
+            .values_list('vector', flat=True)
+            .get()
+        )
+
+        self.assertIn("'perez'", vector)
+        self.assertIn("'nahui'", vector)
+        self.assertNotIn('é', vector)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Los triggers del índice FTS5 son propios de SQLite.')
+class ContactSearchTriggerTests(TransactionTestCase):
+    """Un AlterField en SQLite recrea contact_messages y borra los triggers de contact_search."""
+
+    def setUp(self):
+        reset_search_backend()
+
+    def test_migrate_restores_triggers_dropped_by_alter_field(self):
+        old = ContactMessage._meta.get_field('subject')
+        new = copy.deepcopy(old)
+        new.max_length = old.max_length + 1
+        with connection.schema_editor() as editor:
+            editor.alter_field(ContactMessage, old, new)
+
+        def restore():
+            with connection.schema_editor() as editor:
+                editor.alter_field(ContactMessage, new, old)
+            reset_search_backend()
+
+        self.addCleanup(restore)
+
+        # Escrito sin triggers: solo queda indexado al reconstruir el índice.
+        ContactMessage.objects.create(**contact_payload(first_name='Lucía'))
+        call_command('migrate', verbosity=0)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'contact_messages'")
+            self.assertEqual({row[0] for row in cursor.fetchall()}, set(SEARCH_TRIGGERS))
+        self.assertEqual(search_messages(ContactMessage.objects.all(), ['lucia']).count(), 1)
+
+
+@override_settings(QUERY_BUDGET_ENFORCE=True)
+class ContactAdminTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = create_admin()
+        cls.message = ContactMessage.objects.create(**contact_payload())
+        for index in range(4):
+            ContactMessage.objects.create(**contact_payload(email=f'cliente{index}@empresa.pe'))
+            ArchivedContactMessage.objects.create(
+                id=100 + index, created_at=timezone.now(), **contact_payload(email=f'archivo{index}@empresa.pe')
+            )
+
+        # La detección de la tabla FTS se hace una vez por proceso, no por petición.
+        search_backend()
+
+    def setUp(self):
+        cache.clear()
+        self.client = api_client(self.admin)
+
+    def test_list(self):
+        response = self.client.get(CONTACT_URL, {'is_read': 'false', 'search': 'cotizacion cliente1'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([message['email'] for message in response.data['results']], ['cliente1@empresa.pe'])
+        self.assertEqual(response.data['meta']['total_records'], 1)
+
+    def test_list_by_cursor(self):
+        response = self.client.get(CONTACT_URL, {'cursor': '', 'page_size': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [message['email'] for message in response.data['results']],
+            ['cliente3@empresa.pe', 'cliente2@empresa.pe'],
+        )
+        self.assertIsNotNone(response.data['meta']['next'])
+
+    def test_retrieve(self):
+        response = self.client.get(f'{CONTACT_URL}{self.message.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['email'], self.message.email)
+
+    def test_admission(self):
+        record_admission('contact', 'accepted')
+        record_admission('contact_ip', 'rejected')
+        record_admission('contact_ip', 'rejected')
+
+        response = self.client.get(f'{CONTACT_URL}admission/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {
+            'contact': {'accepted': 1},
+            'contact_ip': {'rejected': 2},
+            'contact_email': {'rejected': 0},
+            'contact_duplicate': {'rejected': 0},
+        })
+
+    def test_archive_list(self):
+        response = self.client.get('/api/contact/archive/', {'search': 'archivo3'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([message['id'] for message in response.data['results']], [103])
+
+    def test_archive_retrieve(self):
+        response = self.client.get('/api/contact/archive/100/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['email'], 'archivo0@empresa.pe')
+        self.assertEqual(response.data['message'], contact_payload()['message'])
+
+    def test_mark_as_read_only_writes_is_read(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(f'{CONTACT_URL}{self.message.pk}/', {'is_read': True}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.message.refresh_from_db()
+        self.assertTrue(self.message.is_read)
+        updates = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('SET "is_read"', updates[0])
+        self.assertNotIn('"message"', updates[0])
@@ -0,0 +1,79 @@
+import hashlib
+
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle, SimpleRateThrottle
+
+from core.throttling import TokenBucketThrottle, record_admission
+
+
+def _submitted(request, field):
+    data = request.data
+    value = data.get(field, '') if hasattr(data, 'get') else ''
+    return str(value).strip().lower()
+
+
+class ContactIPThrottle(TokenBucketThrottle):
+    scope = 'contact_ip'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class ContactEmailThrottle(TokenBucketThrottle):
+    scope = 'contact_email'
+
+    def get_cache_key(self, request, view):
+        email = _submitted(request, 'email')
+        if not email:
+            # Sin correo la validación lo rechazará igual.
+            return None
+        ident = hashlib.sha256(email.encode()).hexdigest()[:32]
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+
+class DuplicateContactThrottle(BaseThrottle):
+    """
+    Rechaza un mensaje idéntico (mismos campos, sin distinguir mayúsculas ni
+    espacios en los extremos) a otro guardado dentro de
+    ``CONTACT_DUPLICATE_WINDOW`` segundos. El contenido se registra con
+    ``record`` justo antes de guardar el mensaje, no al admitir la petición,
+    y ``forget`` libera el registro si el guardado falla.
+    """
+
+    scope = 'contact_duplicate'
+    fields = ('first_name', 'last_name', 'email', 'phone', 'subject', 'message')
+    cache = SimpleRateThrottle.cache
+    timer = SimpleRateThrottle.timer
+
+    def get_cache_key(self, request):
+        content = '\x1f'.join(_submitted(request, field) for field in self.fields)
+        return f'throttle:duplicate:{hashlib.sha256(content.encode()).hexdigest()}'
+
+    def allow_request(self, request, view):
+        if not settings.CONTACT_DUPLICATE_WINDOW:
+            return True
+
+        expires = self.cache.get(self.get_cache_key(request))
+        return expires is None or self.reject(expires)
+
+    def record(self, request):
+        """Registra el mensaje a guardar; False si uno idéntico se registró antes."""
+        window = settings.CONTACT_DUPLICATE_WINDOW
+        if not window:
+            return True
+
+        key = self.get_cache_key(request)
+        expires = self.timer() + window
+        return self.cache.add(key, expires, window) or self.reject(self.cache.get(key) or expires)
+
+    def forget(self, request):
+        if settings.CONTACT_DUPLICATE_WINDOW:
+            self.cache.delete(self.get_cache_key(request))
+
+    def reject(self, expires):
+        self.wait_seconds = max(expires - self.timer(), 0)
+        record_admission(self.scope, 'rejected')
+        return False
+
+    def wait(self):
+        return self.wait_seconds
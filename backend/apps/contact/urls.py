@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ContactMessageViewSet
+from .views import ArchivedContactMessageViewSet, ContactMessageViewSet
 
 router = DefaultRouter()
 router.register(r'messages', ContactMessageViewSet)
+router.register(r'archive', ArchivedContactMessageViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,30 +1,114 @@
+from django.db import transaction
 from rest_framework import filters, viewsets, permissions
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import ContactMessage
-from .serializers import ContactMessageSerializer, ContactStatusSerializer
 
-class ContactMessageViewSet(viewsets.ModelViewSet):
+from core.export import ExportMixin
+from core.query_budget import QueryBudgetMixin
+from core.streaming import StreamingListMixin
+from core.throttling import admission_counters, record_admission
+
+from .models import ArchivedContactMessage, ContactMessage
+from .search import ContactSearchFilter
+from .serializers import ArchivedContactMessageSerializer, ContactMessageSerializer, ContactStatusSerializer
+from .throttles import ContactEmailThrottle, ContactIPThrottle, DuplicateContactThrottle
+
+class ContactMessageViewSet(QueryBudgetMixin, ExportMixin, StreamingListMixin, viewsets.ModelViewSet):
     queryset = ContactMessage.objects.all().order_by('-created_at')
     serializer_class = ContactMessageSerializer
+    # create: mensaje, aviso, comprobación e INSERT del job de vaciado (más el
+    # BEGIN explícito en SQLite). El índice de búsqueda lo llenan triggers.
+    query_budget = {'list': 3, 'retrieve': 2, 'create': 5, 'admission': 1}
+    cursor_ordering = ('-created_at', 'id')
+    create_throttle_classes = [ContactIPThrottle, ContactEmailThrottle, DuplicateContactThrottle]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        ContactSearchFilter,
         filters.OrderingFilter,
     ]
 
     filterset_fields = ['is_read', 'email']
-    search_fields = ['name', 'email', 'subject', 'message']
-    ordering_fields = ['created_at', 'name', 'email']
+    search_fields = ['first_name', 'last_name', 'email', 'subject', 'message']
+    ordering_fields = ['created_at', 'email']
 
     http_method_names = ['get', 'post', 'patch', 'head', 'options']
 
+    export_filename = 'mensajes'
+    export_fields = {
+        'id': 'id',
+        'fecha': 'created_at',
+        'nombre': 'first_name',
+        'apellido': 'last_name',
+        'correo': 'email',
+        'telefono': 'phone',
+        'asunto': 'subject',
+        'mensaje': 'message',
+        'leido': 'is_read',
+    }
+
     def get_permissions(self):
         if self.action == 'create':
             return [permissions.AllowAny()]
         return [permissions.IsAdminUser()]
 
+    def get_throttles(self):
+        if self.action == 'create':
+            return [throttle() for throttle in self.create_throttle_classes]
+        return super().get_throttles()
+
+    def check_throttles(self, request):
+        # Se corta en el primer rechazo: un flood frenado por IP no debe
+        # gastar fichas del correo.
+        for throttle in self.get_throttles():
+            if not throttle.allow_request(request, self):
+                self.throttled(request, throttle.wait())
+
+    def perform_create(self, serializer):
+        # El contenido se reserva antes del INSERT, ya validado: un envío
+        # rechazado por validación se puede corregir y repetir, y un duplicado
+        # simultáneo se rechaza sin llegar a guardarse.
+        duplicate = DuplicateContactThrottle()
+        if not duplicate.record(self.request):
+            self.throttled(self.request, duplicate.wait())
+
+        try:
+            # El aviso por correo se guarda en la misma transacción que el mensaje.
+            with transaction.atomic():
+                serializer.save()
+        except Exception:
+            duplicate.forget(self.request)
+            raise
+        record_admission('contact', 'accepted')
+
+    @action(detail=False, methods=['get'])
+    def admission(self, request):
+        """Contadores de mensajes aceptados y rechazados por cada control."""
+        counters = admission_counters(['contact'], outcomes=('accepted',))
+        counters.update(admission_counters([throttle.scope for throttle in self.create_throttle_classes]))
+        return Response(counters)
+
     def get_serializer_class(self):
         if self.action == 'partial_update':
             return ContactStatusSerializer
 
-        return ContactMessageSerializer
\ No newline at end of file
+        return ContactMessageSerializer
+
+
+class ArchivedContactMessageViewSet(QueryBudgetMixin, StreamingListMixin, viewsets.ReadOnlyModelViewSet):
+    """Mensajes movidos por ``manage.py archive_messages``; solo lectura."""
+
+    queryset = ArchivedContactMessage.objects.all().order_by('-created_at')
+    serializer_class = ArchivedContactMessageSerializer
+    permission_classes = [permissions.IsAdminUser]
+    query_budget = {'list': 3, 'retrieve': 2}
+    cursor_ordering = ('-created_at', 'id')
+    filter_backends = [
+        DjangoFilterBackend,
+        filters.SearchFilter,
+        filters.OrderingFilter,
+    ]
+
+    filterset_fields = ['email']
+    search_fields = ['first_name', 'last_name', 'email', 'subject', 'message']
+    ordering_fields = ['created_at', 'email']
@@ -0,0 +1,20 @@
+from django.contrib import admin
+from django.utils import timezone
+from .models import Job
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('task', 'queue', 'status', 'attempts', 'max_attempts', 'run_at', 'updated_at')
+    list_filter = ('status', 'queue')
+    search_fields = ('task', 'last_error')
+    readonly_fields = ('created_at', 'updated_at', 'locked_by', 'locked_at', 'lease_expires_at')
+    ordering = ('-created_at',)
+
+    actions = ['retry_jobs']
+
+    @admin.action(description='Reintentar tareas seleccionadas')
+    def retry_jobs(self, request, queryset):
+        updated = queryset.exclude(status=Job.STATUS_RUNNING).update(
+            status=Job.STATUS_PENDING, attempts=0, run_at=timezone.now(), last_error=''
+        )
+        self.message_user(request, f'{updated} tareas devueltas a la cola.')
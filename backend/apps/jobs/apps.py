@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    name = 'apps.jobs'
+    verbose_name = 'Tareas en Segundo Plano'
@@ -0,0 +1,55 @@
+import multiprocessing
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.jobs.worker import Worker
+
+
+def _run_worker(options):
+    django.setup()
+    Worker(
+        queues=options['queues'],
+        threads=options['threads'],
+        poll_interval=options['poll_interval'],
+        lease=options['lease'],
+    ).run()
+
+
+class Command(BaseCommand):
+    help = 'Ejecuta los jobs encolados con enqueue() usando un pool de procesos e hilos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=getattr(settings, 'JOBS_PROCESSES', 1))
+        parser.add_argument('--threads', type=int, default=getattr(settings, 'JOBS_THREADS', 4))
+        parser.add_argument('--queues', nargs='+', default=['default'])
+        parser.add_argument('--poll-interval', type=float, default=1.0)
+        parser.add_argument(
+            '--lease', type=int, default=getattr(settings, 'JOBS_LEASE_SECONDS', 300),
+            help='Segundos de concesión de cada job. El worker la renueva mientras lo ejecuta; '
+                 'si vence sin renovarse, el job se devuelve a la cola.',
+        )
+
+    def handle(self, *args, **options):
+        if options['processes'] <= 1:
+            _run_worker(options)
+            return
+
+        connections.close_all()
+        processes = [
+            multiprocessing.Process(target=_run_worker, args=(options,), daemon=False)
+            for _ in range(options['processes'])
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+            for process in processes:
+                process.join()
@@ -0,0 +1,45 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pendiente'),
+        (STATUS_RUNNING, 'En Ejecución'),
+        (STATUS_DONE, 'Completada'),
+        (STATUS_FAILED, 'Fallida'),
+    ]
+
+    task = models.CharField(max_length=255, verbose_name='Tarea')
+    queue = models.CharField(max_length=50, default='default', verbose_name='Cola')
+    args = models.JSONField(default=list, blank=True, verbose_name='Argumentos')
+    kwargs = models.JSONField(default=dict, blank=True, verbose_name='Argumentos con Nombre')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name='Estado')
+    attempts = models.PositiveIntegerField(default=0, verbose_name='Intentos')
+    max_attempts = models.PositiveIntegerField(default=5, verbose_name='Máximo de Intentos')
+    run_at = models.DateTimeField(default=timezone.now, verbose_name='Ejecutar Desde')
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name='Worker')
+    locked_at = models.DateTimeField(blank=True, null=True, verbose_name='Tomada En')
+    # El worker la renueva mientras ejecuta el job: solo un job con la
+    # concesión vencida se considera abandonado.
+    lease_expires_at = models.DateTimeField(blank=True, null=True, verbose_name='Concesión Hasta')
+    last_error = models.TextField(blank=True, verbose_name='Último Error')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')
+
+    class Meta:
+        db_table = 'jobs'
+        verbose_name = 'Tarea'
+        verbose_name_plural = 'Tareas'
+        ordering = ['run_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'queue', 'run_at'], name='jobs_claim_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk}"
@@ -0,0 +1,199 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+
+class Task:
+    def __init__(self, func, queue='default', max_attempts=5, every=None):
+        self.func = func
+        self.name = f'{func.__module__}.{func.__qualname__}'
+        self.queue = queue
+        self.max_attempts = max_attempts
+        self.every = every
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def __repr__(self):
+        return f'<Task {self.name}>'
+
+
+def task(func=None, *, queue='default', max_attempts=5, every=None):
+    """
+    Registra una función como tarea encolable. Solo las funciones registradas
+    pueden ejecutarse desde la tabla de jobs.
+
+    Con ``every`` (segundos) el worker además la encola periódicamente, sin
+    argumentos, como barrido de lo que haya quedado sin procesar.
+    """
+    def decorator(func):
+        registered = Task(func, queue=queue, max_attempts=max_attempts, every=every)
+        _registry[registered.name] = registered
+        return registered
+
+    return decorator(func) if func else decorator
+
+
+def get_task(name):
+    try:
+        return _registry[name]
+    except KeyError:
+        raise LookupError(f"La tarea '{name}' no está registrada.")
+
+
+def periodic_tasks():
+    return [registered for registered in _registry.values() if registered.every]
+
+
+def enqueue_periodic(registered):
+    """Encola ``registered`` salvo que ya tenga un job pendiente que toque ahora."""
+    due = Job.objects.filter(task=registered.name, status=Job.STATUS_PENDING, run_at__lte=timezone.now())
+    if due.exists():
+        return None
+    return enqueue(registered)
+
+
+def enqueue(func, *args, **kwargs):
+    """
+    Encola ``func(*args, **kwargs)``. El job se inserta en la transacción
+    actual, así que solo se ejecuta si esta se confirma. Los argumentos deben
+    ser serializables a JSON.
+    """
+    return enqueue_at(timezone.now(), func, *args, **kwargs)
+
+
+def enqueue_at(run_at, func, *args, **kwargs):
+    """
+    Como ``enqueue``, pero el job no se toma antes de ``run_at``. En modo
+    eager los jobs programados a futuro quedan para el worker.
+    """
+    registered = func if isinstance(func, Task) else get_task(func)
+
+    job = Job.objects.create(
+        task=registered.name,
+        queue=registered.queue,
+        args=list(args),
+        kwargs=kwargs,
+        max_attempts=registered.max_attempts,
+        run_at=run_at,
+    )
+
+    if getattr(settings, 'JOBS_EAGER', False) and run_at <= timezone.now():
+        transaction.on_commit(lambda: run_job(job.pk), robust=True)
+
+    return job
+
+
+def enqueue_many(func, calls):
+    """
+    Encola una ejecución de ``func`` por cada tupla de argumentos en
+    ``calls`` con un único INSERT.
+    """
+    registered = func if isinstance(func, Task) else get_task(func)
+
+    jobs = Job.objects.bulk_create([
+        Job(
+            task=registered.name,
+            queue=registered.queue,
+            args=list(args),
+            max_attempts=registered.max_attempts,
+        )
+        for args in calls
+    ])
+
+    if getattr(settings, 'JOBS_EAGER', False):
+        for job in jobs:
+            transaction.on_commit(lambda pk=job.pk: run_job(pk), robust=True)
+
+    return jobs
+
+
+def lease_expiry(lease=None):
+    if lease is None:
+        lease = getattr(settings, 'JOBS_LEASE_SECONDS', 300)
+    return timezone.now() + timedelta(seconds=lease)
+
+
+def run_job(job_id, worker_name='eager', lease=None):
+    # El UPDATE condicional es el "lock": si otro worker ya tomó el job no
+    # afecta ninguna fila. El intento se cuenta al tomarlo para que un worker
+    # que muere a mitad de ejecución también consuma un intento.
+    claimed = Job.objects.filter(pk=job_id, status=Job.STATUS_PENDING).update(
+        status=Job.STATUS_RUNNING,
+        locked_by=worker_name,
+        locked_at=timezone.now(),
+        lease_expires_at=lease_expiry(lease),
+        attempts=F('attempts') + 1,
+    )
+    if not claimed:
+        return None
+
+    job = Job.objects.get(pk=job_id)
+
+    try:
+        get_task(job.task)(*job.args, **job.kwargs)
+    except Exception as e:
+        logger.exception(f"Falló el job {job}: {e}")
+        job.last_error = f'{type(e).__name__}: {e}'
+
+        if job.attempts >= job.max_attempts:
+            job.status = Job.STATUS_FAILED
+        else:
+            job.status = Job.STATUS_PENDING
+            job.run_at = timezone.now() + retry_delay(job.attempts)
+    else:
+        job.status = Job.STATUS_DONE
+        job.last_error = ''
+
+    # Si la concesión venció y el job se volvió a tomar, el resultado es del
+    # nuevo intento: solo se escribe si la fila sigue siendo de este.
+    Job.objects.filter(
+        pk=job.pk, status=Job.STATUS_RUNNING, locked_by=worker_name, attempts=job.attempts
+    ).update(
+        status=job.status,
+        run_at=job.run_at,
+        last_error=job.last_error,
+        locked_by='',
+        locked_at=None,
+        lease_expires_at=None,
+        updated_at=timezone.now(),
+    )
+    return job
+
+
+def retry_delay(attempts):
+    base = getattr(settings, 'JOBS_RETRY_BASE_SECONDS', 10)
+    limit = getattr(settings, 'JOBS_RETRY_MAX_SECONDS', 3600)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), limit))
+
+
+def renew_leases(job_ids, worker_name, lease=None):
+    """Extiende la concesión de los jobs que ``worker_name`` sigue ejecutando."""
+    if not job_ids:
+        return 0
+    return Job.objects.filter(pk__in=job_ids, status=Job.STATUS_RUNNING, locked_by=worker_name).update(
+        lease_expires_at=lease_expiry(lease)
+    )
+
+
+def release_stale_jobs():
+    """
+    Devuelve a la cola los jobs cuya concesión venció: su worker murió o dejó
+    de renovarla. Un job lento pero vivo no se toca, así no corre dos veces.
+    """
+    stale = Job.objects.filter(status=Job.STATUS_RUNNING, lease_expires_at__lt=timezone.now())
+    released = {'locked_by': '', 'locked_at': None, 'lease_expires_at': None}
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status=Job.STATUS_FAILED, last_error='Worker interrumpido.', **released
+    )
+    return stale.update(status=Job.STATUS_PENDING, **released)
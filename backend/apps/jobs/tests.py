@@ -0,0 +1,195 @@
+import signal
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from .models import Job
+from .queue import _registry, enqueue, enqueue_many, release_stale_jobs, renew_leases, run_job, task
+from .worker import Worker
+
+calls = []
+
+
+@task(max_attempts=3)
+def record(value):
+    calls.append(value)
+
+
+@task(max_attempts=2)
+def explode():
+    raise ValueError('sin conexión')
+
+
+@task
+def steal_lease():
+    # Simula que la concesión venció y otro worker retomó el job a mitad de ejecución.
+    Job.objects.filter(task=steal_lease.name).update(locked_by='otro-worker', attempts=2)
+
+
+@override_settings(JOBS_EAGER=False, JOBS_RETRY_BASE_SECONDS=10, JOBS_LEASE_SECONDS=300)
+class QueueTests(TestCase):
+
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_stores_a_pending_job(self):
+        job = enqueue(record, 'a')
+
+        job.refresh_from_db()
+        self.assertEqual((job.task, job.status, job.args, job.max_attempts), (record.name, Job.STATUS_PENDING, ['a'], 3))
+        self.assertEqual(calls, [])
+
+    def test_enqueue_many_uses_a_single_insert(self):
+        with self.assertNumQueries(1):
+            jobs = enqueue_many(record, [('a',), ('b',), ('c',)])
+
+        self.assertEqual(sorted(job.args[0] for job in Job.objects.filter(pk__in=[job.pk for job in jobs])), ['a', 'b', 'c'])
+
+    @override_settings(JOBS_EAGER=True)
+    def test_eager_jobs_run_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = enqueue(record, 'a')
+            self.assertEqual(calls, [])
+
+        self.assertEqual(calls, ['a'])
+        self.assertEqual(Job.objects.get(pk=job.pk).status, Job.STATUS_DONE)
+
+    def test_a_job_is_claimed_only_once(self):
+        job = enqueue(record, 'a')
+
+        self.assertIsNotNone(run_job(job.pk, worker_name='w1'))
+        self.assertIsNone(run_job(job.pk, worker_name='w2'))
+
+        job.refresh_from_db()
+        self.assertEqual(calls, ['a'])
+        self.assertEqual((job.status, job.attempts, job.locked_by, job.lease_expires_at), (Job.STATUS_DONE, 1, '', None))
+
+    def test_failed_job_is_retried_with_backoff_until_max_attempts(self):
+        job = enqueue(explode)
+
+        before = timezone.now()
+        with self.assertLogs('apps.jobs.queue', 'ERROR'):
+            run_job(job.pk)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.STATUS_PENDING, 1))
+        self.assertEqual(job.last_error, 'ValueError: sin conexión')
+        self.assertGreaterEqual(job.run_at, before + timedelta(seconds=10))
+
+        with self.assertLogs('apps.jobs.queue', 'ERROR'):
+            run_job(job.pk)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.STATUS_FAILED, 2))
+
+    def test_live_leases_are_not_reclaimed(self):
+        job = enqueue(record, 'a')
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.STATUS_RUNNING, locked_by='w1', attempts=1,
+            # Tomado hace una hora, pero con la concesión renovada: sigue vivo.
+            locked_at=timezone.now() - timedelta(hours=1), lease_expires_at=timezone.now() + timedelta(seconds=60),
+        )
+
+        self.assertEqual(release_stale_jobs(), 0)
+        self.assertEqual(Job.objects.get(pk=job.pk).status, Job.STATUS_RUNNING)
+
+    def test_expired_leases_are_reclaimed(self):
+        running = {'status': Job.STATUS_RUNNING, 'locked_by': 'w1', 'lease_expires_at': timezone.now() - timedelta(seconds=1)}
+        retryable = enqueue(record, 'a')
+        exhausted = enqueue(record, 'b')
+        Job.objects.filter(pk=retryable.pk).update(attempts=1, **running)
+        Job.objects.filter(pk=exhausted.pk).update(attempts=3, **running)
+
+        self.assertEqual(release_stale_jobs(), 1)
+
+        retryable.refresh_from_db()
+        exhausted.refresh_from_db()
+        self.assertEqual((retryable.status, retryable.locked_by, retryable.lease_expires_at), (Job.STATUS_PENDING, '', None))
+        self.assertEqual((exhausted.status, exhausted.last_error), (Job.STATUS_FAILED, 'Worker interrumpido.'))
+
+    def test_renewing_extends_only_the_workers_own_leases(self):
+        expires = timezone.now() + timedelta(seconds=5)
+        own, other = enqueue(record, 'a'), enqueue(record, 'b')
+        Job.objects.filter(pk=own.pk).update(status=Job.STATUS_RUNNING, locked_by='w1', lease_expires_at=expires)
+        Job.objects.filter(pk=other.pk).update(status=Job.STATUS_RUNNING, locked_by='w2', lease_expires_at=expires)
+
+        self.assertEqual(renew_leases([own.pk, other.pk], 'w1'), 1)
+
+        self.assertGreater(Job.objects.get(pk=own.pk).lease_expires_at, expires + timedelta(seconds=200))
+        self.assertEqual(Job.objects.get(pk=other.pk).lease_expires_at, expires)
+
+    def test_result_is_not_written_after_losing_the_lease(self):
+        job = enqueue(steal_lease)
+
+        run_job(job.pk, worker_name='w1')
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by), (Job.STATUS_RUNNING, 'otro-worker'))
+
+
+@override_settings(JOBS_EAGER=False)
+class WorkerTests(TransactionTestCase):
+    """Los jobs corren en los hilos del pool, con su propia conexión: sin TestCase."""
+
+    def setUp(self):
+        calls.clear()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+
+    def test_worker_runs_pending_jobs_in_order_and_stops(self):
+        worker = Worker(threads=1, poll_interval=0.01)
+
+        @task
+        def stop_worker():
+            worker.stop()
+
+        enqueue_many(record, [('a',), ('b',)])
+        enqueue(stop_worker)
+        future = enqueue(record, 'futuro')
+        Job.objects.filter(pk=future.pk).update(run_at=timezone.now() + timedelta(hours=1))
+
+        with self.assertLogs('apps.jobs.worker', 'INFO'):
+            worker.run()
+
+        self.assertEqual(calls, ['a', 'b'])
+        self.assertEqual(
+            # Sin contar los barridos periódicos que el worker encola al arrancar.
+            list(Job.objects.filter(task__startswith=__name__).order_by('id').values_list('status', flat=True)),
+            [Job.STATUS_DONE, Job.STATUS_DONE, Job.STATUS_DONE, Job.STATUS_PENDING],
+        )
+        self.assertEqual(worker.in_flight, set())
+
+    @mock.patch.dict(_registry)
+    def test_periodic_tasks_are_enqueued_once_per_interval(self):
+        sweep = task(every=60)(lambda: None)
+        worker = Worker()
+
+        with mock.patch('apps.jobs.worker.time.monotonic', return_value=1000):
+            worker.schedule_periodic()
+            worker.schedule_periodic()
+        self.assertEqual(Job.objects.filter(task=sweep.name).count(), 1)
+
+        # Pasado el intervalo no se acumula otro mientras el anterior siga pendiente...
+        with mock.patch('apps.jobs.worker.time.monotonic', return_value=1061):
+            worker.schedule_periodic()
+        self.assertEqual(Job.objects.filter(task=sweep.name).count(), 1)
+
+        # ...pero sí cuando ya se ejecutó.
+        run_job(Job.objects.get(task=sweep.name).pk)
+        with mock.patch('apps.jobs.worker.time.monotonic', return_value=1122):
+            worker.schedule_periodic()
+        self.assertEqual(
+            list(Job.objects.filter(task=sweep.name).values_list('status', flat=True).order_by('id')),
+            [Job.STATUS_DONE, Job.STATUS_PENDING],
+        )
+
+    def test_heartbeat_renews_the_jobs_in_flight(self):
+        worker = Worker(lease=600)
+        job = enqueue(record, 'a')
+        expires = timezone.now() + timedelta(seconds=5)
+        Job.objects.filter(pk=job.pk).update(status=Job.STATUS_RUNNING, locked_by=worker.name, lease_expires_at=expires)
+        worker.in_flight.add(job.pk)
+
+        worker.heartbeat()
+
+        self.assertGreater(Job.objects.get(pk=job.pk).lease_expires_at, expires + timedelta(seconds=500))
@@ -0,0 +1,114 @@
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from .models import Job
+from .queue import enqueue_periodic, periodic_tasks, release_stale_jobs, renew_leases, run_job
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    def __init__(self, queues=None, threads=4, poll_interval=1.0, lease=300, retention_days=7):
+        self.queues = queues or ['default']
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.retention_days = retention_days
+        self.name = f'{socket.gethostname()}:{os.getpid()}'
+        self.stopping = threading.Event()
+        self.in_flight = set()
+        self.lock = threading.Lock()
+        self.periodic_due = {}
+
+    def stop(self, *args):
+        logger.info(f"Worker {self.name} detenido: terminando los jobs en curso.")
+        self.stopping.set()
+
+    def run(self):
+        autodiscover_modules('tasks')
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        logger.info(f"Worker {self.name} escuchando {', '.join(self.queues)} con {self.threads} hilos.")
+        last_maintenance = last_heartbeat = 0
+
+        with ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='job') as pool:
+            while not self.stopping.is_set():
+                close_old_connections()
+
+                if time.monotonic() - last_maintenance > 60:
+                    self.maintenance()
+                    last_maintenance = time.monotonic()
+
+                # Renovar con margen: un job vivo nunca llega a vencer su concesión.
+                if time.monotonic() - last_heartbeat > self.lease / 3:
+                    self.heartbeat()
+                    last_heartbeat = time.monotonic()
+
+                submitted = 0
+                for job_id in self.next_job_ids(self.threads - len(self.in_flight)):
+                    with self.lock:
+                        self.in_flight.add(job_id)
+                    pool.submit(self.execute, job_id)
+                    submitted += 1
+
+                if not submitted:
+                    self.stopping.wait(self.poll_interval)
+
+    def next_job_ids(self, limit):
+        if limit <= 0:
+            return []
+
+        with self.lock:
+            busy = set(self.in_flight)
+
+        candidates = Job.objects.filter(
+            status=Job.STATUS_PENDING, queue__in=self.queues, run_at__lte=timezone.now()
+        ).exclude(pk__in=busy).order_by('run_at', 'id')
+
+        return list(candidates.values_list('pk', flat=True)[:limit])
+
+    def execute(self, job_id):
+        try:
+            run_job(job_id, worker_name=self.name, lease=self.lease)
+        except Exception:
+            logger.exception(f"Error inesperado ejecutando el job #{job_id}")
+        finally:
+            close_old_connections()
+            with self.lock:
+                self.in_flight.discard(job_id)
+
+    def heartbeat(self):
+        with self.lock:
+            running = list(self.in_flight)
+        renew_leases(running, self.name, lease=self.lease)
+
+    def maintenance(self):
+        released = release_stale_jobs()
+        if released:
+            logger.warning(f"{released} jobs huérfanos devueltos a la cola.")
+
+        self.schedule_periodic()
+
+        if self.retention_days:
+            cutoff = timezone.now() - timedelta(days=self.retention_days)
+            Job.objects.filter(status=Job.STATUS_DONE, updated_at__lt=cutoff).delete()
+
+    def schedule_periodic(self):
+        # Al arrancar se encolan todas: así se recupera lo que un proceso
+        # caído dejó a medias sin esperar un intervalo completo.
+        now = time.monotonic()
+        for registered in periodic_tasks():
+            if now >= self.periodic_due.get(registered.name, 0):
+                enqueue_periodic(registered)
+                self.periodic_due[registered.name] = now + registered.every
@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.db.models import Count
 from django.utils.html import format_html
+
+from core.renditions import thumbnail_url
 from .models import Project, Category, ProjectImage, ProjectVideo
 
 class ProjectImageInline(admin.TabularInline):
@@ -10,7 +13,7 @@ class ProjectImageInline(admin.TabularInline):
     def image_preview(self, obj):
         if obj.image:
             return format_html(
-                '<img src="{}" style="width: 100px; height: auto;" />', obj.image.url
+                '<img src="{}" style="width: 100px; height: auto;" />', thumbnail_url(obj.image.name, obj.image.storage, obj.renditions_ready)
             )
         return 'No Image'
 
@@ -25,9 +28,12 @@ class CategoryAdmin(admin.ModelAdmin):
     list_display = ('name', 'count_projects')
     search_fields = ('name',)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(projects_count=Count('projects'))
+
+    @admin.display(description='Nº de Proyectos', ordering='projects_count')
     def count_projects(self, obj):
-        return obj.projects.count()
-    count_projects.short_description = 'Nº de Proyectos'
+        return obj.projects_count
 
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
@@ -53,9 +59,12 @@ class ProjectAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        # La portada llega como subconsulta: una sola consulta para toda la página.
+        return super().get_queryset(request).with_cover_image()
+
+    @admin.display(description='Img')
     def main_image_preview(self, obj):
-        first_image = obj.images.first()
-        if first_image and first_image.image:
-            return format_html('<img src="{}" style="width: 50px; height: 50px; object-fit: cover; border-radius: 5px;" />', first_image.image.url)
-        return "-"
-    main_image_preview.short_description = "Img"
\ No newline at end of file
+        if obj.cover_image:
+            return format_html('<img src="{}" style="width: 50px; height: 50px; object-fit: cover; border-radius: 5px;" />', thumbnail_url(obj.cover_image, ready=obj.cover_renditions_ready))
+        return "-"
\ No newline at end of file
@@ -0,0 +1,90 @@
+from django.db.models import CharField, Count, F, Value
+from django.db.models.functions import Cast
+from django_filters.rest_framework import DjangoFilterBackend
+from django_filters.utils import translate_validation
+from rest_framework import filters
+
+from .models import Project
+
+STATUS_LABELS = dict(Project.STATUS_CHOICES)
+
+
+def facet_querysets(view, request):
+    """
+    Un queryset agrupado por cada campo de ``filterset_fields``. Cada faceta
+    aplica la búsqueda y todos los demás filtros activos menos el suyo, para
+    que el usuario vea cuántos resultados tendría al cambiar esa opción.
+    """
+    base = Project.objects.order_by()
+    for backend in view.filter_backends:
+        if issubclass(backend, filters.SearchFilter):
+            base = backend().filter_queryset(request, base, view)
+
+    # Se valida una sola vez (la FK de categoría cuesta una consulta) y luego
+    # se aplica cada filtro por separado.
+    filterset_class = DjangoFilterBackend().get_filterset_class(view, base)
+    filterset = filterset_class(data=request.query_params, queryset=base, request=request)
+    if not filterset.is_valid():
+        raise translate_validation(filterset.errors)
+
+    active = {name: value for name, value in filterset.form.cleaned_data.items() if value not in (None, '')}
+    querysets = []
+
+    for name in view.filterset_fields:
+        queryset = base
+        for other, value in active.items():
+            if other != name:
+                queryset = filterset.filters[other].filter(queryset, value)
+
+        # Los proyectos sin valor no se pueden elegir con el filtro: no son una opción.
+        field = Project._meta.get_field(name)
+        if field.null:
+            queryset = queryset.exclude(**{f'{name}__isnull': True})
+        if field.blank and isinstance(field, CharField):
+            queryset = queryset.exclude(**{name: ''})
+
+        label = F('category__name') if name == 'category' else Value('')
+
+        querysets.append(
+            queryset.order_by()
+            .annotate(
+                facet=Value(name, output_field=CharField()),
+                value=Cast(name, CharField()),
+                label=Cast(label, CharField()),
+            )
+            .values('facet', 'value', 'label')
+            .annotate(count=Count('pk'))
+        )
+
+    return querysets
+
+
+def project_facets(view, request):
+    """Cuenta de proyectos por opción de cada filtro, resuelta en una sola consulta."""
+    querysets = facet_querysets(view, request)
+    facets = {name: [] for name in view.filterset_fields}
+
+    rows = querysets[0].union(*querysets[1:], all=True)
+    for row in rows:
+        if row['facet'] == 'is_featured':
+            # SQLite devuelve 1/0 y PostgreSQL true/false.
+            row['value'] = 'true' if row['value'] in ('1', 'true') else 'false'
+        facets[row['facet']].append({
+            'value': row['value'],
+            'label': _label(row),
+            'count': row['count'],
+        })
+
+    for options in facets.values():
+        options.sort(key=lambda option: (-option['count'], option['label']))
+    return facets
+
+
+def _label(row):
+    if row['facet'] == 'category':
+        return row['label']
+    if row['facet'] == 'status':
+        return STATUS_LABELS.get(row['value'], row['value'])
+    if row['facet'] == 'is_featured':
+        return 'Sí' if row['value'] == 'true' else 'No'
+    return row['value']
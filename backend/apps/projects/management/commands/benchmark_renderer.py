@@ -0,0 +1,77 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from django.utils import timezone
+from rest_framework.response import Response
+
+from core.renderers import CustomJSONRenderer, orjson
+
+from .benchmark_search import LOCATIONS, WORDS
+
+
+class Command(BaseCommand):
+    help = 'Compara el renderizado del sobre JSON con orjson frente al json de la librería estándar.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', nargs='+', type=int, default=[10, 100, 1000])
+        parser.add_argument('--repeat', type=int, default=200)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson no está instalado; solo se medirá json.'))
+
+        random.seed(options['seed'])
+        renderer = CustomJSONRenderer()
+
+        for rows in options['rows']:
+            data = {'results': self._rows(rows), 'meta': {'total': rows, 'page': 1, 'total_pages': 1}}
+            context = {'response': Response(status=200)}
+
+            with override_settings(JSON_FAST_ENCODER=False):
+                expected = renderer.render(data, 'application/json', context)
+                stdlib = self._measure(renderer, data, context, options['repeat'])
+
+            fast = self._measure(renderer, data, context, options['repeat'])
+            if renderer.render(data, 'application/json', context) != expected:
+                raise CommandError(f'La salida rápida difiere de la estándar con {rows} filas.')
+
+            self.stdout.write(
+                f'{rows:>6} filas  {len(expected) / 1024:8.1f} KB   json {stdlib * 1000:8.3f} ms   '
+                f'rápido {fast * 1000:8.3f} ms   x{stdlib / fast:.1f}'
+            )
+
+    def _rows(self, count):
+        now = timezone.now()
+        return [
+            {
+                'id': index,
+                'slug': f'proyecto-{index}',
+                'category': random.randint(1, 5),
+                'category_name': random.choice(WORDS).capitalize(),
+                'name': ' '.join(random.sample(WORDS, 3)).capitalize(),
+                'location': random.choice(LOCATIONS),
+                'area': f'{random.randint(80, 5000)} m²',
+                'year': random.randint(1995, 2025),
+                'status': random.choice(['en_proceso', 'entregado']),
+                'is_featured': random.random() < 0.2,
+                'created_at': now,
+                'cover_image': f'http://localhost/media/projects/images/foto-{index}.jpg',
+                'cover_image_renditions': {
+                    f'{width}w': f'http://localhost/media/projects/images/renditions/foto-{index}.jpg__{width}w.webp'
+                    for width in (160, 480, 960, 1600)
+                },
+            }
+            for index in range(count)
+        ]
+
+    def _measure(self, renderer, data, context, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            renderer.render(data, 'application/json', context)
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
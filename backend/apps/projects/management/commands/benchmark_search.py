@@ -0,0 +1,94 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework import filters
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.projects.models import Category, Project
+from apps.projects.search import ProjectSearchFilter, search_backend
+from apps.projects.views import ProjectViewSet
+
+WORDS = [
+    'vivienda', 'multifamiliar', 'edificio', 'oficinas', 'colegio', 'clínica', 'almacén',
+    'residencial', 'condominio', 'remodelación', 'ampliación', 'estructuras', 'concreto',
+    'armado', 'acabados', 'fachada', 'sótano', 'azotea', 'piscina', 'estacionamiento',
+]
+LOCATIONS = ['Lima', 'Arequipa', 'Trujillo', 'Cusco', 'Piura', 'Chiclayo', 'Huancayo', 'Ica']
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Compara la latencia de la búsqueda indexada frente al SearchFilter con icontains.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10000, 100000])
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--terms', nargs='+', default=['vivienda', 'arequipa', 'concreto armado', 'inexistente'])
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        if search_backend() is None:
+            self.stdout.write(self.style.WARNING(
+                'El motor actual no tiene índice de búsqueda; solo se medirá el SearchFilter.'
+            ))
+
+        random.seed(options['seed'])
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write('Datos de prueba descartados.')
+
+    def _run(self, options):
+        category = Category.objects.create(name=f'benchmark-{time.time_ns()}')
+        view = ProjectViewSet(action='list')
+        created = 0
+
+        for size in sorted(options['sizes']):
+            self._populate(category, created, size)
+            created = size
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{size} proyectos'))
+            for term in options['terms']:
+                request = Request(APIRequestFactory().get('/api/projects/', {'search': term}))
+                legacy = self._measure(filters.SearchFilter(), request, view, options['repeat'])
+                indexed = self._measure(ProjectSearchFilter(), request, view, options['repeat'])
+                self.stdout.write(
+                    f'  {term!r:<20} icontains {legacy * 1000:8.2f} ms   '
+                    f'índice {indexed * 1000:8.2f} ms   x{legacy / indexed:.1f}'
+                )
+
+    def _populate(self, category, start, end, batch_size=5000):
+        for offset in range(start, end, batch_size):
+            Project.objects.bulk_create([
+                Project(
+                    name=' '.join(random.sample(WORDS, 3)).capitalize(),
+                    slug=f'benchmark-{category.pk}-{index}',
+                    category=category,
+                    location=random.choice(LOCATIONS),
+                    description=' '.join(random.choices(WORDS, k=60)),
+                    year=random.randint(1995, 2025),
+                    service_type=random.choice(WORDS),
+                    area=str(random.randint(80, 5000)),
+                    status=random.choice(['en_proceso', 'entregado']),
+                )
+                for index in range(offset, min(offset + batch_size, end))
+            ])
+
+    def _measure(self, backend, request, view, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            queryset = backend.filter_queryset(request, Project.objects.for_list(), view)
+            queryset.count()
+            list(queryset[:10])
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
@@ -0,0 +1,115 @@
+import re
+
+from django.core.exceptions import FieldError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.contact.views import ContactMessageViewSet
+from apps.projects.views import ProjectViewSet
+
+HOT_VIEWSETS = [ProjectViewSet, ContactMessageViewSet]
+
+FULL_SCAN_PATTERNS = {
+    # "SCAN tabla" sin índice; "SCAN tabla USING INDEX" recorre un índice en orden.
+    'sqlite': re.compile(r'\bSCAN (?!.*\b(?:USING|VIRTUAL TABLE)\b)(\S+)'),
+    'postgresql': re.compile(r'Seq Scan on (\S+)'),
+}
+SORT_PATTERNS = {
+    'sqlite': re.compile(r'USE TEMP B-TREE FOR (?:ORDER BY|RIGHT PART OF ORDER BY)'),
+    'postgresql': re.compile(r'\bSort\b'),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Ejecuta EXPLAIN sobre cada combinación de filtro y orden de los listados más usados '
+        'y marca los recorridos completos de tabla.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--show-plans', action='store_true', help='Imprime el plan completo de cada consulta.')
+        parser.add_argument('--warn-only', action='store_true', help='No termina con error si hay recorridos completos.')
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        if vendor not in FULL_SCAN_PATTERNS:
+            raise CommandError(f'Motor no soportado: {vendor}. Use SQLite o PostgreSQL.')
+
+        failures = 0
+        for viewset in HOT_VIEWSETS:
+            self.stdout.write(self.style.MIGRATE_HEADING(viewset.__name__))
+
+            for params in self.combinations(viewset):
+                label = '&'.join(f'{key}={value}' for key, value in params.items()) or '(sin filtros)'
+                try:
+                    plan = self.explain(viewset, params)
+                except FieldError as e:
+                    failures += 1
+                    self.stdout.write(self.style.ERROR(f'  ERROR      {label}: {e}'))
+                    continue
+
+                scans = FULL_SCAN_PATTERNS[vendor].findall(plan)
+                sorted_in_memory = SORT_PATTERNS[vendor].search(plan)
+
+                if scans:
+                    failures += 1
+                    self.stdout.write(self.style.ERROR(f'  FULL SCAN  {label}  ({", ".join(scans)})'))
+                elif sorted_in_memory:
+                    self.stdout.write(self.style.WARNING(f'  SORT       {label}'))
+                else:
+                    self.stdout.write(f'  ok         {label}')
+
+                if options['show_plans']:
+                    self.stdout.write('\n'.join(f'      {line}' for line in plan.splitlines()))
+
+        if failures and not options['warn_only']:
+            raise CommandError(f'{failures} consultas con recorrido completo o error.')
+        if not failures:
+            self.stdout.write(self.style.SUCCESS('Todas las consultas usan índices.'))
+
+    def combinations(self, viewset):
+        samples = {name: self.sample_value(viewset, name) for name in viewset.filterset_fields}
+        filters = [{}] + [{name: value} for name, value in samples.items() if value is not None]
+        orderings = [None] + [
+            f'{prefix}{field}' for field in getattr(viewset, 'ordering_fields', []) for prefix in ('', '-')
+        ]
+
+        for filter_params in filters:
+            for ordering in orderings:
+                params = dict(filter_params)
+                if ordering:
+                    params['ordering'] = ordering
+                yield params
+
+    def sample_value(self, viewset, name):
+        field = viewset.queryset.model._meta.get_field(name)
+
+        if isinstance(field, models.BooleanField):
+            return 'true'
+        if field.is_relation:
+            pk = field.related_model.objects.values_list('pk', flat=True).first()
+            return str(pk) if pk is not None else None
+        if field.choices:
+            return str(field.choices[0][0])
+        if isinstance(field, models.IntegerField):
+            return '2020'
+        if isinstance(field, models.EmailField):
+            return 'cliente@example.com'
+        return 'muestra'
+
+    def explain(self, viewset, params):
+        request = Request(APIRequestFactory().get('/', params))
+        view = viewset(action='list', request=request, format_kwarg=None, args=(), kwargs={})
+
+        queryset = view.filter_queryset(view.get_queryset())
+        page_size = getattr(view.paginator, 'page_size', None) or 10
+
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Con pocas filas PostgreSQL prefiere Seq Scan aunque exista el
+                # índice; así se comprueba que haya uno que el planificador pueda usar.
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+            return queryset[:page_size].explain()
@@ -0,0 +1,56 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.contact.views import ContactMessageViewSet
+from apps.projects.views import ProjectViewSet
+from core.export import export_stream
+
+EXPORTS = {
+    'mensajes': ContactMessageViewSet,
+    'proyectos': ProjectViewSet,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Exporta mensajes de contacto o proyectos a CSV o NDJSON con el mismo código y '
+        'los mismos filtros que el endpoint export/.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('resource', choices=sorted(EXPORTS))
+        parser.add_argument('--format', choices=['csv', 'ndjson'], default='csv')
+        parser.add_argument('--output', '-o', help='Archivo de salida; por defecto la salida estándar.')
+        parser.add_argument(
+            '--filter', action='append', default=[], metavar='CAMPO=VALOR',
+            help='Mismos parámetros que la API, p. ej. --filter is_read=false --filter search=cocina.',
+        )
+
+    def handle(self, *args, **options):
+        params = {}
+        for item in options['filter']:
+            name, sep, value = item.partition('=')
+            if not sep:
+                raise CommandError(f'Filtro inválido: {item!r}. Use CAMPO=VALOR.')
+            params[name] = value
+
+        viewset = EXPORTS[options['resource']]
+        request = Request(APIRequestFactory().get('/', params))
+        view = viewset(action='export', request=request, format_kwarg=None, args=(), kwargs={})
+
+        try:
+            queryset = view.get_export_queryset()
+        except ValidationError as e:
+            raise CommandError(f'Filtros inválidos: {e.detail}')
+
+        stream = export_stream(queryset, view.export_fields, options['format'], view.export_chunk_size)
+
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                output.writelines(stream)
+        else:
+            sys.stdout.buffer.writelines(stream)
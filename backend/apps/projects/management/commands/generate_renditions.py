@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.company.models import AboutUs, ClientLogo, Service
+from apps.projects.models import ProjectImage
+from core.renditions import generate_renditions
+
+IMAGE_MODELS = (ProjectImage, ClientLogo, Service, AboutUs)
+
+
+class Command(BaseCommand):
+    help = 'Genera las renditions WebP de las imágenes que aún no las tengan y las marca como listas.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Regenera aunque ya existan.')
+
+    def handle(self, *args, **options):
+        for model in IMAGE_MODELS:
+            total = 0
+            queryset = model.objects.exclude(image='').exclude(image__isnull=True)
+            if not options['force']:
+                queryset = queryset.filter(renditions_ready=False)
+            for obj in queryset.only('pk', 'image').iterator():
+                if generate_renditions(obj.image.name, obj.image.storage, force=options['force']):
+                    total += 1
+            self.stdout.write(f'{model._meta.verbose_name_plural}: {total} imágenes procesadas.')
@@ -0,0 +1,59 @@
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS project_search USING fts5(
+        name, location, service_type, area, status, description,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    INSERT INTO project_search (rowid, name, location, service_type, area, status, description)
+    SELECT id, COALESCE(name, ''), COALESCE(location, ''), COALESCE(service_type, ''),
+           COALESCE(area, ''), COALESCE(status, ''), COALESCE(description, '')
+    FROM projects
+    """,
+]
+
+SQLITE_BACKWARD = [
+    'DROP TABLE IF EXISTS project_search',
+]
+
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE projects ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('spanish', COALESCE(name, '')), 'A') ||
+        setweight(to_tsvector('spanish', COALESCE(location, '') || ' ' || COALESCE(service_type, '')), 'B') ||
+        setweight(to_tsvector('spanish', COALESCE(area, '') || ' ' || COALESCE(status, '')), 'C') ||
+        setweight(to_tsvector('spanish', COALESCE(description, '')), 'D')
+    ) STORED
+    """,
+    'CREATE INDEX projects_search_vector_gin ON projects USING GIN (search_vector)',
+]
+
+POSTGRESQL_BACKWARD = [
+    'DROP INDEX IF EXISTS projects_search_vector_gin',
+    'ALTER TABLE projects DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        statements = statements_by_vendor.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_alter_project_category'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRESQL_FORWARD}),
+            _run({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRESQL_BACKWARD}),
+        ),
+    ]
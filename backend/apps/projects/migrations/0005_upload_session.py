@@ -0,0 +1,36 @@
+# Generated by Django 6.0 on 2026-10-18 15:10
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_project_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('image', 'Imagen'), ('video', 'Video')], max_length=10, verbose_name='Tipo')),
+                ('filename', models.CharField(max_length=255, verbose_name='Nombre del Archivo')),
+                ('total_size', models.PositiveBigIntegerField(verbose_name='Tamaño Total')),
+                ('received_size', models.PositiveBigIntegerField(default=0, verbose_name='Bytes Recibidos')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Creado por')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to='projects.project', verbose_name='Proyecto')),
+            ],
+            options={
+                'verbose_name': 'Subida en Progreso',
+                'verbose_name_plural': 'Subidas en Progreso',
+                'db_table': 'upload_sessions',
+            },
+        ),
+    ]
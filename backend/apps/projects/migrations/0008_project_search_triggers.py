@@ -0,0 +1,70 @@
+from django.db import migrations
+
+# Los triggers mantienen project_search también con bulk_create() y update(),
+# que no disparan señales. Solo se reindexa si cambia algún campo buscable.
+SQLITE_FORWARD = [
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_search_insert AFTER INSERT ON projects BEGIN
+        INSERT INTO project_search (rowid, name, location, service_type, area, status, description)
+        VALUES (new.id, COALESCE(new.name, ''), COALESCE(new.location, ''), COALESCE(new.service_type, ''),
+                COALESCE(new.area, ''), COALESCE(new.status, ''), COALESCE(new.description, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_search_update AFTER UPDATE ON projects
+    WHEN old.id IS NOT new.id
+      OR old.name IS NOT new.name
+      OR old.location IS NOT new.location
+      OR old.service_type IS NOT new.service_type
+      OR old.area IS NOT new.area
+      OR old.status IS NOT new.status
+      OR old.description IS NOT new.description
+    BEGIN
+        DELETE FROM project_search WHERE rowid = old.id;
+        INSERT INTO project_search (rowid, name, location, service_type, area, status, description)
+        VALUES (new.id, COALESCE(new.name, ''), COALESCE(new.location, ''), COALESCE(new.service_type, ''),
+                COALESCE(new.area, ''), COALESCE(new.status, ''), COALESCE(new.description, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_search_delete AFTER DELETE ON projects BEGIN
+        DELETE FROM project_search WHERE rowid = old.id;
+    END
+    """,
+    # Recupera las filas que se crearon o editaron sin pasar por las señales.
+    'DELETE FROM project_search',
+    """
+    INSERT INTO project_search (rowid, name, location, service_type, area, status, description)
+    SELECT id, COALESCE(name, ''), COALESCE(location, ''), COALESCE(service_type, ''),
+           COALESCE(area, ''), COALESCE(status, ''), COALESCE(description, '')
+    FROM projects
+    """,
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS projects_search_insert',
+    'DROP TRIGGER IF EXISTS projects_search_update',
+    'DROP TRIGGER IF EXISTS projects_search_delete',
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        statements = statements_by_vendor.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_project_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD}),
+            _run({'sqlite': SQLITE_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0008_project_search_triggers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectimage',
+            name='renditions_ready',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Renditions Generadas'),
+        ),
+    ]
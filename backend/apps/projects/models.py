@@ -1,5 +1,10 @@
+import os
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
 from django.core.validators import FileExtensionValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils.text import slugify
 
 from core.validators import validate_image_size, validate_video_size
@@ -7,6 +12,7 @@ from core.validators import validate_image_size, validate_video_size
 class Category(models.Model):
     name = models.CharField(max_length=100, unique=True, verbose_name='Nombre de la Categoría')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'categories'
@@ -16,6 +22,75 @@ class Category(models.Model):
     def __str__(self):
         return self.name
 
+SLUG_BASE_MAX_LENGTH = 240
+SLUG_SAVE_ATTEMPTS = 5
+
+def slug_base(name):
+    return slugify(name)[:SLUG_BASE_MAX_LENGTH]
+
+class ProjectQuerySet(models.QuerySet):
+    LIST_FIELDS = (
+        'id', 'slug', 'name', 'category_id', 'category__name', 'location',
+        'area', 'year', 'status', 'is_featured', 'created_at',
+    )
+
+    def with_cover_image(self):
+        cover = ProjectImage.objects.filter(project=models.OuterRef('pk')).order_by('id')
+        return self.annotate(
+            cover_image=models.Subquery(cover.values('image')[:1]),
+            cover_renditions_ready=models.Subquery(cover.values('renditions_ready')[:1]),
+        )
+
+    def for_list(self, cover=True):
+        queryset = self.select_related('category').only(*self.LIST_FIELDS)
+        return queryset.with_cover_image() if cover else queryset
+
+    def allocate_slugs(self, names):
+        """
+        Devuelve un slug libre por cada nombre con una sola consulta: se leen
+        los slugs ``base`` y ``base-N`` existentes y se toma el mayor N + 1.
+
+        Un sufijo solo cuenta si la fila es del mismo nombre: el slug de
+        "Edificio 2024" es su propia base, no el número 2024 de "Edificio".
+        """
+        bases = [slug_base(name) for name in names]
+        if not bases:
+            return []
+
+        lookup = models.Q()
+        for base in set(bases):
+            lookup |= models.Q(slug=base) | models.Q(slug__startswith=f'{base}-')
+
+        taken = set()
+        suffixes = defaultdict(set)
+        for slug, name in self.model.objects.filter(lookup).values_list('slug', 'name'):
+            taken.add(slug)
+            own_base = slug_base(name)
+            suffix = slug[len(own_base) + 1:] if slug.startswith(f'{own_base}-') else ''
+            if suffix.isdigit():
+                suffixes[own_base].add(int(suffix))
+
+        slugs = []
+        for base in bases:
+            slug = base
+            if base in taken:
+                number = max(suffixes[base], default=0) + 1
+                # Una fila renombrada conserva su slug: también hay que saltarla.
+                while f'{base}-{number}' in taken:
+                    number += 1
+                suffixes[base].add(number)
+                slug = f'{base}-{number}'
+            taken.add(slug)
+            slugs.append(slug)
+        return slugs
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        pending = [obj for obj in objs if not obj.slug]
+        for obj, slug in zip(pending, self.allocate_slugs([obj.name for obj in pending])):
+            obj.slug = slug
+        return super().bulk_create(objs, *args, **kwargs)
+
 class Project(models.Model):
     STATUS_CHOICES = [
         ('en_proceso', 'En Ejecución'),
@@ -39,23 +114,41 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')
 
+    objects = ProjectQuerySet.as_manager()
+
     class Meta:
         db_table = 'projects'
         verbose_name = 'Proyecto'
         verbose_name_plural = 'Proyectos'
         ordering = ['-created_at']
+        # Los filtros públicos siempre ordenan por -created_at: cada índice
+        # resuelve el filtro y entrega las filas ya ordenadas.
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], name='projects_created_idx'),
+            models.Index(fields=['is_featured', '-created_at'], name='projects_featured_idx'),
+            models.Index(fields=['status', '-created_at'], name='projects_status_idx'),
+            models.Index(fields=['category', '-created_at'], name='projects_category_idx'),
+            models.Index(fields=['year', '-created_at'], name='projects_year_idx'),
+            models.Index(fields=['service_type', '-created_at'], name='projects_service_type_idx'),
+            models.Index(fields=['name'], name='projects_name_idx'),
+        ]
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-
-            original_slug = self.slug
-            counter = 1
-            while Project.objects.filter(slug=self.slug).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
-
-        super().save(*args, **kwargs)
+        if self.slug:
+            return super().save(*args, **kwargs)
+
+        # Si otra petición toma el mismo slug entre la lectura y el INSERT,
+        # la restricción UNIQUE lo detecta y se reintenta con el siguiente.
+        for attempt in range(SLUG_SAVE_ATTEMPTS):
+            self.slug = Project.objects.allocate_slugs([self.name])[0]
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                slug_taken = Project.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                self.slug = ''
+                if not slug_taken or attempt == SLUG_SAVE_ATTEMPTS - 1:
+                    raise
 
     def __str__(self):
         return self.name
@@ -67,6 +160,7 @@ class ProjectImage(models.Model):
         verbose_name='Imagen',
         validators=[validate_image_size, FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'webp'])],
     )
+    renditions_ready = models.BooleanField(default=False, editable=False, verbose_name='Renditions Generadas')
 
     class Meta:
         db_table = 'project_images'
@@ -88,3 +182,37 @@ class ProjectVideo(models.Model):
         db_table = 'project_videos'
         verbose_name = 'Video de Proyecto'
         verbose_name_plural = 'Videos de Proyectos'
+
+class UploadSession(models.Model):
+    KIND_CHOICES = [
+        ('image', 'Imagen'),
+        ('video', 'Video'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='upload_sessions', verbose_name='Proyecto')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name='Tipo')
+    filename = models.CharField(max_length=255, verbose_name='Nombre del Archivo')
+    total_size = models.PositiveBigIntegerField(verbose_name='Tamaño Total')
+    received_size = models.PositiveBigIntegerField(default=0, verbose_name='Bytes Recibidos')
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, verbose_name='Creado por'
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')
+
+    class Meta:
+        db_table = 'upload_sessions'
+        verbose_name = 'Subida en Progreso'
+        verbose_name_plural = 'Subidas en Progreso'
+
+    @property
+    def temp_path(self):
+        return os.path.join(settings.CHUNKED_UPLOAD_DIR, f'{self.pk}.part')
+
+    @property
+    def is_complete(self):
+        return self.received_size == self.total_size
+
+    def __str__(self):
+        return f"{self.filename} ({self.received_size}/{self.total_size})"
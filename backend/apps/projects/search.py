@@ -0,0 +1,151 @@
+import re
+
+from django.db import connections, transaction
+from rest_framework import filters
+
+from .models import Project
+
+SEARCH_TABLE = 'project_search'
+SEARCH_COLUMNS = ('name', 'location', 'service_type', 'area', 'status', 'description')
+SEARCH_WEIGHTS = (10.0, 4.0, 2.0, 1.0, 1.0, 1.0)
+SEARCH_CONFIG = 'spanish'
+
+TOKEN_RE = re.compile(r'\w+')
+
+_COLUMNS = ', '.join(SEARCH_COLUMNS)
+_NEW_VALUES = ', '.join(f"COALESCE(new.{column}, '')" for column in SEARCH_COLUMNS)
+_CHANGED = '\n      OR '.join(f'old.{column} IS NOT new.{column}' for column in ('id', *SEARCH_COLUMNS))
+
+# Mantienen project_search también con bulk_create() y update(). En SQLite un
+# AlterField recrea la tabla projects y se lleva sus triggers: por eso se
+# comprueban al arrancar y después de cada migrate (ver ensure_search_triggers).
+SEARCH_TRIGGERS = {
+    'projects_search_insert': f"""
+    CREATE TRIGGER IF NOT EXISTS projects_search_insert AFTER INSERT ON projects BEGIN
+        INSERT INTO {SEARCH_TABLE} (rowid, {_COLUMNS}) VALUES (new.id, {_NEW_VALUES});
+    END
+    """,
+    'projects_search_update': f"""
+    CREATE TRIGGER IF NOT EXISTS projects_search_update AFTER UPDATE ON projects
+    WHEN {_CHANGED}
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+        INSERT INTO {SEARCH_TABLE} (rowid, {_COLUMNS}) VALUES (new.id, {_NEW_VALUES});
+    END
+    """,
+    'projects_search_delete': f"""
+    CREATE TRIGGER IF NOT EXISTS projects_search_delete AFTER DELETE ON projects BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+    END
+    """,
+}
+
+_fts_tables = set()
+
+
+def search_backend(using='default'):
+    connection = connections[using]
+
+    if connection.vendor == 'postgresql':
+        return 'postgresql'
+    if connection.vendor != 'sqlite':
+        return None
+
+    if using not in _fts_tables:
+        if not ensure_search_triggers(using):
+            return None
+        _fts_tables.add(using)
+    return 'sqlite'
+
+
+def reset_search_backend(using='default'):
+    """Repite la comprobación de ``search_backend`` (p. ej. después de migrar)."""
+    _fts_tables.discard(using)
+    return search_backend(using)
+
+
+def ensure_search_triggers(using='default'):
+    """
+    Comprueba en una sola consulta que existan la tabla FTS5 y sus triggers.
+    Los que falten se recrean y el índice se reconstruye, porque lo escrito
+    mientras no estaban no quedó indexado. False si no hay tabla FTS5.
+    """
+    connection = connections[using]
+    names = [SEARCH_TABLE, *SEARCH_TRIGGERS]
+    placeholders = ', '.join(['%s'] * len(names))
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT name FROM sqlite_master WHERE name IN ({placeholders})', names)
+        existing = {row[0] for row in cursor.fetchall()}
+    if SEARCH_TABLE not in existing:
+        return False
+
+    missing = [name for name in SEARCH_TRIGGERS if name not in existing]
+    if missing:
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            for name in missing:
+                cursor.execute(SEARCH_TRIGGERS[name])
+            _rebuild(cursor)
+    return True
+
+
+def rebuild_index(using='default'):
+    if search_backend(using) != 'sqlite':
+        return
+
+    with connections[using].cursor() as cursor:
+        _rebuild(cursor)
+
+
+def _rebuild(cursor):
+    coalesced = ', '.join(f"COALESCE({column}, '')" for column in SEARCH_COLUMNS)
+    cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+    cursor.execute(
+        f'INSERT INTO {SEARCH_TABLE} (rowid, {_COLUMNS}) '
+        f'SELECT id, {coalesced} FROM {Project._meta.db_table}'
+    )
+
+
+def search_projects(queryset, terms):
+    backend = search_backend(queryset.db)
+    tokens = [token for term in terms for token in TOKEN_RE.findall(term)]
+
+    if backend is None or not tokens:
+        return None
+
+    table = queryset.model._meta.db_table
+
+    if backend == 'sqlite':
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+        return queryset.extra(
+            tables=[SEARCH_TABLE],
+            where=[f'{SEARCH_TABLE}.rowid = {table}.id', f'{SEARCH_TABLE} MATCH %s'],
+            params=[match],
+            select={'search_rank': f'bm25({SEARCH_TABLE}, {weights})'},
+        ).order_by('search_rank', '-created_at')
+
+    tsquery = ' & '.join(f'{token}:*' for token in tokens)
+    return queryset.extra(
+        where=[f"{table}.search_vector @@ to_tsquery('{SEARCH_CONFIG}', %s)"],
+        params=[tsquery],
+        select={'search_rank': f"ts_rank({table}.search_vector, to_tsquery('{SEARCH_CONFIG}', %s))"},
+        select_params=[tsquery],
+    ).order_by('-search_rank', '-created_at')
+
+
+class ProjectSearchFilter(filters.SearchFilter):
+    """
+    Mantiene el parámetro ``?search=`` pero usa el índice FTS5 (SQLite) o el
+    tsvector con índice GIN (PostgreSQL) y ordena por relevancia. En otros
+    motores, o si el índice no existe, vuelve al SearchFilter de DRF.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        results = search_projects(queryset, terms)
+        if results is None:
+            return super().filter_queryset(request, queryset, view)
+        return results
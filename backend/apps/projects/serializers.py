@@ -1,6 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.storage import default_storage
 from django.db import transaction
 from rest_framework import serializers
-from .models import Project, Category, ProjectImage, ProjectVideo
+
+from apps.jobs.queue import enqueue_many
+from core.renditions import RenditionsField
+from core.sparse import SparseFieldsSerializerMixin
+from .models import Project, Category, ProjectImage, ProjectVideo, UploadSession
+from .tasks import create_renditions
+from .uploads import validate_declared_file
 
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
@@ -8,16 +18,56 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class ProjectImageSerializer(serializers.ModelSerializer):
+    image_renditions = RenditionsField(source='image')
+
     class Meta:
         model = ProjectImage
-        fields = ['id', 'image']
+        fields = ['id', 'image', 'image_renditions']
 
 class ProjectVideoSerializer(serializers.ModelSerializer):
     class Meta:
         model = ProjectVideo
         fields = ['id', 'video']
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    category_name = serializers.CharField(source='category.name', read_only=True)
+    cover_image = serializers.SerializerMethodField()
+    cover_image_renditions = RenditionsField(source='cover_image', ready_field='cover_renditions_ready')
+
+    images = ProjectImageSerializer(many=True, read_only=True)
+    videos = ProjectVideoSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Project
+        fields = [
+            'id',
+            'slug',
+            'category',
+            'category_name',
+            'name',
+            'location',
+            'area',
+            'year',
+            'status',
+            'is_featured',
+            'cover_image',
+            'cover_image_renditions',
+            'images',
+            'videos',
+        ]
+        read_only_fields = fields
+        expandable_fields = ['images', 'videos']
+        sparse_sources = {'cover_image': []}
+
+    def get_cover_image(self, obj):
+        if not getattr(obj, 'cover_image', None):
+            return None
+
+        url = ProjectImage._meta.get_field('image').storage.url(obj.cover_image)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+class ProjectSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
 
     images = ProjectImageSerializer(many=True, read_only=True)
@@ -68,6 +118,7 @@ class ProjectSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['id', 'slug', 'category_name', 'created_at', 'updated_at']
+        expandable_fields = ['images', 'videos']
 
     def create(self, validated_data):
         uploaded_images = validated_data.pop('uploaded_images', [])
@@ -109,8 +160,72 @@ class ProjectSerializer(serializers.ModelSerializer):
         return instance
 
     def _save_media(self, project, images, videos):
-        for img in images:
-            ProjectImage.objects.create(project=project, image=img)
+        # Los archivos se escriben en paralelo y las filas se insertan con
+        # bulk_create: sin pre_save por fila, que para filas nuevas no hace nada.
+        image_names = self._store_files(ProjectImage, 'image', images)
+        video_names = self._store_files(ProjectVideo, 'video', videos)
+
+        try:
+            ProjectImage.objects.bulk_create(
+                [ProjectImage(project=project, image=name) for name in image_names]
+            )
+            ProjectVideo.objects.bulk_create(
+                [ProjectVideo(project=project, video=name) for name in video_names]
+            )
+        except Exception:
+            self._discard_files(image_names + video_names)
+            raise
+
+        if image_names:
+            enqueue_many(create_renditions, [(name,) for name in image_names])
+
+    def _store_files(self, model, field_name, files):
+        if not files:
+            return []
+
+        field = model._meta.get_field(field_name)
+
+        def store(upload):
+            name = field.generate_filename(None, upload.name)
+            return field.storage.save(name, upload, max_length=field.max_length)
+
+        with ThreadPoolExecutor(max_workers=min(len(files), settings.MEDIA_UPLOAD_THREADS)) as pool:
+            futures = [pool.submit(store, upload) for upload in files]
+
+        stored = [future.result() for future in futures if not future.exception()]
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            self._discard_files(stored)
+            raise errors[0]
+
+        return stored
+
+    def _discard_files(self, names):
+        for name in names:
+            default_storage.delete(name)
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    project = serializers.SlugRelatedField(slug_field='slug', queryset=Project.objects.all())
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSession
+        fields = [
+            'id',
+            'project',
+            'kind',
+            'filename',
+            'total_size',
+            'received_size',
+            'chunk_size',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = ['id', 'received_size', 'created_at', 'updated_at']
+
+    def get_chunk_size(self, obj):
+        return settings.CHUNKED_UPLOAD_CHUNK_SIZE
 
-        for vid in videos:
-            ProjectVideo.objects.create(project=project, video=vid)
+    def validate(self, attrs):
+        validate_declared_file(attrs['kind'], attrs['filename'], attrs['total_size'])
+        return attrs
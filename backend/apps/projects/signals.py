@@ -1,18 +1,24 @@
-from django.db.models.signals import post_delete, pre_save
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
 from django.dispatch import receiver
-from .models import ProjectImage, ProjectVideo
+from django.utils import timezone
+from apps.jobs.queue import enqueue
+from core.renditions import renditions_created
+from core.response_cache import invalidate_responses
+from .models import Category, Project, ProjectImage, ProjectVideo
+from .search import reset_search_backend
+from .tasks import create_renditions, delete_media_files
 
 
 @receiver(post_delete, sender=ProjectImage)
 def delete_image_file(sender, instance, **kwargs):
     if instance.image:
-        instance.image.delete(False)
+        enqueue(delete_media_files, [instance.image.name], renditions=True)
 
 
 @receiver(post_delete, sender=ProjectVideo)
 def delete_video_file(sender, instance, **kwargs):
     if instance.video:
-        instance.video.delete(False)
+        enqueue(delete_media_files, [instance.video.name])
 
 
 @receiver(pre_save, sender=ProjectImage)
@@ -26,4 +32,48 @@ def delete_old_image_on_update(sender, instance, **kwargs):
 
     new_image = instance.image
     if not old_image == new_image:
-        old_image.delete(False)
+        instance.renditions_ready = False
+        enqueue(delete_media_files, [old_image.name], renditions=True)
+
+
+@receiver(post_save, sender=ProjectImage)
+def create_image_renditions(sender, instance, **kwargs):
+    if instance.image:
+        enqueue(create_renditions, instance.image.name)
+
+
+@receiver(post_save, sender=ProjectImage)
+@receiver(post_save, sender=ProjectVideo)
+@receiver(post_delete, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectVideo)
+def touch_project(sender, instance, **kwargs):
+    # La galería forma parte de la representación del proyecto: cambiarla
+    # debe invalidar su ETag.
+    Project.objects.filter(pk=instance.project_id).update(updated_at=timezone.now())
+
+
+@receiver(renditions_created)
+def mark_image_renditions_ready(sender, name, **kwargs):
+    # Las renditions aparecen en la representación recién cuando existen.
+    if ProjectImage.objects.filter(image=name, renditions_ready=False).update(renditions_ready=True):
+        Project.objects.filter(images__image=name).update(updated_at=timezone.now())
+        invalidate_responses('projects')
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=ProjectImage)
+@receiver(post_save, sender=ProjectVideo)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectVideo)
+def invalidate_project_responses(sender, **kwargs):
+    invalidate_responses('projects')
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using, **kwargs):
+    # En SQLite un AlterField sobre projects recrea la tabla sin los triggers del índice.
+    if sender.label == 'projects':
+        reset_search_backend(using)
@@ -0,0 +1,22 @@
+from django.core.files.storage import default_storage
+
+from apps.jobs.queue import task
+from core.renditions import delete_renditions, generate_renditions
+
+
+@task
+def create_renditions(name):
+    generate_renditions(name)
+
+
+@task
+def remove_renditions(name):
+    delete_renditions(name)
+
+
+@task
+def delete_media_files(names, renditions=False):
+    for name in names:
+        if renditions:
+            delete_renditions(name)
+        default_storage.delete(name)
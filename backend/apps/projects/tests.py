@@ -0,0 +1,411 @@
+import copy
+import csv
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock, skipUnless
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from core.testing import TemporaryMediaMixin, api_client, create_admin, png_bytes, png_file
+
+from .models import SLUG_SAVE_ATTEMPTS, Category, Project, ProjectImage, ProjectQuerySet, ProjectVideo, UploadSession
+from .search import SEARCH_TRIGGERS, _fts_tables, reset_search_backend, search_backend, search_projects
+from .uploads import parse_content_range
+
+
+# Sin caché de respuestas: se mide siempre el camino que llega a la base de datos.
+@override_settings(QUERY_BUDGET_ENFORCE=True, CACHE_SINGLE_PROCESS=False)
+class ProjectApiTests(TemporaryMediaMixin, TestCase):
+    """
+    Cada acción con ``query_budget`` se ejecuta con varios proyectos, imágenes
+    y videos: si algo vuelve a consultar por fila, QueryBudgetMixin falla.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.categories = [Category.objects.create(name=name) for name in ('Vivienda', 'Comercio')]
+        cls.projects = []
+        for index in range(6):
+            project = Project.objects.create(
+                name=f'Edificio {index}',
+                category=cls.categories[index % 2],
+                location='Arequipa',
+                description='Concreto armado y acabados.',
+                year=2020 + index,
+                is_featured=index % 2 == 0,
+            )
+            for _ in range(2):
+                ProjectImage.objects.create(project=project, image=png_file('foto.png'))
+            ProjectVideo.objects.create(project=project, video=SimpleUploadedFile('obra.mp4', b'\x00' * 16))
+            cls.projects.append(project)
+
+        # La detección de la tabla FTS se hace una vez por proceso, no por petición.
+        search_backend()
+
+    def setUp(self):
+        self.client = api_client()
+
+    def test_list(self):
+        response = self.client.get('/api/projects/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [project['slug'] for project in response.data['results']],
+            [project.slug for project in reversed(self.projects)],
+        )
+        self.assertEqual(response.data['meta']['total_records'], 6)
+        self.assertTrue(response.data['results'][0]['cover_image'].endswith('.png'))
+
+    def test_list_with_filters_search_and_expand(self):
+        response = self.client.get('/api/projects/', {
+            'category': self.categories[0].pk, 'search': 'edificio', 'expand': 'images,videos',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {project['slug'] for project in response.data['results']},
+            {project.slug for project in self.projects[::2]},
+        )
+        self.assertEqual(len(response.data['results'][0]['images']), 2)
+        self.assertEqual(len(response.data['results'][0]['videos']), 1)
+
+    def test_list_by_cursor(self):
+        response = self.client.get('/api/projects/', {'cursor': '', 'page_size': 4})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [project['slug'] for project in response.data['results']],
+            [project.slug for project in reversed(self.projects[2:])],
+        )
+        self.assertIsNotNone(response.data['meta']['next'])
+
+    def test_cursor_rejects_other_ordering(self):
+        response = self.client.get('/api/projects/', {'cursor': '', 'ordering': 'name'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('ordering', response.data['errors']['detail'])
+
+    def test_cursor_on_model_without_keyset(self):
+        # ProjectImage no tiene created_at ni declara cursor_ordering.
+        response = self.client.get('/api/project-images/', {'cursor': ''})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors']['detail'], 'Este recurso no admite paginación por cursor.')
+
+    def test_retrieve(self):
+        project = self.projects[0]
+        response = self.client.get(f'/api/projects/{project.slug}/', {'expand': 'images,videos'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], project.name)
+        self.assertEqual(response.data['category_name'], 'Vivienda')
+        self.assertEqual(len(response.data['images']), 2)
+        self.assertEqual(len(response.data['videos']), 1)
+
+    def test_facets(self):
+        response = self.client.get('/api/projects/facets/', {
+            'category': self.categories[0].pk, 'is_featured': 'true', 'search': 'edificio',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        # Cada faceta ignora su propio filtro: las categorías cuentan los
+        # destacados de todas, el año solo los de la categoría elegida.
+        self.assertEqual(
+            response.data['category'],
+            [{'value': str(self.categories[0].pk), 'label': 'Vivienda', 'count': 3}],
+        )
+        self.assertEqual(
+            response.data['is_featured'],
+            [{'value': 'true', 'label': 'Sí', 'count': 3}],
+        )
+        self.assertEqual(sorted(option['value'] for option in response.data['year']), ['2020', '2022', '2024'])
+
+    def test_facets_skip_projects_without_a_value(self):
+        Project.objects.filter(pk__in=[project.pk for project in self.projects[:2]]).update(service_type='Multifamiliar')
+        Project.objects.filter(pk=self.projects[2].pk).update(service_type='', year=None)
+
+        response = self.client.get('/api/projects/facets/')
+
+        self.assertEqual(response.data['service_type'], [{'value': 'Multifamiliar', 'label': 'Multifamiliar', 'count': 2}])
+        self.assertEqual(len(response.data['year']), 5)
+        self.assertNotIn('', [option['value'] for option in response.data['year']])
+
+    def test_conditional_get(self):
+        url = f'/api/projects/{self.projects[0].slug}/'
+        etag = self.client.get(url)['ETag']
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        category = self.projects[0].category
+        category.name = 'Vivienda Multifamiliar'
+        category.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['category_name'], 'Vivienda Multifamiliar')
+
+    def test_export(self):
+        response = api_client(create_admin()).get('/api/projects/export/', {'format': 'csv'})
+
+        self.assertEqual(response.status_code, 200)
+        lines = b''.join(response.streaming_content).decode('utf-8-sig').splitlines()
+        self.assertEqual(lines[0].split(',')[:3], ['id', 'slug', 'nombre'])
+        self.assertEqual(len(lines), 7)
+
+    def test_export_dates_match_the_api(self):
+        admin = api_client(create_admin())
+        project = self.projects[-1]
+        api_date = self.client.get(f'/api/projects/{project.slug}/').data['created_at']
+
+        response = admin.get('/api/projects/export/', {'format': 'csv', 'search': project.name})
+        header, row = list(csv.reader(b''.join(response.streaming_content).decode('utf-8-sig').splitlines()))
+        self.assertEqual(row[header.index('fecha')], api_date)
+        self.assertTrue(api_date.endswith('-05:00'))
+
+        response = admin.get('/api/projects/export/', {'format': 'ndjson', 'search': project.name})
+        record = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(parse_datetime(record['fecha']), parse_datetime(api_date))
+        self.assertTrue(record['fecha'].endswith('-05:00'))
+
+
+@override_settings(QUERY_BUDGET_ENFORCE=True)
+class CategoryApiTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.categories = [Category.objects.create(name=f'Categoría {index}') for index in range(5)]
+
+    def test_list(self):
+        response = api_client().get('/api/categories/', {'ordering': 'name'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([category['name'] for category in response.data['results']], [
+            category.name for category in self.categories
+        ])
+
+    def test_retrieve(self):
+        response = api_client().get(f'/api/categories/{self.categories[0].pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], 'Categoría 0')
+
+
+class SlugAllocationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Vivienda')
+
+    def create(self, name, **kwargs):
+        return Project.objects.create(name=name, category=self.category, location='Arequipa', **kwargs)
+
+    def test_repeated_names_get_consecutive_suffixes(self):
+        slugs = [self.create('Edificio Cayma').slug for _ in range(3)]
+
+        self.assertEqual(slugs, ['edificio-cayma', 'edificio-cayma-1', 'edificio-cayma-2'])
+
+    def test_numbers_in_the_name_are_not_suffixes(self):
+        self.create('Edificio 2024')
+        self.create('Edificio')
+
+        self.assertEqual(self.create('Edificio').slug, 'edificio-1')
+        self.assertEqual(self.create('Edificio 2024').slug, 'edificio-2024-1')
+
+    def test_renamed_projects_keep_their_slug_reserved(self):
+        self.create('Edificio')
+        self.create('Otro nombre', slug='edificio-1')
+
+        self.assertEqual(self.create('Edificio').slug, 'edificio-2')
+
+    def test_allocate_slugs_uses_a_single_query(self):
+        self.create('Edificio')
+        self.create('Casa')
+
+        with self.assertNumQueries(1):
+            slugs = Project.objects.allocate_slugs(['Edificio', 'Casa', 'Edificio', 'Local'])
+
+        self.assertEqual(slugs, ['edificio-1', 'casa-1', 'edificio-2', 'local'])
+
+    def test_bulk_create_allocates_missing_slugs(self):
+        self.create('Edificio')
+
+        Project.objects.bulk_create([
+            Project(name='Edificio', category=self.category, location='Lima'),
+            Project(name='Edificio', category=self.category, location='Lima', slug='edificio-propio'),
+            Project(name='Edificio', category=self.category, location='Lima'),
+        ])
+
+        self.assertEqual(
+            sorted(Project.objects.values_list('slug', flat=True)),
+            ['edificio', 'edificio-1', 'edificio-2', 'edificio-propio'],
+        )
+
+    def test_save_retries_when_the_slug_is_taken_concurrently(self):
+        self.create('Edificio')
+
+        # Otra petición insertó "edificio" entre la lectura y el INSERT.
+        with mock.patch.object(ProjectQuerySet, 'allocate_slugs', side_effect=[['edificio'], ['edificio-1']]) as allocate:
+            project = self.create('Edificio')
+
+        self.assertEqual(allocate.call_count, 2)
+        self.assertEqual(project.slug, 'edificio-1')
+        self.assertEqual(Project.objects.filter(slug__startswith='edificio').count(), 2)
+
+    def test_save_gives_up_after_the_last_attempt(self):
+        self.create('Edificio')
+
+        with mock.patch.object(ProjectQuerySet, 'allocate_slugs', return_value=['edificio']) as allocate:
+            with self.assertRaises(IntegrityError):
+                self.create('Edificio')
+
+        self.assertEqual(allocate.call_count, SLUG_SAVE_ATTEMPTS)
+
+
+class UploadSessionTests(TemporaryMediaMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_admin()
+        cls.project = Project.objects.create(
+            name='Edificio Cayma', category=Category.objects.create(name='Vivienda'), location='Arequipa',
+        )
+        cls.content = png_bytes(size=(8, 8))
+
+    def setUp(self):
+        self.upload_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.upload_dir, ignore_errors=True)
+        upload_settings = self.settings(CHUNKED_UPLOAD_DIR=self.upload_dir)
+        upload_settings.enable()
+        self.addCleanup(upload_settings.disable)
+
+        self.client = api_client(self.owner)
+        response = self.client.post('/api/uploads/', {
+            'project': self.project.slug, 'kind': 'image', 'filename': 'fachada.png', 'total_size': len(self.content),
+        })
+        self.assertEqual(response.status_code, 201)
+        self.url = f"/api/uploads/{response.data['id']}/"
+
+    def put_chunk(self, start, end, client=None):
+        return (client or self.client).put(
+            self.url, self.content[start:end + 1], content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes {start}-{end}/{len(self.content)}',
+        )
+
+    def test_parse_content_range(self):
+        self.assertEqual(parse_content_range('bytes 0-9/20'), (0, 9, 20))
+        for header in (None, '', 'bytes 0-9', 'bytes 9-0/20', 'bytes 0-20/20', 'items 0-9/20'):
+            with self.subTest(header=header), self.assertRaises(ValidationError):
+                parse_content_range(header)
+
+    def test_chunks_are_appended_and_finalized(self):
+        middle = len(self.content) // 2
+        self.assertEqual(self.put_chunk(0, middle - 1).data['received_size'], middle)
+        self.assertEqual(self.put_chunk(middle, len(self.content) - 1).data['received_size'], len(self.content))
+
+        response = self.client.post(f'{self.url}finalize/')
+
+        self.assertEqual(response.status_code, 201)
+        image = ProjectImage.objects.get(pk=response.data['id'])
+        self.assertEqual((image.project, image.image.read()), (self.project, self.content))
+        self.assertFalse(UploadSession.objects.exists())
+        self.assertEqual(os.listdir(self.upload_dir), [])
+        self.assertEqual(self.client.post(f'{self.url}finalize/').status_code, 404)
+
+    def test_out_of_order_chunk_is_rejected_without_writing(self):
+        response = self.put_chunk(10, len(self.content) - 1)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['errors']['received_size'], '0')
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+        # Reenviar un fragmento ya confirmado tampoco avanza la sesión.
+        self.put_chunk(0, 9)
+        response = self.put_chunk(0, 9)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['errors']['received_size'], '10')
+
+    def test_incomplete_upload_cannot_be_finalized(self):
+        self.put_chunk(0, 9)
+
+        response = self.client.post(f'{self.url}finalize/')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors']['received_size'], f'Faltan {len(self.content) - 10} bytes por subir.')
+
+    def test_content_must_match_the_declared_kind(self):
+        self.content = b'GIF89a' + self.content[6:]
+
+        response = self.put_chunk(0, 9)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(UploadSession.objects.get().received_size, 0)
+
+    def test_sessions_are_scoped_to_their_creator(self):
+        other = api_client(create_admin('otro@briorsal.pe'))
+
+        self.assertEqual(other.get(self.url).status_code, 404)
+        self.assertEqual(self.put_chunk(0, 9, client=other).status_code, 404)
+        self.assertEqual(other.post(f'{self.url}finalize/').status_code, 404)
+        self.assertEqual(other.delete(self.url).status_code, 404)
+        self.assertEqual(self.client.get(self.url).data['received_size'], 0)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Los triggers del índice FTS5 son propios de SQLite.')
+class SearchTriggerTests(TransactionTestCase):
+    """Un AlterField en SQLite recrea la tabla projects y borra los triggers de project_search."""
+
+    def setUp(self):
+        self.category = Category.objects.create(name='Vivienda')
+        reset_search_backend()
+
+    def alter_location(self):
+        old = Project._meta.get_field('location')
+        new = copy.deepcopy(old)
+        new.max_length = old.max_length + 1
+        with connection.schema_editor() as editor:
+            editor.alter_field(Project, old, new)
+
+        def restore():
+            with connection.schema_editor() as editor:
+                editor.alter_field(Project, new, old)
+            reset_search_backend()
+
+        self.addCleanup(restore)
+
+    def existing_triggers(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'projects'")
+            return {row[0] for row in cursor.fetchall()}
+
+    def search(self, term):
+        return list(search_projects(Project.objects.all(), [term]).values_list('name', flat=True))
+
+    def test_migrate_restores_triggers_dropped_by_alter_field(self):
+        Project.objects.create(name='Edificio Cayma', category=self.category, location='Arequipa')
+        self.alter_location()
+        self.assertFalse(self.existing_triggers() & set(SEARCH_TRIGGERS))
+
+        # Escrito sin triggers: solo queda indexado al reconstruir el índice.
+        Project.objects.create(name='Edificio Miraflores', category=self.category, location='Lima')
+        call_command('migrate', verbosity=0)
+
+        self.assertEqual(self.existing_triggers(), set(SEARCH_TRIGGERS))
+        self.assertEqual(self.search('miraflores'), ['Edificio Miraflores'])
+        Project.objects.filter(name='Edificio Cayma').update(name='Edificio Yanahuara')
+        self.assertEqual(self.search('yanahuara'), ['Edificio Yanahuara'])
+        self.assertEqual(self.search('cayma'), [])
+
+    def test_first_search_restores_triggers(self):
+        self.alter_location()
+        # Un proceso nuevo vuelve a comprobar la tabla y los triggers.
+        _fts_tables.clear()
+        Project.objects.create(name='Edificio Miraflores', category=self.category, location='Lima')
+
+        self.assertEqual(self.search('miraflores'), ['Edificio Miraflores'])
+        self.assertEqual(self.existing_triggers(), set(SEARCH_TRIGGERS))
@@ -0,0 +1,218 @@
+import os
+import re
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from PIL import Image
+from rest_framework import serializers, status
+from rest_framework.exceptions import APIException
+
+from .models import ProjectImage, ProjectVideo, UploadSession
+
+MEDIA_FIELDS = {
+    'image': (ProjectImage, 'image'),
+    'video': (ProjectVideo, 'video'),
+}
+
+CONTENT_RANGE_RE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+COPY_BLOCK_SIZE = 64 * 1024
+
+
+class UploadConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'El fragmento no continúa desde el último byte recibido.'
+    default_code = 'upload_conflict'
+
+
+class UploadAlreadyFinalized(UploadConflict):
+    default_detail = 'La subida ya fue finalizada.'
+    default_code = 'upload_finalized'
+
+
+class ChunkTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'El fragmento supera el tamaño máximo permitido.'
+    default_code = 'chunk_too_large'
+
+
+class ChunkedUploadFile(File):
+    """Permite que FileSystemStorage mueva el archivo en lugar de copiarlo."""
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def media_field(kind):
+    model, field_name = MEDIA_FIELDS[kind]
+    return model._meta.get_field(field_name)
+
+
+def validate_declared_file(kind, filename, size):
+    # Los validadores del campo solo miran .name y .size, así que se aplican
+    # antes de recibir un solo byte.
+    declared = File(None, name=filename)
+    declared.size = size
+    try:
+        for validator in media_field(kind).validators:
+            validator(declared)
+    except DjangoValidationError as e:
+        raise serializers.ValidationError({'filename': e.messages})
+
+
+def matches_signature(kind, head):
+    if kind == 'image':
+        return (
+            head.startswith(b'\xff\xd8\xff')
+            or head.startswith(b'\x89PNG\r\n\x1a\n')
+            or (head[:4] == b'RIFF' and head[8:12] == b'WEBP')
+        )
+    return (
+        head[4:8] == b'ftyp'
+        or (head[:4] == b'RIFF' and head[8:12] == b'AVI ')
+        or head.startswith(b'\x1a\x45\xdf\xa3')
+    )
+
+
+def parse_content_range(header):
+    match = CONTENT_RANGE_RE.match(header or '')
+    if not match:
+        raise serializers.ValidationError(
+            {'content_range': 'Se requiere la cabecera Content-Range: bytes inicio-fin/total.'}
+        )
+
+    start, end, total = (int(value) for value in match.groups())
+    if end < start or end >= total:
+        raise serializers.ValidationError({'content_range': 'Rango de bytes inválido.'})
+    return start, end, total
+
+
+def append_chunk(session, request):
+    start, end, total = parse_content_range(request.META.get('HTTP_CONTENT_RANGE'))
+    length = end - start + 1
+
+    if total != session.total_size:
+        raise serializers.ValidationError({'content_range': 'El tamaño total no coincide con el de la sesión.'})
+    if length > settings.CHUNKED_UPLOAD_CHUNK_SIZE:
+        raise ChunkTooLarge()
+    if int(request.META.get('CONTENT_LENGTH') or 0) != length:
+        raise serializers.ValidationError({'content_range': 'El cuerpo no coincide con el rango declarado.'})
+    _check_offset(session, start)
+
+    # El cuerpo llega por la red al ritmo del cliente: se recibe antes de
+    # tomar el bloqueo, que solo cubre la escritura en disco.
+    with _receive_chunk(session, request.stream, start, length) as chunk:
+        with transaction.atomic():
+            session = UploadSession.objects.select_for_update().filter(pk=session.pk).first()
+            if session is None:
+                raise UploadAlreadyFinalized()
+            _check_offset(session, start)
+
+            _write_chunk(session, chunk, start)
+            session.received_size = start + length
+            session.save(update_fields=['received_size', 'updated_at'])
+
+    return session
+
+
+def _check_offset(session, start):
+    if start != session.received_size:
+        raise UploadConflict({
+            'detail': UploadConflict.default_detail,
+            'received_size': session.received_size,
+        })
+
+
+def _receive_chunk(session, stream, start, length):
+    os.makedirs(settings.CHUNKED_UPLOAD_DIR, exist_ok=True)
+    chunk = tempfile.TemporaryFile(dir=settings.CHUNKED_UPLOAD_DIR)
+    received = 0
+
+    try:
+        while received < length:
+            block = stream.read(min(COPY_BLOCK_SIZE, length - received))
+            if not block:
+                break
+            if start == 0 and received == 0 and not matches_signature(session.kind, block[:16]):
+                raise serializers.ValidationError({'file': 'El contenido no corresponde al tipo de archivo declarado.'})
+            chunk.write(block)
+            received += len(block)
+
+        if received != length:
+            raise serializers.ValidationError({'content_range': 'Se recibieron menos bytes de los declarados.'})
+    except BaseException:
+        chunk.close()
+        raise
+
+    chunk.seek(0)
+    return chunk
+
+
+def _write_chunk(session, chunk, start):
+    mode = 'r+b' if os.path.exists(session.temp_path) else 'wb'
+
+    with open(session.temp_path, mode) as destination:
+        # Se escribe siempre en el offset confirmado y se trunca al final, así
+        # un fragmento reenviado no deja basura detrás.
+        destination.seek(start)
+        shutil.copyfileobj(chunk, destination, COPY_BLOCK_SIZE)
+        destination.truncate()
+
+
+def finalize_session(session):
+    with transaction.atomic():
+        # Un segundo finalize/ concurrente espera el bloqueo y después ya no
+        # encuentra la sesión (ni su archivo temporal).
+        session = UploadSession.objects.select_for_update().select_related('project').filter(pk=session.pk).first()
+        if session is None:
+            raise UploadAlreadyFinalized()
+
+        if not session.is_complete:
+            raise serializers.ValidationError({
+                'received_size': f'Faltan {session.total_size - session.received_size} bytes por subir.'
+            })
+
+        temp_path = session.temp_path
+        if not os.path.exists(temp_path):
+            raise UploadAlreadyFinalized()
+
+        if session.kind == 'image':
+            try:
+                with Image.open(temp_path) as image:
+                    image.verify()
+            except Exception:
+                raise serializers.ValidationError({'file': 'El archivo no es una imagen válida.'})
+
+        model, field_name = MEDIA_FIELDS[session.kind]
+        media = model(project=session.project)
+        with open(temp_path, 'rb') as temp:
+            getattr(media, field_name).save(session.filename, ChunkedUploadFile(temp), save=False)
+        media.save()
+        session.delete()
+
+    # FileSystemStorage ya movió el archivo; otros storages lo copian.
+    _remove(temp_path)
+    return media
+
+
+def discard_session(session):
+    _remove(session.temp_path)
+    session.delete()
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def purge_expired_sessions():
+    cutoff = timezone.now() - timedelta(seconds=settings.CHUNKED_UPLOAD_SESSION_TTL)
+    for session in UploadSession.objects.filter(updated_at__lt=cutoff):
+        discard_session(session)
@@ -1,12 +1,19 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ProjectViewSet, CategoryViewSet, ProjectImageViewSet, ProjectVideoViewSet
+from .views import (
+    CategoryViewSet,
+    ProjectImageViewSet,
+    ProjectVideoViewSet,
+    ProjectViewSet,
+    UploadSessionViewSet,
+)
 
 router = DefaultRouter()
 router.register(r'projects', ProjectViewSet)
 router.register(r'categories', CategoryViewSet)
 router.register(r'project-images', ProjectImageViewSet)
 router.register(r'project-videos', ProjectVideoViewSet)
+router.register(r'uploads', UploadSessionViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,22 +1,37 @@
 from django.db.models import ProtectedError
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, parsers, permissions, status, viewsets
+from rest_framework import filters, mixins, parsers, permissions, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from .models import Category, Project, ProjectImage, ProjectVideo
+from core.conditional import ConditionalGetMixin
+from core.export import ExportMixin
+from core.query_budget import QueryBudgetMixin
+from core.response_cache import ResponseCacheMixin
+from core.sparse import SparseQuerysetMixin
+from core.streaming import StreamingListMixin
+
+from .facets import project_facets
+from .models import Category, Project, ProjectImage, ProjectVideo, UploadSession
+from .search import ProjectSearchFilter
 from .serializers import (
     CategorySerializer,
     ProjectImageSerializer,
+    ProjectListSerializer,
     ProjectSerializer,
     ProjectVideoSerializer,
+    UploadSessionSerializer,
 )
+from .uploads import append_chunk, discard_session, finalize_session, purge_expired_sessions
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(QueryBudgetMixin, ConditionalGetMixin, StreamingListMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     lookup_field = 'id'
+    query_budget = {'list': 4, 'retrieve': 3}
+    cursor_ordering = ('-created_at', 'id')
 
     filter_backends = [
         DjangoFilterBackend,
@@ -39,17 +54,35 @@ class CategoryViewSet(viewsets.ModelViewSet):
                 'errors': {'detail': 'ProtectedError: Integridad referencial violada'}
             }, status=status.HTTP_400_BAD_REQUEST)
 
-class ProjectViewSet(viewsets.ModelViewSet):
-    queryset = Project.objects.select_related('category').all().order_by('-created_at')
+class ProjectViewSet(
+    QueryBudgetMixin,
+    ResponseCacheMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    StreamingListMixin,
+    viewsets.ModelViewSet,
+):
+    queryset = (
+        Project.objects.select_related('category')
+        .prefetch_related('images', 'videos')
+        .order_by('-created_at')
+    )
     serializer_class = ProjectSerializer
     lookup_field = 'slug'
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_groups = ('projects',)
+    conditional_fields = ('updated_at', 'category__updated_at')
+    # list: validar ?category=, estado condicional, COUNT, página y los dos
+    # prefetch de ?expand=images,videos.
+    query_budget = {'list': 6, 'retrieve': 5, 'facets': 3}
+    cursor_ordering = ('-created_at', 'id')
 
     parser_classes = (parsers.MultiPartParser, parsers.FormParser)
 
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        ProjectSearchFilter,
         filters.OrderingFilter,
     ]
 
@@ -57,6 +90,39 @@ class ProjectViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'location', 'service_type', 'area', 'status', 'description']
     ordering_fields = ['created_at', 'name', 'year']
 
+    export_filename = 'proyectos'
+    export_fields = {
+        'id': 'id',
+        'slug': 'slug',
+        'nombre': 'name',
+        'categoria': 'category__name',
+        'ubicacion': 'location',
+        'anio': 'year',
+        'edificacion': 'service_type',
+        'niveles': 'levels',
+        'area': 'area',
+        'estado': 'status',
+        'destacado': 'is_featured',
+        'fecha': 'created_at',
+    }
+
+    def get_queryset(self):
+        if self.action == 'list':
+            fields = self.get_sparse_fields()
+            cover = 'cover_image' in fields or 'cover_image_renditions' in fields
+            return self.sparse_queryset(Project.objects.for_list(cover=cover).order_by('-created_at'))
+        return super().get_queryset()
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ProjectListSerializer
+        return ProjectSerializer
+
+    @action(detail=False, methods=['get'])
+    def facets(self, request, *args, **kwargs):
+        """Conteos por opción de cada filtro, respetando la búsqueda y los demás filtros."""
+        return self.cached_response(request, lambda: Response(project_facets(self, request)))
+
 class ProjectImageViewSet(viewsets.ModelViewSet):
     queryset = ProjectImage.objects.all()
     serializer_class = ProjectImageSerializer
@@ -65,4 +131,43 @@ class ProjectImageViewSet(viewsets.ModelViewSet):
 class ProjectVideoViewSet(viewsets.ModelViewSet):
     queryset = ProjectVideo.objects.all()
     serializer_class = ProjectVideoSerializer
-    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
\ No newline at end of file
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+class UploadSessionViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Subida reanudable por fragmentos: POST crea la sesión, PUT con
+    Content-Range agrega bytes directo a disco, GET informa cuánto se recibió
+    y POST a ``finalize/`` la convierte en ProjectImage o ProjectVideo.
+    """
+    queryset = UploadSession.objects.select_related('project')
+    serializer_class = UploadSessionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        # Cada usuario solo ve, continúa o descarta sus propias subidas.
+        return super().get_queryset().filter(created_by=self.request.user)
+
+    def perform_create(self, serializer):
+        purge_expired_sessions()
+        serializer.save(created_by=self.request.user)
+
+    def update(self, request, *args, **kwargs):
+        session = append_chunk(self.get_object(), request)
+        return Response(self.get_serializer(session).data)
+
+    def perform_destroy(self, instance):
+        discard_session(instance)
+
+    @action(detail=True, methods=['post'])
+    def finalize(self, request, *args, **kwargs):
+        session = self.get_object()
+        media = finalize_session(session)
+
+        serializer_class = ProjectImageSerializer if isinstance(media, ProjectImage) else ProjectVideoSerializer
+        serializer = serializer_class(media, context=self.get_serializer_context())
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
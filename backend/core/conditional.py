@@ -0,0 +1,84 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified para list y retrieve calculados con un solo
+    ``MAX(updated_at), COUNT(*)`` sobre el queryset ya filtrado. Si el cliente
+    ya tiene la versión vigente se responde 304 sin ejecutar el serializer.
+    ``conditional_fields`` admite campos de relaciones que también forman
+    parte de la representación (p. ej. ``category__updated_at``).
+    """
+
+    conditional_fields = ('updated_at',)
+    conditional_cache_control = 'no-cache'
+
+    def filter_queryset(self, queryset):
+        # list filtra dos veces (estado condicional y página) y los filtros por
+        # FK validan el valor con una consulta: se reutiliza el primer resultado.
+        if getattr(self, 'action', None) != 'list':
+            return super().filter_queryset(queryset)
+        if getattr(self, '_filtered_queryset', None) is None:
+            self._filtered_queryset = super().filter_queryset(queryset)
+        return self._filtered_queryset.all()
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(request, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(request, lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs))
+
+    def get_conditional_state(self):
+        """Devuelve (última modificación, cantidad de filas) del recurso pedido."""
+        if self.action == 'list':
+            latest = {f'last_modified_{index}': Max(field) for index, field in enumerate(self.conditional_fields)}
+            state = self.filter_queryset(self.get_queryset()).aggregate(total=Count('pk'), **latest)
+            return _latest(state[key] for key in latest), state['total']
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = (
+            self.get_queryset()
+            .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            .values_list(*self.conditional_fields)
+            .first()
+        )
+        last_modified = _latest(row or ())
+        return last_modified, 1 if last_modified else 0
+
+    def _conditional(self, request, render):
+        is_list = getattr(self, 'action', None) == 'list'
+        last_modified, total = self.get_conditional_state()
+        if last_modified is None and not is_list:
+            return render()
+
+        fingerprint = '|'.join([
+            last_modified.isoformat() if last_modified else '',
+            str(total),
+            request.get_host(),
+            request.get_full_path(),
+            getattr(request, 'accepted_media_type', '') or '',
+        ])
+        etag = 'W/' + quote_etag(hashlib.md5(fingerprint.encode()).hexdigest())
+
+        # En listas una baja no mueve MAX(updated_at): solo el ETag (que
+        # incluye el conteo) es fiable, así que Last-Modified va solo en detalle.
+        timestamp = None if is_list else int(last_modified.timestamp())
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = render()
+
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+            response['Cache-Control'] = self.conditional_cache_control
+        return response
+
+
+def _latest(values):
+    return max((value for value in values if value is not None), default=None)
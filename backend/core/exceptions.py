@@ -25,6 +25,12 @@ def custom_exception_handler(exc, context):
         message = 'El recurso solicitado no fue encontrado.'
     elif response.status_code == 405:
         message = 'Método HTTP no permitido para este recurso.'
+    elif response.status_code == 409:
+        message = 'La solicitud entra en conflicto con el estado actual del recurso.'
+    elif response.status_code == 413:
+        message = 'El contenido enviado es demasiado grande.'
+    elif response.status_code == 429:
+        message = 'Demasiadas solicitudes. Intenta de nuevo más tarde.'
 
     response.data = {
         'status': 'error',
@@ -0,0 +1,137 @@
+import mimetypes
+import os
+import re
+import stat
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_http_methods
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeFile:
+    """
+    Limita la lectura a un rango del archivo pero conserva ``fileno()``: con
+    el ``wsgi.file_wrapper`` de gunicorn el rango sale por ``os.sendfile``
+    desde el offset actual y hasta el Content-Length, sin pasar por Python.
+    """
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """Devuelve (inicio, fin) inclusivo, None si no aplica o 'invalid' si no se puede satisfacer."""
+    match = RANGE_RE.match(header or '')
+    if not match or match.groups() == ('', ''):
+        return None
+
+    start, end = match.groups()
+    if start == '':
+        length = int(end)
+        if length == 0:
+            return 'invalid'
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or end < start:
+        return 'invalid'
+    return start, end
+
+
+@require_http_methods(['GET', 'HEAD'])
+def serve_media(request, path):
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        stat_result = os.stat(full_path)
+    except (SuspiciousFileOperation, OSError):
+        raise Http404('El archivo solicitado no existe.')
+
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise Http404('El archivo solicitado no existe.')
+
+    size = stat_result.st_size
+    etag = quote_etag(f'{stat_result.st_mtime_ns:x}-{size:x}')
+    last_modified = http_date(stat_result.st_mtime)
+
+    not_modified = get_conditional_response(
+        request, etag=etag, last_modified=int(stat_result.st_mtime)
+    )
+    if not_modified is not None:
+        return _with_cache_headers(not_modified, etag, last_modified)
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+
+    offload = getattr(settings, 'MEDIA_SENDFILE', '')
+    if offload:
+        # El proxy (nginx/apache) atiende Range y envía el archivo.
+        response = HttpResponse(content_type=content_type)
+        if offload == 'x-accel-redirect':
+            response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_REDIRECT_PREFIX + path
+        else:
+            response['X-Sendfile'] = full_path
+        return _with_cache_headers(response, etag, last_modified)
+
+    byte_range = None
+    if_range = request.headers.get('If-Range')
+    if not if_range or if_range == etag or if_range == last_modified:
+        byte_range = parse_range(request.headers.get('Range'), size)
+
+    if byte_range == 'invalid':
+        # Un error no debe quedar en caché como si fuera el archivo.
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        response['Cache-Control'] = 'no-store'
+        return response
+
+    if byte_range:
+        start, end = byte_range
+    else:
+        start, end = 0, size - 1
+    length = max(end - start + 1, 0)
+
+    if request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type)
+    else:
+        response = FileResponse(RangeFile(open(full_path, 'rb'), start, length), content_type=content_type)
+
+    if byte_range:
+        response.status_code = 206
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    if encoding:
+        response['Content-Encoding'] = encoding
+
+    response['Content-Length'] = str(length)
+    response['Accept-Ranges'] = 'bytes'
+    return _with_cache_headers(response, etag, last_modified)
+
+
+def _with_cache_headers(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = last_modified
+    response['Cache-Control'] = settings.MEDIA_CACHE_CONTROL
+    return response
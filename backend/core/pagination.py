@@ -1,17 +1,51 @@
+import base64
+import json
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 class CustomPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
     page_size = 10
 
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Cursor inválido.'
+    cursor_unsupported_message = 'Este recurso no admite paginación por cursor.'
+    cursor_conflict_message = (
+        'El cursor solo pagina por fecha de creación: no se puede combinar con '
+        '"{param}". Usa la paginación por páginas para ordenar o buscar.'
+    )
+
     def paginate_queryset(self, queryset, request, view=None):
         if request.query_params.get('no_page') == 'true':
             return None
+        if self.cursor_query_param in request.query_params:
+            self.cursor_ordering, self.cursor_fields = self.get_cursor_ordering(queryset, view)
+            self.check_cursor_params(request)
+            return self.paginate_queryset_by_cursor(queryset, request)
         return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if getattr(self, 'cursor_mode', False):
+            return Response({
+                'results': data,
+                'meta': {
+                    'page_size': self.cursor_page_size,
+                    'next': self.get_cursor_link(self.next_position, reverse=False),
+                    'previous': self.get_cursor_link(self.previous_position, reverse=True),
+                }
+            })
+
         return Response({
             'results': data,
             'meta': {
@@ -21,4 +55,198 @@ class CustomPagination(PageNumberPagination):
                 'next': self.get_next_link(),
                 'previous': self.get_previous_link(),
             }
-        })
\ No newline at end of file
+        })
+
+    def get_cursor_ordering(self, queryset, view):
+        """
+        Orden del keyset que declara la vista en ``cursor_ordering``, p. ej.
+        ``('-created_at', 'id')``. Se comprueba antes de tocar la consulta:
+        sin él, o con campos que el modelo no tiene, se responde 400.
+        """
+        ordering = tuple(getattr(view, 'cursor_ordering', None) or ())
+        try:
+            fields = [queryset.model._meta.get_field(name.lstrip('-')) for name in ordering]
+        except FieldDoesNotExist:
+            fields = []
+        if not fields:
+            raise ParseError(self.cursor_unsupported_message)
+        return ordering, fields
+
+    def check_cursor_params(self, request):
+        # El keyset reemplaza el orden de la consulta: ``?ordering=`` distinto
+        # del suyo o el orden por relevancia de ``?search=`` se perderían.
+        ordering = [
+            name.strip()
+            for name in request.query_params.get(api_settings.ORDERING_PARAM, '').split(',')
+            if name.strip()
+        ]
+        if ordering and ordering != list(self.cursor_ordering[:len(ordering)]):
+            param = api_settings.ORDERING_PARAM
+        elif request.query_params.get(api_settings.SEARCH_PARAM, '').strip():
+            param = api_settings.SEARCH_PARAM
+        else:
+            return
+
+        raise ParseError(self.cursor_conflict_message.format(param=param))
+
+    def paginate_queryset_by_cursor(self, queryset, request):
+        """
+        Paginación por keyset sobre ``cursor_ordering``: sin COUNT(*) ni
+        OFFSET, cada página es un rango sobre el índice. ``?cursor=`` vacío
+        devuelve la primera página.
+        """
+        self.cursor_mode = True
+        self.request = request
+        self.cursor_page_size = self.get_page_size(request)
+
+        position, reverse = self.decode_cursor(request.query_params[self.cursor_query_param])
+
+        ordering = [self._reverse_ordering(name) if reverse else name for name in self.cursor_ordering]
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._position_filter(position, reverse))
+
+        results = list(queryset[:self.cursor_page_size + 1])
+        has_more = len(results) > self.cursor_page_size
+        results = results[:self.cursor_page_size]
+
+        if reverse:
+            results.reverse()
+
+        first = self._position_of(results[0]) if results else None
+        last = self._position_of(results[-1]) if results else None
+
+        if reverse:
+            self.next_position = last if position is not None else None
+            self.previous_position = first if has_more else None
+        else:
+            self.next_position = last if has_more else None
+            self.previous_position = first if position is not None else None
+
+        return results
+
+    def get_cursor_link(self, position, reverse):
+        if position is None:
+            return None
+
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position, reverse))
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({'p': position, 'r': reverse}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, token):
+        if not token:
+            return None, False
+
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            position = [
+                field.to_python(value) for field, value in zip(self.cursor_fields, payload['p'])
+            ]
+            if len(position) != len(self.cursor_fields):
+                raise ValueError
+            return position, bool(payload.get('r'))
+        except (ValueError, TypeError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _position_of(self, obj):
+        position = []
+        for field in self.cursor_fields:
+            value = getattr(obj, field.attname)
+            position.append(value.isoformat() if isinstance(value, datetime) else value)
+        return position
+
+    def _position_filter(self, position, reverse):
+        # (a, b) > (x, y) expandido a OR/AND para que funcione en cualquier motor.
+        condition = Q()
+        equal = Q()
+        for name, field, value in zip(self.cursor_ordering, self.cursor_fields, position):
+            descending = name.startswith('-') != reverse
+            lookup = 'lt' if descending else 'gt'
+            condition |= equal & Q(**{f'{field.name}__{lookup}': value})
+            equal &= Q(**{field.name: value})
+        return condition
+
+    def _reverse_ordering(self, name):
+        return name[1:] if name.startswith('-') else f'-{name}'
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginador del admin para tablas grandes. Sin filtros ni búsqueda toma el
+    número de filas de las estadísticas del motor (``reltuples`` en
+    PostgreSQL, ``sqlite_stat1`` en SQLite tras ``ANALYZE``) en vez de hacer
+    COUNT(*). Con filtros, sin estadísticas o por debajo de
+    ``exact_threshold`` filas cuenta de verdad.
+
+    Con estadísticas viejas la estimación puede superar a las filas reales,
+    así que con un conteo estimado no se enlazan las últimas páginas: solo
+    las vecinas de la actual, y ninguna después de una página incompleta.
+    """
+
+    exact_threshold = 10000
+    count_is_estimated = False
+    last_known_page = None
+
+    @cached_property
+    def count(self):
+        estimate = self.estimated_count()
+        if estimate is not None and estimate > self.exact_threshold:
+            self.count_is_estimated = True
+            return estimate
+        return super().count
+
+    def page(self, number):
+        page = super().page(number)
+        # len() evalúa el queryset de la página, el mismo que muestra el admin.
+        if self.count_is_estimated and len(page) < self.per_page:
+            self.last_known_page = page.number
+        return page
+
+    def get_elided_page_range(self, number=1, *, on_each_side=3, on_ends=2):
+        if not self.count_is_estimated:
+            yield from super().get_elided_page_range(number, on_each_side=on_each_side, on_ends=on_ends)
+            return
+
+        number = self.validate_number(number)
+        last = self.last_known_page or min(number + on_each_side, self.num_pages)
+
+        if number > (1 + on_each_side + on_ends) + 1:
+            yield from range(1, on_ends + 1)
+            yield self.ELLIPSIS
+            yield from range(number - on_each_side, last + 1)
+        else:
+            yield from range(1, last + 1)
+
+        if self.last_known_page is None and last < self.num_pages:
+            yield self.ELLIPSIS
+
+    def estimated_count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet) or queryset.query.where:
+            return None
+
+        connection = connections[queryset.db]
+        table = queryset.model._meta.db_table
+
+        if connection.vendor == 'postgresql':
+            sql = 'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass'
+        elif connection.vendor == 'sqlite':
+            # La primera cifra de ``stat`` es el número de filas de la tabla.
+            # (La tabla sqlite_stat1 solo existe después del primer ANALYZE.)
+            sql = "SELECT CAST(stat AS INTEGER) FROM sqlite_stat1 WHERE tbl = %s LIMIT 1"
+        else:
+            return None
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [table])
+                row = cursor.fetchone()
+        except DatabaseError:
+            return None
+
+        # PostgreSQL devuelve -1 si la tabla nunca se analizó.
+        return row[0] if row and row[0] >= 0 else None
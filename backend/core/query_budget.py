@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.db import connection
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryBudgetMixin:
+    """
+    Declara el número máximo de consultas SQL por acción, p. ej.
+    ``query_budget = {'list': 4, 'retrieve': 3}``. Con QUERY_BUDGET_ENFORCE
+    activo (por defecto al correr ``manage.py test``) la petición que se pase
+    del presupuesto lanza QueryBudgetExceeded y hace fallar la suite.
+    """
+
+    query_budget = {}
+
+    def dispatch(self, request, *args, **kwargs):
+        if not getattr(settings, 'QUERY_BUDGET_ENFORCE', False):
+            return super().dispatch(request, *args, **kwargs)
+
+        executed = []
+
+        def count_queries(execute, sql, params, many, context):
+            executed.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_queries):
+            response = super().dispatch(request, *args, **kwargs)
+
+        action = getattr(self, 'action', None) or request.method.lower()
+        budget = self.query_budget.get(action)
+
+        if budget is not None and len(executed) > budget:
+            raise QueryBudgetExceeded(
+                f"{self.__class__.__name__}.{action} ejecutó {len(executed)} consultas "
+                f"(presupuesto: {budget}):\n" + "\n".join(executed)
+            )
+
+        return response
@@ -1,23 +1,138 @@
+import math
+from decimal import Decimal
+
+from django.conf import settings
+from rest_framework.compat import LONG_SEPARATORS, SHORT_SEPARATORS
 from rest_framework.renderers import JSONRenderer
 
+class NonFiniteNumber(ValueError):
+    pass
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    ORJSON_ERRORS = ()
+else:
+    # Fechas y horas pasan por el encoder de DRF (milisegundos, sufijo Z) para
+    # que la salida sea la misma que con json.
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    ORJSON_ERRORS = (orjson.JSONEncodeError, NonFiniteNumber)
+
+def has_non_finite(data):
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, Decimal):
+        return not data.is_finite()
+    if isinstance(data, dict):
+        return any(has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(has_non_finite(value) for value in data)
+    return False
+
+STREAM_PLACEHOLDER = '\x00stream\x00'
+
 class CustomJSONRenderer(JSONRenderer):
+    _envelope_parts = {}
+
     def render(self, data, accepted_media_type=None, renderer_context=None):
         response = renderer_context['response'] if renderer_context else None
 
         if response and response.status_code >= 400:
             return super().render(data, accepted_media_type, renderer_context)
 
-        formatted_data = {
+        status_code = response.status_code if response else 200
+
+        if self.use_fast_encoder(accepted_media_type, renderer_context or {}):
+            payload, meta, message = self.unwrap(data)
+            prefix, middle, suffix = self.envelope_parts(status_code, message)
+            try:
+                return prefix + self.fast_dumps(payload) + middle + self.fast_dumps(meta) + suffix
+            except ORJSON_ERRORS:
+                # Tipos que orjson no admite (enteros > 64 bits, etc.): se
+                # vuelve al camino de siempre, que da el resultado esperado.
+                pass
+
+        formatted_data = self.build_envelope(data, status_code)
+
+        return super().render(formatted_data, accepted_media_type, renderer_context)
+
+    def unwrap(self, data):
+        if isinstance(data, dict) and 'results' in data and 'meta' in data:
+            return data['results'], data['meta'], 'Lista obtenida correctamente.'
+        return data, None, 'Operación realizada correctamente.'
+
+    def build_envelope(self, data, status_code=200):
+        payload, meta, message = self.unwrap(data)
+        return {
             'status': 'success',
-            'code': response.status_code if response else 200,
-            'message': 'Operación realizada correctamente.',
-            'data': data,
-            'meta': None
+            'code': status_code,
+            'message': message,
+            'data': payload,
+            'meta': meta,
         }
 
-        if isinstance(data, dict) and 'results' in data and 'meta' in data:
-            formatted_data['data'] = data['results']
-            formatted_data['meta'] = data['meta']
-            formatted_data['message'] = 'Lista obtenida correctamente.'
+    def envelope_parts(self, status_code, message):
+        """Bytes del sobre antes de ``data``, entre ``data`` y ``meta`` y al final."""
+        key = (status_code, message)
+        parts = self._envelope_parts.get(key)
+        if parts is None:
+            envelope = JSONRenderer.render(self, {
+                'status': 'success',
+                'code': status_code,
+                'message': message,
+                'data': STREAM_PLACEHOLDER,
+                'meta': STREAM_PLACEHOLDER,
+            })
+            parts = self._envelope_parts[key] = tuple(envelope.split(JSONRenderer.render(self, STREAM_PLACEHOLDER)))
+        return parts
+
+    def use_fast_encoder(self, accepted_media_type=None, renderer_context=None):
+        # orjson solo produce la variante compacta y sin escapar no-ASCII.
+        return (
+            orjson is not None
+            and settings.JSON_FAST_ENCODER
+            and self.compact
+            and not self.ensure_ascii
+            and self.get_indent(accepted_media_type, renderer_context or {}) is None
+        )
+
+    def fast_dumps(self, data):
+        output = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        # orjson escribe NaN e infinito como null sin avisar. json falla con
+        # STRICT_JSON o escribe NaN/Infinity: se deja que decida el camino de
+        # siempre. Sin ningún null en la salida no hace falta recorrer los datos.
+        if b'null' in output and has_non_finite(data):
+            raise NonFiniteNumber()
+        if b'\xe2\x80\xa8' in output or b'\xe2\x80\xa9' in output:
+            output = output.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return output
+
+    def dumps(self, data):
+        if self.use_fast_encoder():
+            try:
+                return self.fast_dumps(data)
+            except ORJSON_ERRORS:
+                pass
+        return JSONRenderer.render(self, data)
+
+    def can_stream(self, accepted_media_type=None, renderer_context=None):
+        return self.get_indent(accepted_media_type, renderer_context or {}) is None
+
+    def render_stream(self, chunks, status_code=200):
+        """
+        Genera el mismo sobre que ``render`` para una lista, pero por partes:
+        cada elemento de ``chunks`` es una lista de filas ya serializadas.
+        """
+        prefix, middle, suffix = self.envelope_parts(status_code, self.unwrap(None)[2])
+        separator = (SHORT_SEPARATORS if self.compact else LONG_SEPARATORS)[0].encode()
 
-        return super().render(formatted_data, accepted_media_type, renderer_context)
\ No newline at end of file
+        yield prefix + b'['
+        first = True
+        for chunk in chunks:
+            if not chunk:
+                continue
+            body = self.dumps(chunk)[1:-1]
+            yield body if first else separator + body
+            first = False
+        yield b']' + middle + b'null' + suffix
@@ -0,0 +1,142 @@
+import logging
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.dispatch import Signal
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RENDITION_WIDTHS = (160, 480, 960, 1600)
+RENDITION_DIR = 'renditions'
+RENDITION_QUALITY = 80
+
+# Se envía con ``name`` cuando las renditions de una imagen están escritas
+# (también si ya existían): las apps marcan ``renditions_ready`` en sus filas
+# e invalidan ETags y respuestas cacheadas.
+renditions_created = Signal()
+
+
+def get_rendition_widths():
+    return tuple(getattr(settings, 'IMAGE_RENDITION_WIDTHS', DEFAULT_RENDITION_WIDTHS))
+
+
+def rendition_name(name, width):
+    # Con la extensión original: foo.jpg y foo.png no comparten renditions.
+    directory, filename = os.path.split(name)
+    return os.path.join(directory, RENDITION_DIR, f'{filename}__{width}w.webp')
+
+
+def rendition_names(name):
+    return {width: rendition_name(name, width) for width in get_rendition_widths()}
+
+
+def renditions_exist(name, storage=default_storage):
+    # Se escriben de la más ancha a la más angosta: si existe la última, están todas.
+    return storage.exists(rendition_name(name, min(get_rendition_widths())))
+
+
+def generate_renditions(name, storage=default_storage, force=False):
+    """
+    Genera las derivadas WebP de una imagen. Nunca se amplía la imagen: si el
+    original es más angosto que el ancho pedido se guarda a su tamaño real,
+    así todas las claves del srcset existen siempre.
+    """
+    if not name:
+        return {}
+
+    names = rendition_names(name)
+
+    if not force and renditions_exist(name, storage):
+        renditions_created.send(sender=None, name=name)
+        return names
+
+    try:
+        with storage.open(name, 'rb') as source:
+            image = Image.open(source)
+            image.draft('RGB', (max(names), max(names)))
+            image = ImageOps.exif_transpose(image)
+            image.load()
+    except (OSError, ValueError) as e:
+        logger.error(f"No se pudieron generar las renditions de {name}: {e}")
+        return {}
+
+    if image.mode not in ('RGB', 'RGBA'):
+        # Los PNG con paleta (o en grises) guardan la transparencia en
+        # ``info`` y no como banda alfa.
+        transparent = 'A' in image.getbands() or 'transparency' in image.info
+        image = image.convert('RGBA' if transparent else 'RGB')
+
+    for width, rendition in sorted(names.items(), reverse=True):
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+
+        buffer = BytesIO()
+        image.save(buffer, 'WEBP', quality=RENDITION_QUALITY, method=4)
+
+        if storage.exists(rendition):
+            storage.delete(rendition)
+        storage.save(rendition, ContentFile(buffer.getvalue()))
+
+    renditions_created.send(sender=None, name=name)
+    return names
+
+
+def delete_renditions(name, storage=default_storage):
+    if not name:
+        return
+
+    for rendition in rendition_names(name).values():
+        storage.delete(rendition)
+
+
+def rendition_urls(name, storage=default_storage, request=None):
+    if not name:
+        return None
+
+    urls = {}
+    for width, rendition in rendition_names(name).items():
+        url = storage.url(rendition)
+        urls[f'{width}w'] = request.build_absolute_uri(url) if request else url
+    return urls
+
+
+def thumbnail_url(name, storage=default_storage, ready=False):
+    """
+    URL de la rendition más angosta, para miniaturas (p. ej. en el admin), o
+    del original mientras la fila no tenga ``renditions_ready``.
+    """
+    if not name:
+        return None
+    if not ready:
+        return storage.url(name)
+    return storage.url(rendition_name(name, min(get_rendition_widths())))
+
+
+class RenditionsField(serializers.ReadOnlyField):
+    """
+    Expone las renditions de un ImageField como mapa ``{'480w': url}``, o None
+    mientras la fila no tenga ``ready_field`` (lo marca el worker al
+    terminar): así no se consulta el almacenamiento por cada imagen.
+    """
+
+    def __init__(self, ready_field='renditions_ready', **kwargs):
+        self.ready_field = ready_field
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        return super().get_attribute(instance), getattr(instance, self.ready_field, False)
+
+    def to_representation(self, value):
+        value, ready = value
+        if not value or not ready:
+            return None
+
+        storage = getattr(value, 'storage', default_storage)
+        name = getattr(value, 'name', value)
+        return rendition_urls(name, storage, self.context.get('request'))
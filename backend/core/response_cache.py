@@ -0,0 +1,155 @@
+import hashlib
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control', 'Vary', 'Allow')
+
+
+def get_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def is_shared_cache():
+    """
+    Indica si las versiones guardadas en la caché las ven todos los procesos.
+    LocMemCache vive dentro de cada worker: un cambio solo invalidaría el suyo.
+    """
+    return settings.CACHE_SINGLE_PROCESS or not isinstance(get_cache(), LocMemCache)
+
+
+def _version_key(group):
+    return f'response-cache:version:{group}'
+
+
+def get_versions(groups):
+    cache = get_cache()
+    keys = [_version_key(group) for group in groups]
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            # Un token nuevo (no un contador) evita que, si la versión se
+            # pierde por desalojo, reaparezcan respuestas viejas con la misma clave.
+            cache.add(key, uuid.uuid4().hex, None)
+            versions[key] = cache.get(key)
+
+    return [versions[key] for key in keys]
+
+
+def invalidate_responses(*groups):
+    """Descarta las respuestas cacheadas de los grupos una vez confirmada la transacción."""
+
+    def bump():
+        get_cache().set_many({_version_key(group): uuid.uuid4().hex for group in groups}, None)
+
+    transaction.on_commit(bump)
+
+
+class ResponseCacheMixin:
+    """
+    Guarda el cuerpo ya renderizado de list/retrieve. La clave combina host,
+    ruta, query params normalizados, formato, estado de autenticación y la
+    versión de cada grupo de ``cache_groups``; las señales de los modelos
+    cambian esa versión con ``invalidate_responses``. Ante un fallo de caché
+    solo una petición regenera la respuesta y las demás la esperan. Con una
+    caché por proceso (ver ``is_shared_cache``) no se cachea nada.
+    """
+
+    cache_groups = ()
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, lambda: super(ResponseCacheMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, lambda: super(ResponseCacheMixin, self).retrieve(request, *args, **kwargs))
+
+    def get_response_cache_key(self, request):
+        query = sorted(
+            (param, sorted(values)) for param, values in request.GET.lists() if any(values)
+        )
+        parts = [
+            request.get_host(),
+            request.path,
+            repr(query),
+            request.accepted_media_type or '',
+            'auth' if request.user.is_authenticated else 'anon',
+            *get_versions(self.cache_groups),
+        ]
+        return 'response-cache:' + hashlib.md5('|'.join(parts).encode()).hexdigest()
+
+    def cached_response(self, request, render):
+        if not self.cache_groups or request.method != 'GET' or not is_shared_cache():
+            return render()
+
+        cache = get_cache()
+        key = self.get_response_cache_key(request)
+        entry = cache.get(key)
+
+        if entry is None:
+            lock_key = key + ':lock'
+            if cache.add(lock_key, 1, settings.RESPONSE_CACHE_LOCK_TIMEOUT):
+                self._response_cache = (key, lock_key)
+                return render()
+
+            entry = self._wait_for(cache, key, lock_key)
+            if entry is None:
+                return render()
+
+        return self._from_entry(request, entry)
+
+    def _wait_for(self, cache, key, lock_key):
+        # Si el candado se libera sin respuesta guardada (304, error, respuesta
+        # en streaming) no hay nada que esperar: se renderiza de inmediato.
+        deadline = time.monotonic() + settings.RESPONSE_CACHE_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            found = cache.get_many([key, lock_key])
+            if key in found:
+                return found[key]
+            if lock_key not in found:
+                return None
+        return None
+
+    def _from_entry(self, request, entry):
+        headers = entry['headers']
+        response = get_conditional_response(
+            request, etag=headers.get('ETag'), last_modified=entry['last_modified']
+        )
+        if response is None:
+            response = HttpResponse(entry['content'], content_type=entry['content_type'])
+
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        pending = getattr(self, '_response_cache', None)
+        if pending is None:
+            return response
+
+        key, lock_key = pending
+        cache = get_cache()
+        try:
+            if response.status_code == 200 and not response.streaming:
+                response.render()
+                cache.set(key, {
+                    'content': response.content,
+                    'content_type': response['Content-Type'],
+                    'headers': {header: response[header] for header in CACHED_HEADERS if response.has_header(header)},
+                    'last_modified': parse_http_date_safe(response.get('Last-Modified', '')),
+                }, settings.RESPONSE_CACHE_TIMEOUT)
+        finally:
+            cache.delete(lock_key)
+            self._response_cache = None
+
+        return response
@@ -41,6 +41,7 @@ PROJECT_APPS = [
     'apps.company',
     'apps.projects',
     'apps.users',
+    'apps.jobs',
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + PROJECT_APPS
@@ -120,11 +121,25 @@ if not DEBUG:
     STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 DATA_UPLOAD_MAX_MEMORY_SIZE = 104857600
-FILE_UPLOAD_MAX_MEMORY_SIZE = 104857600
+FILE_UPLOAD_MAX_MEMORY_SIZE = 5242880
+
+MEDIA_UPLOAD_THREADS = env.int('MEDIA_UPLOAD_THREADS', default=4)
+
+CHUNKED_UPLOAD_DIR = env('CHUNKED_UPLOAD_DIR', default=os.path.join(BASE_DIR, 'uploads_tmp'))
+CHUNKED_UPLOAD_CHUNK_SIZE = env.int('CHUNKED_UPLOAD_CHUNK_SIZE', default=5242880)
+CHUNKED_UPLOAD_SESSION_TTL = env.int('CHUNKED_UPLOAD_SESSION_TTL', default=86400)
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# '' sirve los archivos desde Django; 'x-accel-redirect' (nginx) o 'x-sendfile'
+# (apache/lighttpd) delegan el envío al proxy frontal.
+MEDIA_SENDFILE = env('MEDIA_SENDFILE', default='')
+MEDIA_ACCEL_REDIRECT_PREFIX = env('MEDIA_ACCEL_REDIRECT_PREFIX', default='/protected-media/')
+# Sin 'immutable': ``generate_renditions --force`` reescribe los mismos nombres,
+# así que pasado max-age el navegador revalida con el ETag.
+MEDIA_CACHE_CONTROL = env('MEDIA_CACHE_CONTROL', default='public, max-age=86400')
+
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly'
@@ -146,8 +161,55 @@ REST_FRAMEWORK = {
     ],
 
     'EXCEPTION_HANDLER': 'core.exceptions.custom_exception_handler',
+
+    # Cubetas del formulario de contacto (apps/contact/throttles.py): N
+    # mensajes seguidos y N repuestos por periodo.
+    'DEFAULT_THROTTLE_RATES': {
+        'contact_ip': env.str('CONTACT_RATE_IP', default='5/min'),
+        'contact_email': env.str('CONTACT_RATE_EMAIL', default='3/hour'),
+    },
+    # Proxies delante de Django; sin esto la IP se toma de REMOTE_ADDR.
+    'NUM_PROXIES': env.int('NUM_PROXIES', default=None),
 }
 
+# Segundos durante los que se rechaza un mensaje de contacto idéntico.
+CONTACT_DUPLICATE_WINDOW = env.int('CONTACT_DUPLICATE_WINDOW', default=600)
+
+# Usa orjson (si está instalado) para renderizar las respuestas JSON.
+JSON_FAST_ENCODER = env.bool('JSON_FAST_ENCODER', default=True)
+
+QUERY_BUDGET_ENFORCE = env.bool('QUERY_BUDGET_ENFORCE', default='test' in sys.argv)
+
+# locmemcache:// es por proceso: con varios workers usar filecache:///ruta
+# o dbcache://tabla (después de ``manage.py createcachetable``).
+CACHES = {'default': env.cache('CACHE_URL', default='locmemcache://')}
+
+# Con una caché por proceso la invalidación no llega a los demás workers, así
+# que la caché de respuestas se desactiva salvo que se declare que hay un solo
+# proceso (por defecto, con DEBUG: runserver).
+CACHE_SINGLE_PROCESS = env.bool('CACHE_SINGLE_PROCESS', default=DEBUG)
+
+RESPONSE_CACHE_ALIAS = env.str('RESPONSE_CACHE_ALIAS', default='default')
+RESPONSE_CACHE_TIMEOUT = env.int('RESPONSE_CACHE_TIMEOUT', default=3600)
+RESPONSE_CACHE_LOCK_TIMEOUT = env.int('RESPONSE_CACHE_LOCK_TIMEOUT', default=10)
+
+JOBS_EAGER = env.bool('JOBS_EAGER', default=False)
+JOBS_PROCESSES = env.int('JOBS_PROCESSES', default=1)
+JOBS_THREADS = env.int('JOBS_THREADS', default=4)
+# El worker renueva la concesión de sus jobs cada tercio de este plazo; un job
+# cuya concesión vence (worker caído) vuelve a la cola.
+JOBS_LEASE_SECONDS = env.int('JOBS_LEASE_SECONDS', default=300)
+
+# Avisos de contacto (apps/contact/outbox.py). Con CONTACT_EMAIL_DIGEST_SIZE
+# mayor que 1 se agrupan hasta ese número de leads por correo.
+CONTACT_EMAIL_BACKEND = env.str('CONTACT_EMAIL_BACKEND', default='') or None
+CONTACT_EMAIL_BATCH_SIZE = env.int('CONTACT_EMAIL_BATCH_SIZE', default=50)
+CONTACT_EMAIL_MAX_ATTEMPTS = env.int('CONTACT_EMAIL_MAX_ATTEMPTS', default=8)
+CONTACT_EMAIL_DIGEST_SIZE = env.int('CONTACT_EMAIL_DIGEST_SIZE', default=0)
+CONTACT_EMAIL_DIGEST_WAIT = env.int('CONTACT_EMAIL_DIGEST_WAIT', default=900)
+CONTACT_EMAIL_SENDING_TIMEOUT = env.int('CONTACT_EMAIL_SENDING_TIMEOUT', default=600)
+CONTACT_EMAIL_SWEEP_INTERVAL = env.int('CONTACT_EMAIL_SWEEP_INTERVAL', default=300)
+
 SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
@@ -190,6 +252,10 @@ SPECTACULAR_SETTINGS = {
     'COMPONENT_SPLIT_REQUEST': True,
 }
 
+# Con CONTACT_EMAIL_BACKEND=django.core.mail.backends.filebased.EmailBackend
+# los avisos se escriben en EMAIL_FILE_PATH en lugar de enviarse.
+EMAIL_FILE_PATH = env.str('EMAIL_FILE_PATH', default=str(BASE_DIR / 'sent_emails'))
+
 if DEBUG:
     EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 else:
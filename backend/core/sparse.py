@@ -0,0 +1,104 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.permissions import SAFE_METHODS
+
+
+def requested_fields(request, param):
+    """Lee ``?param=a,b`` (o repetido) como conjunto; None si no se envió."""
+    if request is None or param not in request.query_params:
+        return None
+    return {
+        name.strip()
+        for value in request.query_params.getlist(param)
+        for name in value.split(',')
+        if name.strip()
+    }
+
+
+class SparseFieldsSerializerMixin:
+    """
+    En lecturas acepta ``?fields=`` y ``?omit=`` para elegir campos, y deja
+    fuera los de ``Meta.expandable_fields`` salvo que se pidan con ``?expand=``.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS:
+            return fields
+
+        expand = requested_fields(request, 'expand') or set()
+        only = requested_fields(request, 'fields')
+        omit = requested_fields(request, 'omit') or set()
+
+        for name in list(fields):
+            if (
+                (name in getattr(self.Meta, 'expandable_fields', ()) and name not in expand)
+                or (only is not None and name not in only)
+                or name in omit
+            ):
+                fields.pop(name)
+
+        return fields
+
+
+class SparseQuerysetMixin:
+    """
+    Ajusta el queryset de lectura a los campos que quedaron en el serializer:
+    ``only()`` con las columnas que se usan, ``select_related`` solo para las
+    FK recorridas y ``prefetch_related`` solo para las relaciones expandidas.
+
+    Los campos sin columna propia (``source='*'``, anotaciones) deben figurar
+    en ``Meta.sparse_sources`` del serializer con las columnas que leen; si
+    falta alguno no se difiere nada para no provocar consultas por fila.
+    """
+
+    def get_queryset(self):
+        return self.sparse_queryset(super().get_queryset())
+
+    def get_sparse_fields(self):
+        if not hasattr(self, '_sparse_fields'):
+            self._sparse_fields = self.get_serializer().fields
+        return self._sparse_fields
+
+    def sparse_queryset(self, queryset):
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+
+        serializer_class = self.get_serializer_class()
+        declared = getattr(serializer_class.Meta, 'sparse_sources', {})
+        model = queryset.model
+        columns, related, prefetch = set(), set(), set()
+
+        for name, field in self.get_sparse_fields().items():
+            if field.write_only:
+                continue
+            if name in declared:
+                columns.update(declared[name])
+                continue
+            if not field.source_attrs:
+                return queryset
+
+            try:
+                model_field = model._meta.get_field(field.source_attrs[0])
+            except FieldDoesNotExist:
+                if field.source_attrs[0] in queryset.query.annotations:
+                    continue
+                return queryset
+
+            if model_field.one_to_many or model_field.many_to_many:
+                prefetch.add(model_field.name)
+            elif model_field.many_to_one and len(field.source_attrs) > 1:
+                related.add(model_field.name)
+                columns.update([model_field.name, '__'.join(field.source_attrs[:2])])
+            else:
+                columns.add(model_field.name)
+
+        # Las claves del cursor se leen de cada fila al paginar.
+        columns.update(name.lstrip('-') for name in getattr(self, 'cursor_ordering', ()))
+
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if related:
+            queryset = queryset.select_related(*related)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset.only(*columns)
@@ -0,0 +1,44 @@
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.response import Response
+
+from core.renderers import CustomJSONRenderer
+
+
+class StreamingListMixin:
+    """
+    Con ``no_page=true`` la lista se lee con ``iterator()`` por bloques y se
+    envía como StreamingHttpResponse, de modo que la memoria del worker no
+    crece con el número de filas. El sobre JSON es idéntico al habitual.
+    """
+
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        renderer = getattr(request, 'accepted_renderer', None)
+        if isinstance(renderer, CustomJSONRenderer) and renderer.can_stream(
+            request.accepted_media_type, self.get_renderer_context()
+        ):
+            return StreamingHttpResponse(
+                renderer.render_stream(self.iter_serialized_chunks(queryset)),
+                content_type=renderer.media_type,
+            )
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    def iter_serialized_chunks(self, queryset):
+        rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+        while True:
+            chunk = list(islice(rows, self.stream_chunk_size))
+            if not chunk:
+                return
+            yield self.get_serializer(chunk, many=True).data
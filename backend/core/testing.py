@@ -0,0 +1,51 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+def png_bytes(size=(2, 2), mode='RGBA'):
+    buffer = BytesIO()
+    Image.new(mode, size).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def png_file(name='imagen.png', **kwargs):
+    return SimpleUploadedFile(name, png_bytes(**kwargs), content_type='image/png')
+
+
+def create_admin(email='admin@briorsal.pe'):
+    return get_user_model().objects.create_superuser(
+        email, 'clave-segura', first_name='Admin', last_name='Brio'
+    )
+
+
+def api_client(user=None):
+    """
+    APIClient autenticado con un JWT de verdad (no ``force_authenticate``):
+    la consulta del usuario entra en el presupuesto como en producción.
+    """
+    client = APIClient()
+    if user is not None:
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+    return client
+
+
+class TemporaryMediaMixin:
+    """MEDIA_ROOT en un directorio temporal propio de la clase, borrado al terminar."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Antes de super(): setUpTestData ya guarda archivos.
+        cls.media_root = tempfile.mkdtemp()
+        media_settings = override_settings(MEDIA_ROOT=cls.media_root)
+        media_settings.enable()
+        cls.addClassCleanup(shutil.rmtree, cls.media_root, ignore_errors=True)
+        cls.addClassCleanup(media_settings.disable)
+        super().setUpClass()
@@ -0,0 +1,357 @@
+import datetime
+import os
+import threading
+import time
+import uuid
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from django.core.files.storage import FileSystemStorage
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from apps.company.models import ClientLogo, Service
+from apps.projects.models import Category, Project, ProjectImage
+
+from .media import serve_media
+from .renderers import CustomJSONRenderer, orjson
+from .renditions import generate_renditions, rendition_name
+from .response_cache import ResponseCacheMixin, get_cache, get_versions
+from .testing import TemporaryMediaMixin, api_client, png_file
+from .throttling import TokenBucketThrottle, admission_counters
+
+SERVICES_URL = '/api/company/services/'
+
+
+@override_settings(CACHE_SINGLE_PROCESS=True, RESPONSE_CACHE_LOCK_TIMEOUT=5)
+class ResponseCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = Service.objects.create(name='Estructuras', description='Cálculo estructural.')
+
+    def setUp(self):
+        get_cache().clear()
+        self.client = api_client()
+
+    def later(self, function, *args):
+        timer = threading.Timer(0.2, function, args)
+        timer.start()
+        self.addCleanup(timer.join)
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.client.get(SERVICES_URL)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(SERVICES_URL)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_saving_a_model_invalidates_its_group(self):
+        self.client.get(SERVICES_URL)
+        version = get_versions(['services'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Service.objects.create(name='Supervisión', description='Supervisión de obra.')
+
+        self.assertNotEqual(get_versions(['services']), version)
+        response = self.client.get(SERVICES_URL)
+        self.assertEqual([service['name'] for service in response.json()['data']], ['Supervisión', 'Estructuras'])
+
+    def test_evicted_version_gets_a_new_token(self):
+        version = get_versions(['services'])
+        get_cache().delete('response-cache:version:services')
+
+        # Un contador volvería a empezar en el mismo valor y resucitaría claves viejas.
+        self.assertNotEqual(get_versions(['services']), version)
+
+    @mock.patch.object(ResponseCacheMixin, 'get_response_cache_key', return_value='response-cache:test')
+    def test_waiter_uses_the_response_stored_by_the_lock_holder(self, get_key):
+        cache = get_cache()
+        cache.set('response-cache:test:lock', 1)
+        entry = {'content': b'{"results": []}', 'content_type': 'application/json', 'headers': {}, 'last_modified': None}
+        self.later(cache.set, 'response-cache:test', entry)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(SERVICES_URL)
+
+        self.assertEqual(response.content, b'{"results": []}')
+
+    @mock.patch.object(ResponseCacheMixin, 'get_response_cache_key', return_value='response-cache:test')
+    def test_waiter_renders_as_soon_as_the_lock_is_released_without_a_response(self, get_key):
+        get_cache().set('response-cache:test:lock', 1)
+        self.later(get_cache().delete, 'response-cache:test:lock')
+
+        started = time.monotonic()
+        response = self.client.get(SERVICES_URL)
+
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual([service['name'] for service in response.json()['data']], ['Estructuras'])
+
+    @mock.patch.object(ResponseCacheMixin, 'get_response_cache_key', return_value='response-cache:test')
+    def test_lock_holder_releases_the_lock_without_caching_errors(self, get_key):
+        response = self.client.get(f'{SERVICES_URL}{self.service.pk + 100}/')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(get_cache().get_many(['response-cache:test', 'response-cache:test:lock']), {})
+
+
+@override_settings(CACHE_SINGLE_PROCESS=False, IMAGE_RENDITION_WIDTHS=(160, 480))
+class RenditionTests(TemporaryMediaMixin, TestCase):
+
+    def test_rendition_names_keep_the_original_extension(self):
+        self.assertEqual(rendition_name('projects/foo.jpg', 480), 'projects/renditions/foo.jpg__480w.webp')
+        self.assertNotEqual(rendition_name('projects/foo.jpg', 480), rendition_name('projects/foo.png', 480))
+
+    def test_renditions_are_served_from_the_row_flag(self):
+        logo = ClientLogo.objects.create(name='Cliente', image=png_file('logo.png'))
+        url = f'/api/company/clients/{logo.pk}/'
+        self.assertIsNone(api_client().get(url).data['image_renditions'])
+
+        generate_renditions(logo.image.name)
+        logo.refresh_from_db()
+        self.assertTrue(logo.renditions_ready)
+
+        # Serializar no consulta el almacenamiento: basta con la marca de la fila.
+        with mock.patch.object(FileSystemStorage, 'exists', side_effect=AssertionError):
+            response = api_client().get(url)
+        self.assertEqual(list(response.data['image_renditions']), ['160w', '480w'])
+        self.assertTrue(response.data['image_renditions']['160w'].endswith('logo.png__160w.webp'))
+
+    def test_replacing_the_image_clears_the_flag(self):
+        logo = ClientLogo.objects.create(name='Cliente', image=png_file('logo.png'))
+        generate_renditions(logo.image.name)
+        logo.refresh_from_db()
+
+        logo.image = png_file('nuevo.png')
+        logo.save()
+
+        logo.refresh_from_db()
+        self.assertFalse(logo.renditions_ready)
+
+    def test_project_cover_renditions_follow_the_cover_image(self):
+        project = Project.objects.create(name='Edificio', category=Category.objects.create(name='Vivienda'), location='Lima')
+        image = ProjectImage.objects.create(project=project, image=png_file('portada.png'))
+
+        generate_renditions(image.image.name)
+
+        with mock.patch.object(FileSystemStorage, 'exists', side_effect=AssertionError):
+            response = api_client().get('/api/projects/')
+        self.assertEqual(list(response.data['results'][0]['cover_image_renditions']), ['160w', '480w'])
+
+
+@override_settings(MEDIA_SENDFILE='', MEDIA_CACHE_CONTROL='public, max-age=60')
+class MediaServingTests(TemporaryMediaMixin, SimpleTestCase):
+    content = bytes(range(100))
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        os.makedirs(os.path.join(cls.media_root, 'docs'))
+        cls.full_path = os.path.join(cls.media_root, 'docs', 'plano.bin')
+        with open(cls.full_path, 'wb') as file:
+            file.write(cls.content)
+
+    def get(self, method='get', **headers):
+        request = getattr(RequestFactory(), method)('/media/docs/plano.bin', headers=headers)
+        response = serve_media(request, 'docs/plano.bin')
+        self.addCleanup(response.close)
+        return response
+
+    def body(self, response):
+        return b''.join(response.streaming_content) if response.streaming else response.content
+
+    def test_without_range_serves_the_whole_file(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), self.content)
+        self.assertEqual((response['Content-Length'], response['Accept-Ranges']), ('100', 'bytes'))
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+
+    def test_single_range(self):
+        for header, start, end in (('bytes=10-19', 10, 19), ('bytes=90-', 90, 99), ('bytes=95-500', 95, 99)):
+            with self.subTest(header=header):
+                response = self.get(range=header)
+
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(response['Content-Range'], f'bytes {start}-{end}/100')
+                self.assertEqual(response['Content-Length'], str(end - start + 1))
+                self.assertEqual(self.body(response), self.content[start:end + 1])
+
+    def test_suffix_range(self):
+        response = self.get(range='bytes=-5')
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 95-99/100')
+        self.assertEqual(self.body(response), self.content[-5:])
+
+    def test_unsatisfiable_range(self):
+        for header in ('bytes=100-', 'bytes=50-10', 'bytes=-0'):
+            with self.subTest(header=header):
+                response = self.get(range=header)
+
+                self.assertEqual(response.status_code, 416)
+                self.assertEqual(response['Content-Range'], 'bytes */100')
+                self.assertEqual(response['Cache-Control'], 'no-store')
+
+    def test_malformed_range_is_ignored(self):
+        response = self.get(range='bytes=1-2,5-6')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), self.content)
+
+    def test_if_range(self):
+        etag = self.get()['ETag']
+
+        matching = self.get(range='bytes=0-9', if_range=etag)
+        self.assertEqual((matching.status_code, self.body(matching)), (206, self.content[:10]))
+
+        # El archivo cambió desde que el cliente guardó el fragmento: se envía completo.
+        stale = self.get(range='bytes=0-9', if_range='"otro"')
+        self.assertEqual((stale.status_code, self.body(stale)), (200, self.content))
+        self.assertNotIn('Content-Range', stale)
+
+    def test_head_range_has_no_body(self):
+        response = self.get('head', range='bytes=10-19')
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual((response['Content-Length'], response.content), ('10', b''))
+
+    def test_conditional_get(self):
+        etag = self.get()['ETag']
+
+        response = self.get(if_none_match=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_missing_files_and_traversal_are_not_found(self):
+        for path in ('docs/otro.bin', 'docs', '../secreto.txt'):
+            with self.subTest(path=path), self.assertRaises(Http404):
+                serve_media(RequestFactory().get(f'/media/{path}'), path)
+
+    @override_settings(MEDIA_SENDFILE='x-accel-redirect', MEDIA_ACCEL_REDIRECT_PREFIX='/protected-media/')
+    def test_x_accel_redirect_leaves_the_file_to_the_proxy(self):
+        response = self.get(range='bytes=0-9')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/docs/plano.bin')
+        self.assertEqual(response.content, b'')
+        self.assertNotIn('Content-Range', response)
+        self.assertIn('ETag', response)
+
+    @override_settings(MEDIA_SENDFILE='x-sendfile')
+    def test_x_sendfile_leaves_the_file_to_the_proxy(self):
+        response = self.get()
+
+        self.assertEqual(response['X-Sendfile'], self.full_path)
+        self.assertEqual(response.content, b'')
+
+
+@skipUnless(orjson, 'orjson no está instalado.')
+@override_settings(JSON_FAST_ENCODER=True)
+class RendererTests(SimpleTestCase):
+    data = {
+        'aware': datetime.datetime(2026, 3, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone(datetime.timedelta(hours=-5))),
+        'utc': datetime.datetime(2026, 3, 1, 14, 30, tzinfo=datetime.timezone.utc),
+        'naive': datetime.datetime(2026, 3, 1, 9, 30, 15, 500),
+        'date': datetime.date(2026, 3, 1),
+        'time': datetime.time(9, 30, 15, 250000),
+        'decimal': Decimal('1234.50'),
+        'lazy': gettext_lazy('Edificación'),
+        'separators': 'línea\u2028párrafo\u2029fin',
+        'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'nested': [{'float': 1.5, 'none': None, 'bool': True, 'int': 2 ** 40}],
+        3: 'clave numérica',
+    }
+
+    def render(self, data, fast=True):
+        with self.settings(JSON_FAST_ENCODER=fast):
+            return CustomJSONRenderer().render(data)
+
+    def test_fast_encoder_matches_json_renderer(self):
+        renderer = CustomJSONRenderer()
+        self.assertTrue(renderer.use_fast_encoder())
+
+        self.assertEqual(renderer.fast_dumps(self.data), JSONRenderer().render(self.data))
+        self.assertEqual(self.render(self.data), self.render(self.data, fast=False))
+        self.assertIn(b'\\u2028', renderer.fast_dumps(self.data))
+
+    def test_unsupported_values_fall_back_to_json(self):
+        data = {'huge': 2 ** 70}
+
+        self.assertEqual(self.render(data), self.render(data, fast=False))
+
+    def test_non_finite_numbers_raise_in_strict_mode(self):
+        for value in (float('nan'), float('inf'), -float('inf'), Decimal('NaN')):
+            with self.subTest(value=value):
+                # orjson los escribiría como null: JSONRenderer los rechaza.
+                with self.assertRaises(ValueError):
+                    self.render({'nested': [{'area': value}]})
+                with self.assertRaises(ValueError):
+                    CustomJSONRenderer().dumps([{'area': value}])
+
+    def test_non_finite_numbers_follow_json_when_not_strict(self):
+        class LenientRenderer(CustomJSONRenderer):
+            strict = False
+
+        class LenientJSONRenderer(JSONRenderer):
+            strict = False
+
+        data = [{'area': float('nan'), 'limit': float('inf')}]
+
+        self.assertEqual(LenientRenderer().dumps(data), LenientJSONRenderer().render(data))
+        self.assertEqual(LenientRenderer().dumps(data), b'[{"area":NaN,"limit":Infinity}]')
+
+
+class TokenBucketThrottleTests(SimpleTestCase):
+
+    class BucketThrottle(TokenBucketThrottle):
+        scope = 'test_bucket'
+        rate = '3/min'
+
+        def get_cache_key(self, request, view):
+            return self.cache_format % {'scope': self.scope, 'ident': 'cliente'}
+
+    def setUp(self):
+        TokenBucketThrottle.cache.clear()
+        self.now = 1000.0
+
+    def allow(self):
+        throttle = self.BucketThrottle()
+        throttle.timer = lambda: self.now
+        return throttle.allow_request(RequestFactory().post('/'), None), throttle
+
+    def test_burst_up_to_the_rate_then_reject(self):
+        self.assertEqual([self.allow()[0] for _ in range(3)], [True, True, True])
+
+        allowed, throttle = self.allow()
+
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(throttle.wait(), 20)
+        self.assertEqual(admission_counters(['test_bucket']), {'test_bucket': {'rejected': 1}})
+
+    def test_tokens_refill_at_the_rate(self):
+        for _ in range(3):
+            self.allow()
+
+        self.now += 10
+        allowed, throttle = self.allow()
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(throttle.wait(), 10)
+
+        # Una ficha cada 20 s.
+        self.now += 10
+        self.assertEqual([self.allow()[0] for _ in range(2)], [True, False])
+
+    def test_refill_is_capped_at_the_burst_size(self):
+        self.allow()
+
+        self.now += 3600
+        self.assertEqual([self.allow()[0] for _ in range(4)], [True, True, True, False])
@@ -0,0 +1,59 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+
+def record_admission(scope, outcome):
+    """Suma 1 al contador compartido ``admission:<scope>:<outcome>``."""
+    cache = SimpleRateThrottle.cache
+    key = f'admission:{scope}:{outcome}'
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Desalojado entre add e incr.
+        cache.set(key, 1, None)
+
+
+def admission_counters(scopes, outcomes=('rejected',)):
+    keys = {f'admission:{scope}:{outcome}': (scope, outcome) for scope in scopes for outcome in outcomes}
+    values = SimpleRateThrottle.cache.get_many(list(keys))
+    counters = {scope: {} for scope in scopes}
+    for key, (scope, outcome) in keys.items():
+        counters[scope][outcome] = values.get(key, 0)
+    return counters
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Cubeta de fichas: con la tasa ``N/periodo`` del scope se aceptan ráfagas
+    de hasta N peticiones y se reponen N fichas por periodo. El estado vive
+    en la caché para que lo compartan todos los procesos; la caché de Django
+    no ofrece compare-and-set, así que dos peticiones simultáneas pueden
+    gastar la misma ficha, lo que no cambia nada frente a un flood.
+    """
+
+    cache_format = 'throttle:bucket:%(scope)s:%(ident)s'
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        refill_rate = self.num_requests / self.duration
+        tokens, updated = self.cache.get(self.key, (self.num_requests, now))
+        tokens = min(self.num_requests, tokens + (now - updated) * refill_rate)
+
+        if tokens < 1:
+            self.wait_seconds = (1 - tokens) / refill_rate
+            record_admission(self.scope, 'rejected')
+            return False
+
+        # Pasado ``duration`` la cubeta estaría llena otra vez: no hace falta guardarla más.
+        self.cache.set(self.key, (tokens - 1, now), self.duration)
+        return True
+
+    def wait(self):
+        return self.wait_seconds
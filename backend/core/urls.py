@@ -2,9 +2,11 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path, re_path
-from django.views.static import serve
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from apps.company.views import BootstrapView
+from core.media import serve_media
+
 admin.site.site_header = 'Administración Briorsal'
 admin.site.site_title = 'Portal Briorsal'
 admin.site.index_title = 'Bienvenido al Panel de Control'
@@ -18,6 +20,7 @@ urlpatterns = [
     path('api/', include('apps.projects.urls')),
     path('api/company/', include('apps.company.urls')),
     path('api/contact/', include('apps.contact.urls')),
+    path('api/bootstrap/', BootstrapView.as_view(), name='bootstrap'),
 
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
@@ -28,5 +31,5 @@ if settings.DEBUG:
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 else:
     urlpatterns += [
-        re_path(r"^media/(?P<path>.*)$", serve, {"document_root": settings.MEDIA_ROOT}),
+        re_path(r"^media/(?P<path>.*)$", serve_media),
     ]
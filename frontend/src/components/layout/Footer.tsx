@@ -10,11 +10,11 @@ import {
     FaWhatsapp,
 } from 'react-icons/fa';
 
-import { useGetCompanyInfoQuery } from '@/features/company/api/companyApi';
+import { useGetBootstrapQuery } from '@/features/company/api/companyApi';
 
 const Footer = () => {
-    const { data: response } = useGetCompanyInfoQuery();
-    const companyInfo = response?.data;
+    const { data: response } = useGetBootstrapQuery();
+    const companyInfo = response?.data.company_info;
 
     const socialLinks = [
         { url: companyInfo?.whatsapp, icon: <FaWhatsapp /> },
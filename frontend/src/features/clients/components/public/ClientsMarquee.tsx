@@ -1,12 +1,10 @@
 import React from 'react';
-import { useGetClientsQuery } from '@/features/clients/api/clientsApi';
+import { useGetBootstrapQuery } from '@/features/company/api/companyApi';
 
 const ClientsMarquee: React.FC = () => {
-    const { data: response, isLoading } = useGetClientsQuery({
-        no_page: true,
-    });
+    const { data: response, isLoading } = useGetBootstrapQuery();
 
-    const clients = response?.data || [];
+    const clients = response?.data.clients || [];
 
     if (isLoading || clients.length === 0) return null;
 
@@ -1,8 +1,24 @@
 import { apiSlice } from '@/store/api/apiSlice';
-import { CompanyInfo, CompanyResponse, AboutUsResponse } from '../types';
+import { CompanyInfo, CompanyResponse, AboutUsResponse, BootstrapResponse } from '../types';
 
 export const companyApi = apiSlice.injectEndpoints({
     endpoints: (builder) => ({
+        getBootstrap: builder.query<BootstrapResponse, void>({
+            query: () => 'bootstrap/',
+            providesTags: ['Company', 'Projects', 'Services', 'Clients', 'Categories'],
+            async onQueryStarted(_arg, { dispatch, queryFulfilled }) {
+                try {
+                    const { data: response } = await queryFulfilled;
+                    const { company_info, about_us } = response.data;
+
+                    dispatch(companyApi.util.upsertQueryData('getCompanyInfo', undefined, { ...response, data: company_info }));
+                    dispatch(companyApi.util.upsertQueryData('getAboutUs', undefined, { ...response, data: about_us }));
+                } catch {
+                    // El error ya lo maneja quien consume la consulta.
+                }
+            },
+        }),
+
         getCompanyInfo: builder.query<CompanyResponse, void>({
             query: () => 'company/info/',
             providesTags: ['Company'],
@@ -35,6 +51,7 @@ export const companyApi = apiSlice.injectEndpoints({
 });
 
 export const {
+    useGetBootstrapQuery,
     useGetCompanyInfoQuery,
     useUpdateCompanyInfoMutation,
     useGetAboutUsQuery,
@@ -1,3 +1,8 @@
+import { Category } from '@/features/categories/types';
+import { Client } from '@/features/clients/types';
+import { ProjectListItem } from '@/features/projects/types';
+import { Service } from '@/features/services/types';
+
 export interface CompanyInfo {
     id: number;
     phone: string;
@@ -35,4 +40,25 @@ export interface AboutUsResponse {
     message: string;
     data: AboutUs;
     meta: any;
-}
\ No newline at end of file
+}
+
+export interface Bootstrap {
+    company_info: CompanyInfo;
+    about_us: AboutUs;
+    featured_projects: ProjectListItem[];
+    services: Service[];
+    clients: Client[];
+    categories: Category[];
+    stats: {
+        projects: number;
+        clients: number;
+    };
+}
+
+export interface BootstrapResponse {
+    status: string;
+    code: number;
+    message: string;
+    data: Bootstrap;
+    meta: any;
+}
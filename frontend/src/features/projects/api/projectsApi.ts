@@ -1,10 +1,10 @@
 import { apiSlice } from '@store/api/apiSlice';
 import { ApiResponse } from '@/types/api';
-import { Project, ProjectImage, ProjectVideo, GetProjectsArgs, CreateProjectRequest, UpdateProjectRequest } from '../types';
+import { Project, ProjectListItem, ProjectImage, ProjectVideo, GetProjectsArgs, GetProjectFacetsArgs, ProjectFacets, CreateProjectRequest, UpdateProjectRequest } from '../types';
 
 export const projectsApi = apiSlice.injectEndpoints({
     endpoints: (builder) => ({
-        getProjects: builder.query<ApiResponse<Project[]>, GetProjectsArgs>({
+        getProjects: builder.query<ApiResponse<ProjectListItem[]>, GetProjectsArgs>({
             query: ({ page = 1, pageSize = 10, search, category, status, is_featured, no_page }) => {
                 const params = new URLSearchParams();
 
@@ -25,8 +25,22 @@ export const projectsApi = apiSlice.injectEndpoints({
             providesTags: ['Projects'],
         }),
 
+        getProjectFacets: builder.query<ApiResponse<ProjectFacets>, GetProjectFacetsArgs>({
+            query: ({ search, category, status, is_featured }) => {
+                const params = new URLSearchParams();
+
+                if (search) params.append('search', search);
+                if (category) params.append('category', category);
+                if (status) params.append('status', status);
+                if (is_featured) params.append('is_featured', is_featured.toString());
+
+                return `projects/facets/?${params.toString()}`;
+            },
+            providesTags: ['Projects'],
+        }),
+
         getProjectBySlug: builder.query<Project, string>({
-            query: (slug) => `projects/${slug}/`,
+            query: (slug) => `projects/${slug}/?expand=images,videos`,
             transformResponse: (response: ApiResponse<Project>) =>
                 response.data,
             providesTags: (_result, _err, slug) => [
@@ -109,6 +123,7 @@ export const projectsApi = apiSlice.injectEndpoints({
 
 export const {
     useGetProjectsQuery,
+    useGetProjectFacetsQuery,
     useGetProjectBySlugQuery,
     useCreateProjectMutation,
     useUpdateProjectMutation,
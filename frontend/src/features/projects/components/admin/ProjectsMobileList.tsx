@@ -8,10 +8,10 @@ import {
     FaSpinner,
     FaCalendarAlt,
 } from 'react-icons/fa';
-import { Project } from '@features/projects/types';
+import { ProjectListItem } from '@features/projects/types';
 
 interface ProjectsMobileListProps {
-    projects: Project[];
+    projects: ProjectListItem[];
     isLoading: boolean;
     onEdit: (slug: string) => void;
     onDelete: (slug: string) => void;
@@ -46,9 +46,9 @@ export const ProjectsMobileList: React.FC<ProjectsMobileListProps> = ({
                     >
                         {/* 1. HEADER: IMAGEN Y ESTADO */}
                         <div className="relative h-48 bg-slate-100 w-full">
-                            {project.images && project.images.length > 0 ? (
+                            {project.cover_image ? (
                                 <img
-                                    src={project.images[0].image}
+                                    src={project.cover_image}
                                     alt={project.name}
                                     className="w-full h-full object-cover"
                                 />
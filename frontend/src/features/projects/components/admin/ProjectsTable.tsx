@@ -8,10 +8,10 @@ import {
     FaCalendarAlt,
     FaLayerGroup,
 } from 'react-icons/fa';
-import { Project } from '@features/projects/types';
+import { ProjectListItem } from '@features/projects/types';
 
 interface ProjectsTableProps {
-    projects: Project[];
+    projects: ProjectListItem[];
     isLoading: boolean;
     onEdit: (slug: string) => void;
     onDelete: (slug: string) => void;
@@ -91,11 +91,13 @@ export const ProjectsTable: React.FC<ProjectsTableProps> = ({
                                         <div
                                             className={`relative inline-block h-12 w-16 rounded-lg overflow-hidden border bg-slate-100 shadow-sm ${project.is_featured ? 'border-orange-400 ring-1 ring-orange-100' : 'border-slate-200'}`}
                                         >
-                                            {project.images &&
-                                            project.images.length > 0 ? (
+                                            {project.cover_image ? (
                                                 <img
                                                     src={
-                                                        project.images[0].image
+                                                        project
+                                                            .cover_image_renditions?.[
+                                                            '160w'
+                                                        ] ?? project.cover_image
                                                     }
                                                     alt={project.name}
                                                     className="w-full h-full object-cover"
@@ -6,10 +6,10 @@ import {
     FaArrowRight,
     FaImage,
 } from 'react-icons/fa';
-import { Project } from '@/features/projects/types';
+import { ProjectListItem } from '@/features/projects/types';
 
-export const ProjectCard: React.FC<{ project: Project }> = ({ project }) => {
-    const hasImage = project.images.length > 0;
+export const ProjectCard: React.FC<{ project: ProjectListItem }> = ({ project }) => {
+    const hasImage = Boolean(project.cover_image);
 
     return (
         <Link
@@ -21,7 +21,7 @@ export const ProjectCard: React.FC<{ project: Project }> = ({ project }) => {
                     <div
                         className="w-full h-full bg-cover bg-center"
                         style={{
-                            backgroundImage: `url(${project.images[0].image})`,
+                            backgroundImage: `url(${project.cover_image_renditions?.['960w'] ?? project.cover_image})`,
                         }}
                     />
                 ) : (
@@ -1,6 +1,9 @@
+export type ImageRenditions = Record<string, string>;
+
 export interface ProjectImage {
     id: number;
     image: string;
+    image_renditions: ImageRenditions | null;
 }
 
 export interface ProjectVideo {
@@ -29,6 +32,21 @@ export interface Project {
     updated_at: string;
 }
 
+export interface ProjectListItem {
+    id: number;
+    slug: string;
+    name: string;
+    category: number;
+    category_name?: string;
+    location: string;
+    area: string | null;
+    year: number | null;
+    status: 'en_proceso' | 'entregado';
+    is_featured: boolean;
+    cover_image: string | null;
+    cover_image_renditions: ImageRenditions | null;
+}
+
 export interface GetProjectsArgs {
     page?: number;
     pageSize?: number;
@@ -39,5 +57,15 @@ export interface GetProjectsArgs {
     no_page?: boolean;
 }
 
+export interface ProjectFacetOption {
+    value: string;
+    label: string;
+    count: number;
+}
+
+export type ProjectFacets = Record<'category' | 'status' | 'service_type' | 'is_featured' | 'year', ProjectFacetOption[]>;
+
+export type GetProjectFacetsArgs = Omit<GetProjectsArgs, 'page' | 'pageSize' | 'no_page'>;
+
 export type CreateProjectRequest = FormData;
 export type UpdateProjectRequest = { slug: string; data: FormData };
\ No newline at end of file
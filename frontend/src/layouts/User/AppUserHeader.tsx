@@ -5,7 +5,7 @@ import { toggleMobileSidebar } from '@store/slices/uiSlice';
 import { items } from './menuData';
 import logoBriorsal from '@assets/logo.png';
 
-import { useGetCompanyInfoQuery } from '@/features/company/api/companyApi';
+import { useGetBootstrapQuery } from '@/features/company/api/companyApi';
 
 import {
     FaFacebookF,
@@ -20,8 +20,8 @@ const AppUserHeader: React.FC = () => {
     const dispatch = useAppDispatch();
     const location = useLocation();
 
-    const { data: response } = useGetCompanyInfoQuery();
-    const companyInfo = response?.data;
+    const { data: response } = useGetBootstrapQuery();
+    const companyInfo = response?.data.company_info;
 
     const socialLinks = [
         { url: companyInfo?.whatsapp, icon: <FaWhatsapp size={19} /> },
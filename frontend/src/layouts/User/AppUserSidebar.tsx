@@ -13,15 +13,15 @@ import {
 import { items } from './menuData';
 import logoBriorsal from '@assets/logo.png';
 
-import { useGetCompanyInfoQuery } from '@/features/company/api/companyApi';
+import { useGetBootstrapQuery } from '@/features/company/api/companyApi';
 
 const AppUserSidebar: React.FC = () => {
     const dispatch = useAppDispatch();
     const location = useLocation();
     const isMobileOpen = useAppSelector((state) => state.ui.isMobileOpen);
 
-    const { data: response } = useGetCompanyInfoQuery();
-    const companyInfo = response?.data;
+    const { data: response } = useGetBootstrapQuery();
+    const companyInfo = response?.data.company_info;
 
     const handleClose = () => dispatch(toggleMobileSidebar());
 
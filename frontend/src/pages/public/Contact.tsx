@@ -96,7 +96,12 @@ const Contact = () => {
             });
         } catch (error) {
             console.error(error);
-            toast.error('Error al enviar el mensaje.');
+            const status = (error as { status?: number }).status;
+            toast.error(
+                status === 429
+                    ? 'Ya recibimos tu mensaje o enviaste demasiados seguidos. Intenta de nuevo más tarde.'
+                    : 'Error al enviar el mensaje.'
+            );
         }
     };
 
@@ -1,11 +1,11 @@
 import { Link } from 'react-router-dom';
 import { FaPaperPlane, FaWhatsapp } from 'react-icons/fa6';
 import FadeIn from '@/components/common/FadeIn';
-import { useGetCompanyInfoQuery } from '@/features/company/api/companyApi';
+import { useGetBootstrapQuery } from '@/features/company/api/companyApi';
 
 export const HomeCTA = () => {
-    const { data } = useGetCompanyInfoQuery();
-    const companyInfo = data?.data;
+    const { data } = useGetBootstrapQuery();
+    const companyInfo = data?.data.company_info;
 
     return (
         <section className="py-24 bg-slate-900 relative overflow-hidden">
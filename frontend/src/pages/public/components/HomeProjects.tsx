@@ -1,6 +1,6 @@
 import { Link } from 'react-router-dom';
 import { FaArrowRight, FaBuilding, FaLocationDot } from 'react-icons/fa6';
-import { useGetProjectsQuery } from '@/features/projects/api/projectsApi';
+import { useGetBootstrapQuery } from '@/features/company/api/companyApi';
 import FadeIn from '@/components/common/FadeIn';
 
 const ProjectCard = ({
@@ -18,9 +18,9 @@ const ProjectCard = ({
                 to={`/proyectos/${project.slug}`}
                 className={`group relative block w-full h-full overflow-hidden rounded-3xl bg-slate-900 shadow-xl ${isLarge ? 'aspect-[16/9] md:aspect-[21/9]' : 'aspect-[4/5] md:aspect-[4/3]'}`}
             >
-                {project.images.length > 0 ? (
+                {project.cover_image ? (
                     <img
-                        src={project.images[0].image}
+                        src={project.cover_image}
                         alt={project.name}
                         className="absolute inset-0 w-full h-full object-cover transition-transform duration-700 group-hover:scale-105 opacity-90 group-hover:opacity-100"
                         loading="lazy"
@@ -40,7 +40,7 @@ const ProjectCard = ({
                         <span
                             className={`inline-block mb-3 font-bold text-white bg-orange-600 rounded-full shadow-lg shadow-orange-600/20 ${isLarge ? 'px-4 py-1.5 text-sm' : 'px-3 py-1 text-xs'}`}
                         >
-                            {project.category?.name || 'Proyecto'}
+                            {project.category_name || 'Proyecto'}
                         </span>
 
                         <h3
@@ -72,14 +72,9 @@ const ProjectCard = ({
 };
 
 export const HomeProjects = () => {
-    const { data, isLoading } = useGetProjectsQuery({
-        page: 1,
-        pageSize: 7,
-        no_page: true,
-        is_featured: true,
-    });
+    const { data, isLoading } = useGetBootstrapQuery();
 
-    const projects = data?.data || [];
+    const projects = data?.data.featured_projects || [];
 
     const heroProject = projects[0];
     const gridProjects = projects.slice(1);
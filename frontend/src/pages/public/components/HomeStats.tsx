@@ -1,5 +1,4 @@
-import { useGetProjectsQuery } from '@/features/projects/api/projectsApi';
-import { useGetClientsQuery } from '@/features/clients/api/clientsApi';
+import { useGetBootstrapQuery } from '@/features/company/api/companyApi';
 
 const FOUNDING_YEAR = 2017;
 
@@ -16,11 +15,10 @@ const StatItem = ({ number, label, suffix = '' }: any) => (
 );
 
 export const HomeStats = () => {
-    const { data: projectsData } = useGetProjectsQuery({ pageSize: 1 });
-    const { data: clientsData } = useGetClientsQuery({ pageSize: 1 });
+    const { data } = useGetBootstrapQuery();
 
-    const totalProjects = projectsData?.meta?.total_records || 0;
-    const totalClients = clientsData?.meta?.total_records || 0;
+    const totalProjects = data?.data.stats.projects || 0;
+    const totalClients = data?.data.stats.clients || 0;
     const experienceYears = new Date().getFullYear() - FOUNDING_YEAR;
 
     return (
@@ -9,13 +9,13 @@ import {
     FaHouse,
 } from 'react-icons/fa6';
 
-import { useGetProjectsQuery } from '@/features/projects/api/projectsApi';
+import { useGetProjectFacetsQuery, useGetProjectsQuery } from '@/features/projects/api/projectsApi';
 import { useGetCategoriesQuery } from '@/features/categories/api/categoriesApi';
 
 import PageMeta from '@/components/common/PageMeta';
 import FadeIn from '@/components/common/FadeIn';
 import { CustomSelect } from '@/components/ui/CustomSelect';
-import { Project } from '@/features/projects/types';
+import { ProjectListItem } from '@/features/projects/types';
 
 import heroBgImg from '@/assets/projects/hero.png';
 
@@ -23,13 +23,10 @@ const PortfolioCard = ({
     project,
     delay,
 }: {
-    project: Project;
+    project: ProjectListItem;
     delay: number;
 }) => {
-    const mainImage =
-        project.images && project.images.length > 0
-            ? project.images[0].image
-            : null;
+    const mainImage = project.cover_image;
 
     return (
         <FadeIn delay={delay} direction="up">
@@ -87,11 +84,19 @@ const ProjectsPage = () => {
     const { data: categoriesResponse } = useGetCategoriesQuery({
         no_page: true,
     });
+    const { data: facetsResponse } = useGetProjectFacetsQuery({
+        category: selectedCategory,
+        search,
+    });
+    const categoryCounts = Object.fromEntries(
+        (facetsResponse?.data.category || []).map((option) => [option.value, option.count])
+    );
+
     const categoryOptions = [
         { value: '', label: 'Todas las Categorías' },
         ...(categoriesResponse?.data || []).map((cat: any) => ({
             value: cat.id,
-            label: cat.name,
+            label: facetsResponse ? `${cat.name} (${categoryCounts[String(cat.id)] ?? 0})` : cat.name,
         })),
     ];
 